@@ -9,82 +9,105 @@ import re
 from typing import Optional, Union
 
 from dbterd.constants import TEST_META_RELATIONSHIP_TYPE
-from dbterd.core.adapters.algo import BaseAlgoAdapter
+from dbterd.core.adapters.algo import TABLE_MANIFEST_SECTIONS, TABLE_NODE_TYPES, BaseAlgoAdapter
+from dbterd.core.manifest_index import manifest_indexes
 from dbterd.core.models import Ref, Table
 from dbterd.core.registry.decorators import register_algo
 from dbterd.helpers.log import logger
 from dbterd.types import Catalog, Manifest
 
 
-def _resolve_ref_to_node_id(to_str: str, manifest_nodes: dict) -> Optional[str]:
-    """Resolve an unrendered ``ref(...)`` constraint.to to a manifest node unique ID.
+REF_PATTERN = re.compile(r"""ref\(\s*['"]([^'"]+)['"]\s*(?:,\s*['"]([^'"]+)['"]\s*)?\)""")
 
-    dbt does not always render the contract foreign-key ``to`` down to a relation
-    name — a manifest produced by ``dbt parse``/``compile`` (rather than a full
-    ``build`` against a live target) keeps it as the literal ``ref('...')``
-    expression. This resolves those by matching the referenced model name.
 
-    Supports:
-        - ``ref('model_name')`` / ``ref("model_name")``
-        - ``ref('package', 'model_name')`` / ``ref("package", "model_name")``
+class NodeResolver:
+    """One-time index resolving a contract foreign-key ``to`` to a manifest node unique ID.
 
-    Args:
-        to_str: The constraint.to string (a ``ref(...)`` expression)
-        manifest_nodes: Dict of manifest node IDs to node objects
+    dbt may emit ``to`` in two shapes:
 
-    Returns:
-        Matching node unique ID, or None if it is not a ref or no model matches.
+    - A fully qualified relation name (``<database>.<schema>.<table_name>``, e.g.
+      ``"shaman.dummy.locations"``), matched against each node's ``relation_name``.
+      This is what a built/rendered manifest carries. Models take priority over any
+      other resource type sharing the same relation name.
+    - An unrendered ``ref(...)`` expression (e.g. ``"ref('locations')"``), which a
+      manifest produced by ``dbt parse``/``compile`` (rather than a full ``build``
+      against a live target) carries. Those are matched by model name, preferring
+      the referenced package when one is given.
 
+    Both lookups are hash-based, so the index is built once per manifest and then
+    reused for every constraint.
     """
-    if not to_str:
-        return None
 
-    match = re.match(r"""ref\(\s*['"]([^'"]+)['"]\s*(?:,\s*['"]([^'"]+)['"]\s*)?\)""", to_str)
-    if not match:
-        return None
+    def __init__(self, manifest_nodes: dict) -> None:
+        """Index the manifest nodes by relation name and by (package, model name).
 
-    first_arg, second_arg = match.group(1), match.group(2)
-    model_name = second_arg if second_arg else first_arg
+        Args:
+            manifest_nodes: Dict of manifest node IDs to node objects
 
-    for node_id in manifest_nodes:
-        if node_id.startswith("model.") and node_id.split(".")[-1] == model_name:
-            return node_id
+        """
+        model_relations: dict[str, str] = {}
+        other_relations: dict[str, str] = {}
+        self.model_names: dict[str, str] = {}
+        self.package_model_names: dict[tuple[str, str], str] = {}
+
+        for node_id, node in manifest_nodes.items():
+            is_model = node_id.startswith("model.")
+            relation_name = getattr(node, "relation_name", None)
+            if relation_name:
+                (model_relations if is_model else other_relations).setdefault(relation_name, node_id)
+            if is_model:
+                node_id_parts = node_id.split(".")
+                self.model_names.setdefault(node_id_parts[-1], node_id)
+                self.package_model_names.setdefault((node_id_parts[1], node_id_parts[-1]), node_id)
+
+        self.relation_names: dict[str, str] = {**other_relations, **model_relations}
+
+    def resolve_ref(self, to_str: str) -> Optional[str]:
+        """Resolve an unrendered ``ref(...)`` expression.
+
+        Supports:
+            - ``ref('model_name')`` / ``ref("model_name")``
+            - ``ref('package', 'model_name')`` / ``ref("package", "model_name")``
 
-    return None
+        Args:
+            to_str: The constraint.to string (a ``ref(...)`` expression)
 
+        Returns:
+            Matching node unique ID, or None if it is not a ref or no model matches.
 
-def _resolve_to_node_id(to_str: str, manifest_nodes: dict) -> Optional[str]:
-    """Resolve constraint.to to a manifest node unique ID.
+        """
+        if not to_str:
+            return None
 
-    Handles both shapes dbt may emit for a contract foreign-key ``to``:
+        match = REF_PATTERN.match(to_str)
+        if not match:
+            return None
 
-    - A fully qualified relation name (``<database>.<schema>.<table_name>``, e.g.
-      ``"shaman.dummy.locations"``), matched against each node's ``relation_name``.
-      This is what a built/rendered manifest carries.
-    - An unrendered ``ref(...)`` expression (e.g. ``"ref('locations')"``), which a
-      parsed/compiled manifest carries — resolved via _resolve_ref_to_node_id.
+        first_arg, second_arg = match.group(1), match.group(2)
+        if second_arg:
+            node_id = self.package_model_names.get((first_arg, second_arg))
+            if node_id:
+                return node_id
+            return self.model_names.get(second_arg)
 
-    Only the model resource type is currently supported.
+        return self.model_names.get(first_arg)
 
-    Args:
-        to_str: The constraint.to string (relation name or ``ref(...)`` expression)
-        manifest_nodes: Dict of manifest node IDs to node objects
+    def resolve(self, to_str: str) -> Optional[str]:
+        """Resolve constraint.to, by relation name first then as a ``ref(...)`` expression.
 
-    Returns:
-        Matching node unique ID, or None if not found.
+        Only the model resource type is currently supported for ``ref(...)``.
 
-    """
-    if not to_str:
-        return None
+        Args:
+            to_str: The constraint.to string (relation name or ``ref(...)`` expression)
 
-    # model resource type takes priority over other resource types
-    sorted_nodes = sorted(manifest_nodes.items(), key=lambda x: 0 if x[0].startswith("model.") else 1)
-    for node_id, node in sorted_nodes:
-        if getattr(node, "relation_name", None) == to_str:
-            return node_id
+        Returns:
+            Matching node unique ID, or None if not found.
+
+        """
+        if not to_str:
+            return None
 
-    # Fall back to resolving an unrendered ref('...') expression by model name
-    return _resolve_ref_to_node_id(to_str=to_str, manifest_nodes=manifest_nodes)
+        return self.relation_names.get(to_str) or self.resolve_ref(to_str)
 
 
 def _get_relationship_type(meta_value: str) -> str:
@@ -146,14 +169,18 @@ class ModelContractAlgo(BaseAlgoAdapter):
     (available in manifest v12+ / dbt 1.9+) to determine table connections.
     """
 
+    manifest_sections = TABLE_MANIFEST_SECTIONS
+    manifest_node_types = TABLE_NODE_TYPES
+
     def parse_artifacts(self, manifest: Manifest, catalog: Catalog, **kwargs) -> tuple[list[Table], list[Ref]]:
         """Parse from file-based manifest/catalog artifacts."""
         tables = self.get_tables(manifest=manifest, catalog=catalog, **kwargs)
         tables = self.filter_tables_based_on_selection(tables=tables, **kwargs)
+        table_index = self.get_table_index(tables=tables)
         tables = self._enrich_tables_with_pk_info(tables=tables, manifest=manifest)
 
         relationships = self.get_relationships(manifest=manifest, **kwargs)
-        relationships = self.make_up_relationships(relationships=relationships, tables=tables)
+        relationships = self.make_up_relationships(relationships=relationships, table_index=table_index)
 
         tables = self.enrich_tables_from_relationships(tables=tables, relationships=relationships)
 
@@ -177,14 +204,11 @@ class ModelContractAlgo(BaseAlgoAdapter):
         if not hasattr(manifest, "nodes"):
             return tables
 
-        pk_map: dict[str, set[str]] = {}
-        for node_name, node in manifest.nodes.items():
-            pk_cols = _extract_pk_column_names(node)
-            if pk_cols:
-                pk_map[node_name] = {c.lower() for c in pk_cols}
-
         for table in tables:
-            pks = pk_map.get(table.node_name, set())
+            node = manifest.nodes.get(table.node_name)
+            if node is None:
+                continue
+            pks = {c.lower() for c in _extract_pk_column_names(node)}
             if not pks:
                 continue
             for col in table.columns:
@@ -227,11 +251,12 @@ class ModelContractAlgo(BaseAlgoAdapter):
         if not hasattr(manifest, "nodes"):
             return found_nodes
 
+        resolver = self.get_node_resolver(manifest=manifest)
         for node_name, node in manifest.nodes.items():
             if not node_name.startswith("model."):
                 continue
 
-            fk_targets = self._collect_fk_targets(node, manifest.nodes)
+            fk_targets = self._collect_fk_targets(node, resolver)
 
             for target_id in fk_targets:
                 if node_name == node_unique_id:
@@ -260,21 +285,36 @@ class ModelContractAlgo(BaseAlgoAdapter):
 
         refs = []
 
+        resolver = self.get_node_resolver(manifest=manifest)
         for node_name, node in manifest.nodes.items():
             if not node_name.startswith("model."):
                 continue
 
-            refs.extend(self._extract_column_level_refs(node_name, node, manifest.nodes))
-            refs.extend(self._extract_model_level_refs(node_name, node, manifest.nodes))
+            refs.extend(self._extract_column_level_refs(node_name, node, resolver))
+            refs.extend(self._extract_model_level_refs(node_name, node, resolver))
 
         return self.get_unique_refs(refs=refs)
 
-    def _collect_fk_targets(self, node, manifest_nodes: dict) -> list[str]:
+    def get_node_resolver(self, manifest: Manifest) -> NodeResolver:
+        """Get the FK target resolver of the manifest, built once per manifest.
+
+        Args:
+            manifest: Manifest data
+
+        Returns:
+            NodeResolver over the manifest nodes
+
+        """
+        return manifest_indexes.get(
+            manifest, key=(type(self), "node_resolver"), build=lambda: NodeResolver(manifest.nodes)
+        )
+
+    def _collect_fk_targets(self, node, resolver: NodeResolver) -> list[str]:
         """Collect all FK target node IDs from a node's constraints.
 
         Args:
             node: Manifest node object
-            manifest_nodes: Dict of all manifest nodes
+            resolver: FK target resolver of the manifest
 
         Returns:
             List of target node IDs
@@ -288,26 +328,26 @@ class ModelContractAlgo(BaseAlgoAdapter):
                     continue
                 for constraint in col.constraints:
                     if constraint.type.value == "foreign_key" and getattr(constraint, "to", None):
-                        target_id = _resolve_to_node_id(constraint.to, manifest_nodes)
+                        target_id = resolver.resolve(constraint.to)
                         if target_id:
                             targets.append(target_id)
 
         if hasattr(node, "constraints") and node.constraints:
             for constraint in node.constraints:
                 if constraint.type.value == "foreign_key" and getattr(constraint, "to", None):
-                    target_id = _resolve_to_node_id(constraint.to, manifest_nodes)
+                    target_id = resolver.resolve(constraint.to)
                     if target_id:
                         targets.append(target_id)
 
         return targets
 
-    def _extract_column_level_refs(self, node_name: str, node, manifest_nodes: dict) -> list[Ref]:
+    def _extract_column_level_refs(self, node_name: str, node, resolver: NodeResolver) -> list[Ref]:
         """Extract Ref objects from column-level FK constraints.
 
         Args:
             node_name: The node unique ID (e.g. model.pkg.orders)
             node: The manifest node object
-            manifest_nodes: Dict of all manifest nodes
+            resolver: FK target resolver of the manifest
 
         Returns:
             List of Ref objects
@@ -328,7 +368,7 @@ class ModelContractAlgo(BaseAlgoAdapter):
                 if not getattr(constraint, "to", None):
                     continue
 
-                to_node_id = _resolve_to_node_id(constraint.to, manifest_nodes)
+                to_node_id = resolver.resolve(constraint.to)
                 if not to_node_id:
                     continue
 
@@ -352,13 +392,13 @@ class ModelContractAlgo(BaseAlgoAdapter):
 
         return refs
 
-    def _extract_model_level_refs(self, node_name: str, node, manifest_nodes: dict) -> list[Ref]:
+    def _extract_model_level_refs(self, node_name: str, node, resolver: NodeResolver) -> list[Ref]:
         """Extract Ref objects from model-level FK constraints.
 
         Args:
             node_name: The node unique ID (e.g. model.pkg.orders)
             node: The manifest node object
-            manifest_nodes: Dict of all manifest nodes
+            resolver: FK target resolver of the manifest
 
         Returns:
             List of Ref objects
@@ -377,7 +417,7 @@ class ModelContractAlgo(BaseAlgoAdapter):
             if not getattr(constraint, "columns", None):
                 continue
 
-            to_node_id = _resolve_to_node_id(constraint.to, manifest_nodes)
+            to_node_id = resolver.resolve(constraint.to)
             if not to_node_id:
                 continue
 
@@ -7,13 +7,39 @@ using dbt's Semantic Layer entities to determine connections.
 from typing import Optional, Union
 
 from dbterd.constants import TEST_META_RELATIONSHIP_TYPE
-from dbterd.core.adapters.algo import BaseAlgoAdapter
+from dbterd.core.adapters.algo import TABLE_MANIFEST_SECTIONS, TABLE_NODE_TYPES, BaseAlgoAdapter
+from dbterd.core.graph import RelationshipGraph
+from dbterd.core.manifest_index import manifest_indexes
 from dbterd.core.models import Ref, SemanticEntity, Table
 from dbterd.core.registry.decorators import register_algo
 from dbterd.helpers.log import logger
 from dbterd.types import Catalog, Manifest
 
 
+def link_semantic_entities(
+    foreigns: list[SemanticEntity], primaries: list[SemanticEntity]
+) -> list[tuple[SemanticEntity, SemanticEntity]]:
+    """Join the foreign entities to the primary entities of the same name, in linear time.
+
+    Args:
+        foreigns: FK entities
+        primaries: PK entities
+
+    Returns:
+        List of (FK, PK) entity tuples, ordered by FK then PK like the input lists
+
+    """
+    primaries_by_name: dict[str, list[SemanticEntity]] = {}
+    for primary_entity in primaries:
+        primaries_by_name.setdefault(primary_entity.entity_name, []).append(primary_entity)
+
+    return [
+        (foreign_entity, primary_entity)
+        for foreign_entity in foreigns
+        for primary_entity in primaries_by_name.get(foreign_entity.entity_name, ())
+    ]
+
+
 @register_algo("semantic", description="Detect relationships via Semantic Layer entities")
 class SemanticAlgo(BaseAlgoAdapter):
     """Algorithm adapter using dbt Semantic Layer entities.
@@ -22,15 +48,19 @@ class SemanticAlgo(BaseAlgoAdapter):
     (primary/foreign entities) to determine table connections.
     """
 
+    manifest_sections = (*TABLE_MANIFEST_SECTIONS, "semantic_models")
+    manifest_node_types = TABLE_NODE_TYPES
+
     def parse_artifacts(self, manifest: Manifest, catalog: Catalog, **kwargs) -> tuple[list[Table], list[Ref]]:
         """Parse from file-based manifest/catalog artifacts."""
         # Parse Table
         tables = self.get_tables(manifest=manifest, catalog=catalog, **kwargs)
         tables = self.filter_tables_based_on_selection(tables=tables, **kwargs)
+        table_index = self.get_table_index(tables=tables)
 
         # Parse Ref
         relationships = self.get_relationships(manifest=manifest)
-        relationships = self.make_up_relationships(relationships=relationships, tables=tables)
+        relationships = self.make_up_relationships(relationships=relationships, table_index=table_index)
 
         # Fulfill columns in Tables (due to `select *`)
         tables = self.enrich_tables_from_relationships(tables=tables, relationships=relationships)
@@ -48,10 +78,11 @@ class SemanticAlgo(BaseAlgoAdapter):
         # Parse Table
         tables = self.get_tables_from_metadata(data=data_list, **kwargs)
         tables = self.filter_tables_based_on_selection(tables=tables, **kwargs)
+        table_index = self.get_table_index(tables=tables)
 
         # Parse Ref
         relationships = self.get_relationships_from_metadata(data=data_list)
-        relationships = self.make_up_relationships(relationships=relationships, tables=tables)
+        relationships = self.make_up_relationships(relationships=relationships, table_index=table_index)
 
         logger.info(f"Collected {len(tables)} table(s) and {len(relationships)} relationship(s)")
         return (
@@ -82,15 +113,27 @@ class SemanticAlgo(BaseAlgoAdapter):
         if type == "metadata":  # pragma: no cover
             return found_nodes  # not supported yet, return input only
 
-        entities = self.get_linked_semantic_entities(manifest=manifest)
-        for foreign, primary in entities:
-            if primary.model == node_unique_id:
-                found_nodes.append(foreign.model)
-            if foreign.model == node_unique_id:
-                found_nodes.append(primary.model)
+        found_nodes.extend(self.get_linked_models(manifest=manifest).neighbours(node_unique_id))
 
         return list(set(found_nodes))
 
+    def get_linked_models(self, manifest: Manifest) -> RelationshipGraph:
+        """Get the graph of the models linked by their Semantic Entities, built once per manifest.
+
+        Args:
+            manifest: Manifest data
+
+        Returns:
+            RelationshipGraph of model unique IDs
+
+        """
+
+        def build() -> RelationshipGraph:
+            linked_entities = self.get_linked_semantic_entities(manifest=manifest)
+            return RelationshipGraph((primary.model, foreign.model) for foreign, primary in linked_entities)
+
+        return manifest_indexes.get(manifest, key=(type(self), "linked_models"), build=build)
+
     def get_semantic_nodes(self, manifest: Manifest) -> list:
         """Extract the Semantic Models.
 
@@ -204,7 +247,7 @@ class SemanticAlgo(BaseAlgoAdapter):
         self,
         manifest: Manifest,
     ) -> list[tuple[SemanticEntity, SemanticEntity]]:
-        """Get filtered list of Semantic Entities which are linked.
+        """Get filtered list of Semantic Entities which are linked, joined once per manifest.
 
         Args:
             manifest: Manifest data
@@ -213,13 +256,12 @@ class SemanticAlgo(BaseAlgoAdapter):
             List of (FK, PK) entity tuples
 
         """
-        foreigns, primaries = self.get_semantic_entities(manifest=manifest)
-        linked_entities = []
-        for foreign_entity in foreigns:
-            for primary_entity in primaries:
-                if foreign_entity.entity_name == primary_entity.entity_name:
-                    linked_entities.append((foreign_entity, primary_entity))
-        return linked_entities
+        linked_entities = manifest_indexes.get(
+            manifest,
+            key=(type(self), "linked_entities"),
+            build=lambda: link_semantic_entities(*self.get_semantic_entities(manifest=manifest)),
+        )
+        return list(linked_entities)
 
     def get_linked_semantic_entities_from_metadata(
         self,
@@ -234,13 +276,7 @@ class SemanticAlgo(BaseAlgoAdapter):
             List of (FK, PK) entity tuples
 
         """
-        foreigns, primaries = self.get_semantic_entities_from_metadata(data=data)
-        linked_entities = []
-        for foreign_entity in foreigns:
-            for primary_entity in primaries:
-                if foreign_entity.entity_name == primary_entity.entity_name:
-                    linked_entities.append((foreign_entity, primary_entity))
-        return linked_entities
+        return link_semantic_entities(*self.get_semantic_entities_from_metadata(data=data))
 
     def get_relationships(self, manifest: Manifest) -> list[Ref]:
         """Extract relationships from dbt artifacts based on Semantic Entities.
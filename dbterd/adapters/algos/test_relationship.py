@@ -4,6 +4,9 @@ This module extracts tables and relationships from dbt artifacts
 using dbt's relationship tests to determine connections.
 """
 
+from dataclasses import dataclass, field
+from functools import lru_cache
+import re
 from typing import Optional, Union
 
 import click
@@ -13,7 +16,9 @@ from dbterd.constants import (
     TEST_META_IGNORE_IN_ERD,
     TEST_META_RELATIONSHIP_TYPE,
 )
-from dbterd.core.adapters.algo import BaseAlgoAdapter
+from dbterd.core.adapters.algo import TABLE_MANIFEST_SECTIONS, TABLE_NODE_TYPES, BaseAlgoAdapter
+from dbterd.core.graph import RelationshipGraph
+from dbterd.core.manifest_index import manifest_indexes
 from dbterd.core.models import Ref, Table
 from dbterd.core.registry.decorators import register_algo
 from dbterd.helpers.log import logger
@@ -22,6 +27,8 @@ from dbterd.types import Catalog, Manifest
 
 # Constants
 MAX_TEST_PARENTS = 2
+# Single quoted argument of the `to` model call, e.g. `orders` in `ref('orders')` but not in `source('src', 'orders')`
+TO_MODEL_PATTERN = re.compile(r"""\(['"]([^'"]*)['"]\)""")
 
 
 def _extract_column_name(kwargs: dict, rule_key: str) -> str:
@@ -38,6 +45,104 @@ def _extract_column_name(kwargs: dict, rule_key: str) -> str:
     return str(column).replace('"', "").lower()
 
 
+@dataclass(frozen=True)
+class AlgoRule:
+    """Rule of the --algo option, compiled once per option value, see `compile_algo_rule`.
+
+    Attributes:
+        rules: Raw `key:value` pairs of the rule, in the option order
+        name: Relationship test name, use contains (lowercased)
+        c_from: Test argument of the `from` column(s)
+        c_to: Test argument of the `to` column(s)
+        t_to: Test argument of the `to` model
+    """
+
+    rules: tuple[tuple[str, str], ...]
+    name: Optional[str] = None
+    c_from: Optional[str] = None
+    c_to: Optional[str] = None
+    t_to: str = "to"
+
+    def to_models(self, test_kwargs: dict) -> frozenset[str]:
+        """Get the models named alone in the test `to` argument, e.g. `orders` in `ref('orders')`.
+
+        Args:
+            test_kwargs: Test metadata kwargs
+
+        Returns:
+            frozenset: Lowercased model names
+
+        """
+        to_model = test_kwargs.get(self.t_to)
+        if not to_model:
+            return frozenset()
+        return parse_to_models(to_model if isinstance(to_model, str) else str(to_model))
+
+    def points_to(self, test_kwargs: dict, node_unique_id: str) -> bool:
+        """Check if the test `to` argument refers to the node, e.g. `ref('orders')` for `model.pkg.orders`.
+
+        Args:
+            test_kwargs: Test metadata kwargs
+            node_unique_id: Manifest node unique ID
+
+        Returns:
+            bool: True if referred
+
+        """
+        return node_unique_id.rsplit(".", 1)[-1].lower() in self.to_models(test_kwargs)
+
+
+@lru_cache(maxsize=4096)
+def parse_to_models(to_model: str) -> frozenset[str]:
+    """Parse a relationship test `to` argument once, many tests referring to the same model.
+
+    Args:
+        to_model: Test `to` argument, e.g. `ref('orders')`
+
+    Returns:
+        frozenset: Lowercased model names given as a single argument, see `TO_MODEL_PATTERN`
+
+    """
+    return frozenset(name.lower() for name in TO_MODEL_PATTERN.findall(to_model))
+
+
+@lru_cache(maxsize=32)
+def compile_algo_rule(algo: Optional[str] = None) -> AlgoRule:
+    """Parse the --algo option value once, see `TestRelationshipAlgo.get_algo_rule`.
+
+    Args:
+        algo: Algorithm name and optional rules
+
+    Returns:
+        AlgoRule: Compiled rule
+
+    """
+    algo_parts = (algo or "").replace(" ", "").split(":", 1)
+    rules = algo_parts[1] if len(algo_parts) > 1 else DEFAULT_ALGO_RULE
+    rules = tuple(tuple(arg.split(":")) for arg in rules[1:-1].split("|"))  # without brackets
+    rule_map = dict(rules)
+    return AlgoRule(
+        rules=rules,
+        name=rule_map["name"].lower() if rule_map.get("name") is not None else None,
+        c_from=rule_map.get("c_from"),
+        c_to=rule_map.get("c_to"),
+        t_to=rule_map.get("t_to", "to"),
+    )
+
+
+@dataclass
+class RelationshipTestIndex:
+    """Relationship tests of a manifest, indexed once per algo rule name.
+
+    Attributes:
+        tests: Relationship test unique IDs, in the manifest order
+        graph: Nodes sharing a relationship test, each one also linked to itself
+    """
+
+    tests: list[str] = field(default_factory=list)
+    graph: RelationshipGraph = field(default_factory=RelationshipGraph)
+
+
 @register_algo("test_relationship", description="Detect relationships via dbt tests")
 class TestRelationshipAlgo(BaseAlgoAdapter):
     """Algorithm adapter using dbt relationship tests.
@@ -46,15 +151,19 @@ class TestRelationshipAlgo(BaseAlgoAdapter):
     to determine table connections in the ERD.
     """
 
+    manifest_sections = TABLE_MANIFEST_SECTIONS
+    manifest_node_types = (*TABLE_NODE_TYPES, "test")
+
     def parse_artifacts(self, manifest: Manifest, catalog: Catalog, **kwargs) -> tuple[list[Table], list[Ref]]:
         """Parse from file-based manifest/catalog artifacts."""
         # Parse Table
         tables = self.get_tables(manifest=manifest, catalog=catalog, **kwargs)
         tables = self.filter_tables_based_on_selection(tables=tables, **kwargs)
+        table_index = self.get_table_index(tables=tables)
 
         # Parse Ref
         relationships = self.get_relationships(manifest=manifest, **kwargs)
-        relationships = self.make_up_relationships(relationships=relationships, tables=tables)
+        relationships = self.make_up_relationships(relationships=relationships, table_index=table_index)
 
         # Fulfill columns in Tables (due to `select *`)
         tables = self.enrich_tables_from_relationships(tables=tables, relationships=relationships)
@@ -70,10 +179,11 @@ class TestRelationshipAlgo(BaseAlgoAdapter):
         # Parse Table
         tables = self.get_tables_from_metadata(data=data, **kwargs)
         tables = self.filter_tables_based_on_selection(tables=tables, **kwargs)
+        table_index = self.get_table_index(tables=tables)
 
         # Parse Ref
         relationships = self.get_relationships_from_metadata(data=data, **kwargs)
-        relationships = self.make_up_relationships(relationships=relationships, tables=tables)
+        relationships = self.make_up_relationships(relationships=relationships, table_index=table_index)
 
         logger.info(f"Collected {len(tables)} table(s) and {len(relationships)} relationship(s)")
         return (
@@ -104,13 +214,9 @@ class TestRelationshipAlgo(BaseAlgoAdapter):
         if type == "metadata":
             return found_nodes  # not supported yet, return input only
 
-        rule = self.get_algo_rule(**kwargs)
-        test_nodes = self.get_test_nodes_by_rule_name(manifest=manifest, rule_name=rule.get("name").lower())
-
-        for test_node in test_nodes:
-            nodes = manifest.nodes[test_node].depends_on.nodes or []
-            if node_unique_id in nodes:
-                found_nodes.extend(nodes)
+        rule = compile_algo_rule(kwargs.get("algo"))
+        test_index = self.get_test_index(manifest=manifest, rule_name=rule.name)
+        found_nodes.extend(test_index.graph.neighbours(node_unique_id))
 
         return list(set(found_nodes))
 
@@ -128,23 +234,26 @@ class TestRelationshipAlgo(BaseAlgoAdapter):
             List[Ref]: List of parsed relationship
 
         """
-        rule = self.get_algo_rule(**kwargs)
-        refs = [
-            Ref(
-                name=x,
-                table_map=self.get_table_map(test_node=manifest.nodes[x], **kwargs),
-                column_map=(
-                    [_extract_column_name(manifest.nodes[x].test_metadata.kwargs, rule.get("c_to"))],
-                    [
-                        str(manifest.nodes[x].test_metadata.kwargs.get("column_name") or "").replace('"', "").lower()
-                        or _extract_column_name(manifest.nodes[x].test_metadata.kwargs, rule.get("c_from"))
-                    ],
-                ),
-                type=self.get_relationship_type(manifest.nodes[x].meta.get(TEST_META_RELATIONSHIP_TYPE, "")),
-                relationship_label=manifest.nodes[x].meta.get("relationship_label"),
+        rule = compile_algo_rule(kwargs.get("algo"))
+        refs = []
+        for test_name in self.get_test_index(manifest=manifest, rule_name=rule.name).tests:
+            test_node = manifest.nodes[test_name]
+            test_kwargs = test_node.test_metadata.kwargs
+            refs.append(
+                Ref(
+                    name=test_name,
+                    table_map=self.get_table_map(test_node=test_node, rule=rule, **kwargs),
+                    column_map=(
+                        [_extract_column_name(test_kwargs, rule.c_to)],
+                        [
+                            str(test_kwargs.get("column_name") or "").replace('"', "").lower()
+                            or _extract_column_name(test_kwargs, rule.c_from)
+                        ],
+                    ),
+                    type=self.get_relationship_type(test_node.meta.get(TEST_META_RELATIONSHIP_TYPE, "")),
+                    relationship_label=test_node.meta.get("relationship_label"),
+                )
             )
-            for x in self.get_test_nodes_by_rule_name(manifest=manifest, rule_name=rule.get("name").lower())
-        ]
 
         return self.get_unique_refs(refs=refs)
 
@@ -164,7 +273,7 @@ class TestRelationshipAlgo(BaseAlgoAdapter):
         if data is None:
             data = []
         refs = []
-        rule = self.get_algo_rule(**kwargs)
+        rule = compile_algo_rule(kwargs.get("algo"))
 
         for data_item in data:
             for test in data_item.get("tests", {}).get("edges", []):
@@ -172,7 +281,7 @@ class TestRelationshipAlgo(BaseAlgoAdapter):
                 test_meta = test.get("node", {}).get("meta", {})
                 if (
                     test_id.startswith("test")
-                    and rule.get("name").lower() in test_id.lower()
+                    and rule.name in test_id.lower()
                     and test_meta is not None
                     and test_meta.get(TEST_META_IGNORE_IN_ERD, "0") == "0"
                 ):
@@ -180,12 +289,12 @@ class TestRelationshipAlgo(BaseAlgoAdapter):
                     refs.append(
                         Ref(
                             name=test_id,
-                            table_map=self.get_table_map_from_metadata(test_node=test, **kwargs),
+                            table_map=self.get_table_map_from_metadata(test_node=test, rule=rule, **kwargs),
                             column_map=(
-                                [_extract_column_name(test_metadata_kwargs, rule.get("c_to"))],
+                                [_extract_column_name(test_metadata_kwargs, rule.c_to)],
                                 [
                                     str(test_metadata_kwargs.get("columnName") or "").replace('"', "").lower()
-                                    or _extract_column_name(test_metadata_kwargs, rule.get("c_from"))
+                                    or _extract_column_name(test_metadata_kwargs, rule.c_from)
                                 ],
                             ),
                             type=self.get_relationship_type(test_meta.get(TEST_META_RELATIONSHIP_TYPE, "")),
@@ -223,14 +332,7 @@ class TestRelationshipAlgo(BaseAlgoAdapter):
             )
 
         """
-        algo_parts = (kwargs.get("algo") or "").replace(" ", "").split(":", 1)
-        rules, _ = (
-            algo_parts[1] if len(algo_parts) > 1 else DEFAULT_ALGO_RULE,
-            algo_parts[0],
-        )
-        rules = rules[1:-1]  # remove brackets
-        rules = dict(arg.split(":") for arg in rules.split("|"))
-        return rules
+        return dict(compile_algo_rule(kwargs.get("algo")).rules)
 
     def get_test_nodes_by_rule_name(self, manifest: Manifest, rule_name: str) -> list:
         """Get manifest nodes given the algo rule name.
@@ -246,21 +348,55 @@ class TestRelationshipAlgo(BaseAlgoAdapter):
             List: List of manifest nodes
 
         """
-        return [
-            x
-            for x in manifest.nodes
-            if (
-                x.startswith("test")
-                and rule_name in x.lower()
-                and manifest.nodes[x].meta.get(TEST_META_IGNORE_IN_ERD, "0") == "0"
-            )
-        ]
+        return list(self.get_test_index(manifest=manifest, rule_name=rule_name).tests)
 
-    def get_table_map(self, test_node, **kwargs) -> list[str]:
+    def get_test_index(self, manifest: Manifest, rule_name: str) -> RelationshipTestIndex:
+        """Get the index of the relationship tests, built in a single scan once per manifest.
+
+        Args:
+            manifest (Manifest): Manifest data
+            rule_name (str): Rule name
+
+        Returns:
+            RelationshipTestIndex: Relationship tests and the graph of their nodes
+
+        """
+        return manifest_indexes.get(
+            manifest,
+            key=(type(self), "tests", rule_name),
+            build=lambda: self.build_test_index(manifest=manifest, rule_name=rule_name),
+        )
+
+    def build_test_index(self, manifest: Manifest, rule_name: str) -> RelationshipTestIndex:
+        """Scan the manifest for the relationship tests, see `get_test_index`.
+
+        Args:
+            manifest (Manifest): Manifest data
+            rule_name (str): Rule name
+
+        Returns:
+            RelationshipTestIndex: Relationship tests and the graph of their nodes
+
+        """
+        tests = []
+        edges = []
+        for node_name, node in manifest.nodes.items():
+            if (
+                node_name.startswith("test")
+                and rule_name in node_name.lower()
+                and node.meta.get(TEST_META_IGNORE_IN_ERD, "0") == "0"
+            ):
+                tests.append(node_name)
+                parents = node.depends_on.nodes or []
+                edges.extend((parent, other) for parent in parents for other in parents)
+        return RelationshipTestIndex(tests=tests, graph=RelationshipGraph(edges))
+
+    def get_table_map(self, test_node, rule: Optional[AlgoRule] = None, **kwargs) -> list[str]:
         """Get the table map with order of [to, from] guaranteed.
 
         Args:
             test_node (dict): Manifest Test node
+            rule (AlgoRule, optional): Compiled algo rule. Defaults to the one of the `algo` option.
             **kwargs: Additional options passed from parent functions
 
         Returns:
@@ -274,20 +410,20 @@ class TestRelationshipAlgo(BaseAlgoAdapter):
         if len(map) == 1:
             return [map[0], map[0]]
 
-        rule = self.get_algo_rule(**kwargs)
-        to_model = str(test_node.test_metadata.kwargs.get(rule.get("t_to", "to"), {}))
-        if f'("{map[1].split(".")[-1]}")'.lower() in to_model.replace("'", '"').lower():
+        rule = rule or compile_algo_rule(kwargs.get("algo"))
+        if rule.points_to(test_node.test_metadata.kwargs, map[1]):
             return [map[1], map[0]]
 
         return map
 
-    def get_table_map_from_metadata(self, test_node, **kwargs) -> list[str]:
+    def get_table_map_from_metadata(self, test_node, rule: Optional[AlgoRule] = None, **kwargs) -> list[str]:
         """Get the table map with order of [to, from] guaranteed.
 
         (for Metadata)
 
         Args:
             test_node (dict): Metadata test node
+            rule (AlgoRule, optional): Compiled algo rule. Defaults to the one of the `algo` option.
             **kwargs: Additional options passed from parent functions
 
         Raises:
@@ -297,7 +433,7 @@ class TestRelationshipAlgo(BaseAlgoAdapter):
             list: [to model, from model]
 
         """
-        rule = self.get_algo_rule(**kwargs)
+        rule = rule or compile_algo_rule(kwargs.get("algo"))
 
         test_parents = []
         for parent in test_node.get("node", {}).get("parents", []):
@@ -315,9 +451,7 @@ class TestRelationshipAlgo(BaseAlgoAdapter):
             logger.debug(f"Collected test parents: {test_parents}")
             raise click.BadParameter("Relationship test unexpectedly doesn't have >2 parents")
 
-        test_metadata_to = (
-            test_node.get("node", {}).get("testMetadata", {}).get("kwargs", {}).get(rule.get("t_to", "to"), "")
-        )
+        test_metadata_to = test_node.get("node", {}).get("testMetadata", {}).get("kwargs", {}).get(rule.t_to, "")
 
         first_test_parent_parts = test_parents[0].split(".")
         first_test_parent_resource_type = (
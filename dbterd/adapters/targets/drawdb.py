@@ -4,13 +4,14 @@ This module converts parsed dbt artifacts into DrawDB JSON format
 for visualization with DrawDB tools.
 """
 
-import json
+from itertools import count
 from typing import ClassVar
 
 from dbterd.core.adapters.target import BaseTargetAdapter
 from dbterd.core.builder.json_builder import JsonERDBuilder
 from dbterd.core.models import Ref, Table
 from dbterd.core.registry.decorators import register_target
+from dbterd.helpers import json_codec
 
 
 @register_target("drawdb", description="DrawDB JSON format")
@@ -57,9 +58,13 @@ class DrawdbAdapter(BaseTargetAdapter):
                 "types": [],
             }
         )
-        builder.add_tables(tables, lambda t: self.format_table_dict(t, tables.index(t), graphic_tables))
+        # The builder formats the items in order: number them as they come, rather than
+        # looking each one up with `list.index`, quadratic over the relationships
+        table_ids = count()
+        relationship_ids = count()
+        builder.add_tables(tables, lambda t: self.format_table_dict(t, next(table_ids), graphic_tables))
         builder.add_relationships(
-            relationships, lambda r: self.format_relationship_dict(r, relationships.index(r), graphic_tables)
+            relationships, lambda r: self.format_relationship_dict(r, next(relationship_ids), graphic_tables)
         )
 
         # DrawDB schema - defines exact output structure
@@ -74,13 +79,13 @@ class DrawdbAdapter(BaseTargetAdapter):
         """Format a single table as JSON string (required by base class)."""
         graphic_tables = kwargs.get("graphic_tables", {})
         idx = kwargs.get("idx", 0)
-        return json.dumps(self.format_table_dict(table, idx, graphic_tables))
+        return json_codec.dumps(self.format_table_dict(table, idx, graphic_tables))
 
     def format_relationship(self, relationship: Ref, **kwargs) -> str:
         """Format a single relationship as JSON string (required by base class)."""
         graphic_tables = kwargs.get("graphic_tables", {})
         idx = kwargs.get("idx", 0)
-        return json.dumps(self.format_relationship_dict(relationship, idx, graphic_tables))
+        return json_codec.dumps(self.format_relationship_dict(relationship, idx, graphic_tables))
 
     def get_y(self, tables: list[Table], idx: int, graphic_tables: dict, column_size: int = 4) -> float:
         """Get y value of a table for layout.
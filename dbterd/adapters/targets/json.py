@@ -8,13 +8,13 @@ consume it with confidence rather than reverse-engineering field names.
 """
 
 from importlib.metadata import PackageNotFoundError, version
-import json
 
 from dbterd.core.adapters.target import BaseTargetAdapter
 from dbterd.core.builder.json_builder import JsonERDBuilder
 from dbterd.core.models import Ref, Table
 from dbterd.core.registry.decorators import register_target
 from dbterd.core.schemas.erd import SCHEMA_BASE_URL
+from dbterd.helpers import json_codec
 
 
 def get_schema_version() -> str:
@@ -73,7 +73,7 @@ class JsonAdapter(BaseTargetAdapter):
         other targets and for any caller that wants a single-node JSON string.
         """
         foreign_keys = kwargs.get("foreign_keys", {})
-        return json.dumps(self.format_node(table, foreign_keys))
+        return json_codec.dumps(self.format_node(table, foreign_keys))
 
     def format_relationship(self, relationship: Ref, **kwargs) -> str:
         """Format a single relationship as a JSON string.
@@ -81,7 +81,7 @@ class JsonAdapter(BaseTargetAdapter):
         ABC-contract counterpart to ``format_edge`` (see ``format_table``);
         ``build_erd`` uses ``format_edge`` directly.
         """
-        return json.dumps(self.format_edge(relationship))
+        return json_codec.dumps(self.format_edge(relationship))
 
     def format_node(self, table: Table, foreign_keys: dict[str, set[str]]) -> dict:
         """Format a single table as a dbterd ERD node dict."""
@@ -105,8 +105,8 @@ class JsonAdapter(BaseTargetAdapter):
                 }
                 for col in (table.columns or [])
             ],
-            # `Table.raw_sql` holds compiled SQL: the parser fills it via
-            # `get_compiled_sql` (compiled_code/compiled_sql, raw dbt code only as a
+            # `Table.raw_sql` holds compiled SQL: the parser resolves it lazily via
+            # `get_lazy_compiled_sql` (compiled_code/compiled_sql, raw dbt code only as a
             # last resort), hence `compiled_sql` as the public field name.
             "compiled_sql": table.raw_sql,
         }
@@ -1,10 +1,12 @@
 import logging
 from pathlib import Path
+from typing import Optional, Union
 
 from click import Command, Context
 
 from dbterd import default
 from dbterd.core.executor import Executor
+from dbterd.core.session import ArtifactSession
 from dbterd.helpers.log import logger
 
 
@@ -36,6 +38,17 @@ class DbtErd:
     [Selection](https://dbterd.datnguye.me/latest/nav/guide/cli-references.html#dbterd-run-select-s)
     page for more details.
 
+    ## Get many ERDs (per selection and per model) from a single artifacts load
+
+    ```python
+    from dbterd.api import DbtErd
+
+    erds = DbtErd().get_batch_erd(
+        selections={"orders": ["exposure:orders"], "finance": ["schema:finance"]},
+        per_model=True,
+    )
+    ```
+
     ## Get a model (named `model.jaffle_shop.my_model`)'s ERD
 
     ```python
@@ -76,6 +89,7 @@ class DbtErd:
         self.params["omit_columns"] = self.params.get("omit_columns", False)
         self.params["artifacts_dir"] = self.params.get("artifacts_dir", Path.cwd())
         self.params["target"] = self.params.get("target", default.default_target())
+        self.params["no_cache"] = self.params.get("no_cache", default.default_no_cache())
 
     def get_erd(self) -> str:
         """
@@ -89,16 +103,17 @@ class DbtErd:
         ```
 
         Returns:
-            str: ERD text
+            str: ERD text, or dict of target name to ERD text if multiple targets are given
 
         """
         return self.executor.run(**self.params)
 
-    def get_model_erd(self, node_unique_id: str) -> str:
+    def get_model_erd(self, node_unique_id: str, depth: Optional[int] = None) -> str:
         """
         Generate ERD code for a model.
 
-        Result contains the input model and 1 level relationship model(s) (if any).
+        Result contains the input model and its relationship model(s) (if any),
+        up to `depth` relationship hops, 1 level by default.
 
         Usage:
 
@@ -106,13 +121,139 @@ class DbtErd:
             from dbterd.api import DbtErd
 
             erd = DbtErd().get_model_erd(node_unique_id="model.jaffle_shop.my_model")
+            erd = DbtErd().get_model_erd(
+                node_unique_id="model.jaffle_shop.my_model", depth=2
+            )
+            ```
+
+        Args:
+            - node_unique_id (str): Manifest node unique ID
+            - depth (int, optional): Number of relationship hops, 0 for the model alone.
+                Defaults to the `depth` param, or 1 (0 with the metadata).
+
+        Returns:
+            str: ERD text, or dict of target name to ERD text if multiple targets are given
+
+        """
+        params = self.params if depth is None else {**self.params, "depth": depth}
+        return self.executor.run(node_unique_id=node_unique_id, **params)
+
+    def get_batch_erd(
+        self,
+        selections: Optional[dict[str, list[str]]] = None,
+        per_model: bool = False,
+        workers: int = 1,
+    ) -> dict[str, Union[str, dict[str, str]]]:
+        """
+        Generate many ERD codes from a single load of the artifacts.
+
+        Usage:
+
+            ```python
+            from dbterd.api import DbtErd
+
+            erds = DbtErd().get_batch_erd(
+                selections={"orders": ["exposure:orders"]}, per_model=True
+            )
+            ```
+
+        Args:
+            - selections (dict): Item name to its selection rules
+            - per_model (bool): Also generate one ERD per selected model, like `get_model_erd`
+            - workers (int): Number of worker processes building the items, in-process if 1
+
+        Returns:
+            dict: Item name (or model unique ID) to ERD text, or to a dict of target name to ERD
+            text if multiple targets are given
+
+        """
+        return self.executor.run_batch(selections=selections, per_model=per_model, workers=workers, **self.params)
+
+
+class DbtErdSession(DbtErd):
+    """
+    dbt ERD API functions answering repeated queries from artifacts kept in memory.
+
+    The artifacts are loaded on the first query only, then reloaded whenever their
+    files change (checked by mtime/size, then by content hash). Each query may
+    override the selection and rendering params, e.g. `select`, `exclude` or `target`;
+    the params used to read the artifacts are fixed for the session.
+
+    **Usage**:
+
+    ```python
+    from dbterd.api import DbtErdSession
+
+    session = DbtErdSession(artifacts_dir="target", target="mermaid")
+    erd = session.get_erd(select=["exposure:my_exposure_name"])
+    model_erd = session.get_model_erd(node_unique_id="model.jaffle_shop.my_model")
+    ```
+    """
+
+    def __init__(self, **kwargs) -> None:
+        """Initialize the session given similar input CLI parameters."""
+        super().__init__(**kwargs)
+        self.params = self.executor.evaluate_kwargs(**self.params)
+        self.session: ArtifactSession = self.executor.open_session(**self.params)
+        """
+        Loaded artifacts, reloaded on change
+        """
+
+    def _query_params(self, **kwargs) -> dict:
+        params = {**self.params, **kwargs}
+        for key in ("select", "exclude"):
+            if isinstance(params[key], str):
+                params[key] = [params[key]]
+        return params
+
+    def get_erd(self, **kwargs) -> Union[str, dict[str, str]]:
+        """
+        Generate ERD code for a whole project from the in-memory artifacts.
+
+        Usage:
+        ```python
+        from dbterd.api import DbtErdSession
+
+        erd = DbtErdSession().get_erd(select=["schema:finance"], target="d2")
+        ```
+
+        Args:
+            - **kwargs: Params overriding the session ones for this query only
+
+        Returns:
+            str: ERD text, or dict of target name to ERD text if multiple targets are given
+
+        """
+        snapshot = self.session.current()
+        return self.executor.run_artifacts(snapshot.manifest, snapshot.catalog, **self._query_params(**kwargs))
+
+    def get_model_erd(self, node_unique_id: str, **kwargs) -> Union[str, dict[str, str]]:
+        """
+        Generate ERD code for a model from the in-memory artifacts.
+
+        Result contains the input model and its relationship model(s) (if any),
+        up to `depth` relationship hops, 1 level by default.
+
+        Usage:
+
+            ```python
+            from dbterd.api import DbtErdSession
+
+            erd = DbtErdSession().get_model_erd(node_unique_id="model.jaffle_shop.my_model")
+            erd = DbtErdSession().get_model_erd(
+                node_unique_id="model.jaffle_shop.my_model", depth=2
+            )
             ```
 
         Args:
             - node_unique_id (str): Manifest node unique ID
+            - **kwargs: Params overriding the session ones for this query only, e.g. `depth`
 
         Returns:
-            str: ERD text
+            str: ERD text, or dict of target name to ERD text if multiple targets are given
 
         """
-        return self.executor.run(node_unique_id=node_unique_id, **self.params)
+        snapshot = self.session.current()
+        return self.executor.run_artifacts(
+            snapshot.manifest, snapshot.catalog, node_unique_id=node_unique_id, **self._query_params(**kwargs)
+        )
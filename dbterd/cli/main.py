@@ -6,7 +6,9 @@ import click
 from dbterd.cli import params
 from dbterd.cli.config import ConfigError, get_yaml_template, load_config
 from dbterd.constants import CONFIG_FILE_DBTERD_YML
+from dbterd.core.batch import parse_batch_selections
 from dbterd.core.executor import Executor
+from dbterd.core.server import serve as serve_erd
 from dbterd.helpers import jsonify
 from dbterd.helpers.log import logger
 
@@ -79,6 +81,8 @@ def dbterd(ctx):
 @dbterd.command(name="run")
 @click.pass_context
 @params.run_params
+@params.reuse_result_params
+@params.model_params
 def run(ctx, **kwargs):
     """
     Generate ERD file from reading dbt artifact files,
@@ -87,10 +91,35 @@ def run(ctx, **kwargs):
     Executor(ctx).run(**kwargs)
 
 
+# dbterd batch
+@dbterd.command(name="batch")
+@click.pass_context
+@params.batch_params
+def batch(ctx, batch_select, **kwargs):
+    """
+    Generate many ERD files (per selection and/or per model)
+    from a single read of the dbt artifact files.
+    """
+    Executor(ctx).run_batch(selections=parse_batch_selections(batch_select), **kwargs)
+
+
+# dbterd serve
+@dbterd.command(name="serve")
+@click.pass_context
+@params.serve_params
+def serve(ctx, **kwargs):
+    """
+    Serve ERDs over HTTP from dbt artifact files held in memory,
+    reloading them whenever they change.
+    """
+    serve_erd(Executor(ctx), **kwargs)
+
+
 # dbterd run_metadata
 @dbterd.command(name="run-metadata")
 @click.pass_context
 @params.run_metadata_params
+@params.model_params
 def run_metadata(ctx, **kwargs):
     """Generate ERD file from reading Discovery API (dbt Cloud)."""
     Executor(ctx).run_metadata(**kwargs)
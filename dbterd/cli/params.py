@@ -25,7 +25,7 @@ def common_params(func):
     @click.option(
         "--target",
         "-t",
-        help="Target to the diagram-as-code platform",
+        help="Target to the diagram-as-code platform, comma-separated to render several at once",
         default=default.default_target(),
         show_default=True,
         type=click.STRING,
@@ -160,6 +160,26 @@ def run_params(func):
         help="Specified dbt catalog.json version",
         type=click.STRING,
     )
+    @click.option(
+        "--manifest-projection",
+        help=(
+            "Flag to read only the manifest.json sections and node types the chosen algorithm needs "
+            "(e.g. skipping macros, docs and metrics) before validating it"
+        ),
+        is_flag=True,
+        default=default.default_manifest_projection(),
+        show_default=True,
+    )
+    @click.option(
+        "--no-cache",
+        help=(
+            "Flag to bypass the on-disk cache of parsed manifest.json/catalog.json "
+            "(stored in $DBTERD_CACHE_DIR, default to ~/.cache/dbterd)"
+        ),
+        is_flag=True,
+        default=default.default_no_cache(),
+        show_default=True,
+    )
     @click.option(
         "--dbt",
         help="Flag to indicate the Selection to follow dbt's one leveraging Programmatic Invocation",
@@ -302,6 +322,26 @@ def debug_params(func):
         help="Specified dbt catalog.json version",
         type=click.STRING,
     )
+    @click.option(
+        "--manifest-projection",
+        help=(
+            "Flag to read only the manifest.json sections and node types the chosen algorithm needs "
+            "(e.g. skipping macros, docs and metrics) before validating it"
+        ),
+        is_flag=True,
+        default=default.default_manifest_projection(),
+        show_default=True,
+    )
+    @click.option(
+        "--no-cache",
+        help=(
+            "Flag to bypass the on-disk cache of parsed manifest.json/catalog.json "
+            "(stored in $DBTERD_CACHE_DIR, default to ~/.cache/dbterd)"
+        ),
+        is_flag=True,
+        default=default.default_no_cache(),
+        show_default=True,
+    )
     @click.option(
         "--dbt",
         help="Flag to indicate the Selection to follow dbt's one leveraging Programmatic Invocation",
@@ -402,6 +442,122 @@ def debug_params(func):
     return wrapper
 
 
+def reuse_result_params(func):
+    @click.option(
+        "--reuse-result",
+        help=(
+            "Flag to cache the ERD in the output directory and reuse it as-is while the artifacts "
+            "and options are unchanged. Any change regenerates the whole ERD"
+        ),
+        is_flag=True,
+        default=default.default_reuse_result(),
+        show_default=True,
+    )
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)  # pragma: no cover
+
+    return wrapper
+
+
+def depth_params(func):
+    @click.option(
+        "--depth",
+        help=(
+            "Number of relationship hops around a model in its ERD, 0 for the model alone "
+            "[default: 1, or 0 with run-metadata]"
+        ),
+        default=None,
+        type=click.IntRange(min=0),
+    )
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)  # pragma: no cover
+
+    return wrapper
+
+
+def model_params(func):
+    @depth_params
+    @click.option(
+        "--node-unique-id",
+        help="Generate the ERD of this node only (e.g. model.jaffle_shop.orders), with its related nodes",
+        default=None,
+        type=click.STRING,
+    )
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)  # pragma: no cover
+
+    return wrapper
+
+
+def batch_params(func):
+    @run_params
+    @depth_params
+    @click.option(
+        "--batch-select",
+        "-bs",
+        help=(
+            "Batch item formed as NAME=RULE, generating NAME.<ext> from the RULE selection. "
+            "Repeat the NAME to add more rules to its selection"
+        ),
+        default=[],
+        multiple=True,
+        type=click.STRING,
+    )
+    @click.option(
+        "--per-model",
+        help="Flag to also generate one ERD per selected model, with its related models",
+        is_flag=True,
+        default=False,
+        show_default=True,
+    )
+    @click.option(
+        "--workers",
+        help="Number of worker processes building the batch items, in-process if 1",
+        default=default.default_batch_workers(),
+        show_default=True,
+        type=click.IntRange(min=1),
+    )
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)  # pragma: no cover
+
+    return wrapper
+
+
+def serve_params(func):
+    @run_params
+    @depth_params
+    @click.option(
+        "--host",
+        help="Host to listen on",
+        default=default.default_serve_host(),
+        show_default=True,
+        type=click.STRING,
+    )
+    @click.option(
+        "--port",
+        help="Port to listen on",
+        default=default.default_serve_port(),
+        show_default=True,
+        type=click.IntRange(min=0, max=65535),
+    )
+    @click.option(
+        "--reload-interval",
+        help="Seconds between two checks of the artifact files for changes, 0 to never reload them",
+        default=2.0,
+        show_default=True,
+        type=click.FloatRange(min=0),
+    )
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)  # pragma: no cover
+
+    return wrapper
+
+
 def init_params(func):
     @click.option(
         "--template",
@@ -6,14 +6,101 @@ and defines the interface that subclasses must implement.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 import copy
-from typing import Optional, Union
+from functools import partial
+from typing import ClassVar, Optional, Union
 
-from dbterd.core.filter import is_selected_table
-from dbterd.core.models import Column, Ref, Table
+from dbterd.core.dedup import RefDeduplicator
+from dbterd.core.filter import SelectableNode, compile_selection
+from dbterd.core.models import Column, ColumnSource, Ref, Table
+from dbterd.helpers.log import logger
 from dbterd.types import Catalog, Manifest
 
 
+NodeExposures = dict[str, list[str]]
+
+# Manifest content read by the common table extraction methods
+TABLE_MANIFEST_SECTIONS = ("nodes", "sources", "exposures")
+TABLE_NODE_TYPES = ("model", "seed", "snapshot")
+
+
+def exposure_list_to_mapping(exposures: Optional[list[dict[str, str]]] = None) -> NodeExposures:
+    """
+    Convert the legacy flat exposure list into the node-to-exposures mapping.
+
+    Args:
+        exposures (list, optional): List of mapping dict {node_name:..., exposure_name:...}
+
+    Returns:
+        dict: Mapping of node unique ID to its exposure names
+
+    """
+    node_exposures: NodeExposures = {}
+    for x in exposures or []:
+        node_exposures.setdefault(x.get("node_name"), []).append(x.get("exposure_name"))
+    return node_exposures
+
+
+def exposure_mapping_to_list(node_exposures: Optional[NodeExposures] = None) -> list[dict[str, str]]:
+    """
+    Convert the node-to-exposures mapping back into the legacy flat exposure list.
+
+    Args:
+        node_exposures (dict, optional): Mapping of node unique ID to its exposure names
+
+    Returns:
+        list: List of mapping dict {node_name:..., exposure_name:...}
+
+    """
+    return [
+        {"node_name": node_name, "exposure_name": exposure_name}
+        for node_name, exposure_names in (node_exposures or {}).items()
+        for exposure_name in exposure_names
+    ]
+
+
+def get_columns_sql(columns: tuple[str, ...], table: str) -> str:
+    """
+    Generate the SQL of a node having no compiled code but just a list of columns.
+
+    Args:
+        columns (tuple): Column names
+        table (str): Table reference
+
+    Returns:
+        str: Select statement of the columns
+
+    """
+    columns_sql = ",\n            ".join(columns)
+    return f"""select
+            {columns_sql}
+        from {table}"""
+
+
+def get_exposure_names(
+    node_name: str,
+    exposures: Optional[Union[NodeExposures, list[dict[str, str]]]] = None,
+) -> list[str]:
+    """
+    Look up the exposure names of a node.
+
+    Args:
+        node_name (str): Node unique ID
+        exposures (dict | list, optional): Node-to-exposures mapping, or the legacy
+            flat list of {node_name:..., exposure_name:...} dicts
+
+    Returns:
+        list: Exposure names of the node
+
+    """
+    if not exposures:
+        return []
+    if isinstance(exposures, dict):
+        return list(exposures.get(node_name, []))
+    return [x.get("exposure_name") for x in exposures if x.get("node_name") == node_name]
+
+
 class BaseAlgoAdapter(ABC):
     """Base class for all algorithm adapters.
 
@@ -28,8 +115,17 @@ class BaseAlgoAdapter(ABC):
     The parse() method automatically dispatches to parse_metadata() when
     catalog == "metadata", otherwise it calls parse_artifacts().
 
+    Class attributes to override:
+        - manifest_sections: Top-level manifest sections the algo reads, used by
+          the projected manifest reading. None (default) means all of them.
+        - manifest_node_types: Resource types of `manifest.nodes` the algo reads.
+          None (default) means all of them.
+
     """
 
+    manifest_sections: ClassVar[Optional[tuple[str, ...]]] = None
+    manifest_node_types: ClassVar[Optional[tuple[str, ...]]] = None
+
     def parse(self, manifest: Manifest, catalog: Union[str, Catalog], **kwargs) -> tuple[list[Table], list[Ref]]:
         """
         Parse dbt artifacts to extract tables and relationships.
@@ -134,7 +230,7 @@ class BaseAlgoAdapter(ABC):
         if data is None:
             data = []
         tables = []
-        table_exposures = self.get_node_exposures_from_metadata(data=data, **kwargs)
+        table_exposures = self.get_node_exposure_map_from_metadata(data=data, **kwargs)
         # Model
         if "model" in kwargs.get("resource_type", []):
             for data_item in data:
@@ -163,24 +259,49 @@ class BaseAlgoAdapter(ABC):
         """
         Extract tables from dbt artifacts.
 
+        The selection criteria are evaluated against the cheap node attributes
+        (unique ID, database, schema, resource type and exposures) first, so that
+        columns and compiled SQL are only extracted for the selected nodes.
+
         Args:
             manifest (dict): dbt manifest json
             catalog (dict): dbt catalog json
             **kwargs: Additional options including:
                 entity_name_format (str): Format string for entity names
                 omit_columns (bool): Whether to exclude columns from tables
+                select (list): Selection rules to include tables
+                exclude (list): Rules to exclude tables
+                resource_type (list): Types of resources to include
 
         Returns:
-            List[Table]: All tables parsed from dbt artifacts
+            List[Table]: Selected tables parsed from dbt artifacts
 
         """
         tables = []
 
-        table_exposures = self.get_node_exposures(manifest=manifest)
+        table_exposures = self.get_node_exposure_map(manifest=manifest)
+        selection = compile_selection(
+            select_rules=kwargs.get("select") or [],
+            exclude_rules=kwargs.get("exclude") or [],
+            resource_types=kwargs.get("resource_type", []),
+        )
+
+        def is_selected(node_name: str, node) -> bool:
+            return selection.selects_all or selection.is_selected(
+                SelectableNode(
+                    node_name=node_name,
+                    database=node.database.lower(),
+                    schema=node.schema_.lower(),
+                    resource_type=node_name.split(".", maxsplit=1)[0],
+                    exposures=get_exposure_names(node_name=node_name, exposures=table_exposures),
+                )
+            )
 
         if hasattr(manifest, "nodes"):
             for node_name, node in manifest.nodes.items():
-                if node_name.startswith("model.") or node_name.startswith("seed.") or node_name.startswith("snapshot."):
+                if (
+                    node_name.startswith("model.") or node_name.startswith("seed.") or node_name.startswith("snapshot.")
+                ) and is_selected(node_name, node):
                     catalog_node = catalog.nodes.get(node_name)
                     table = self.get_table(
                         node_name=node_name,
@@ -193,7 +314,7 @@ class BaseAlgoAdapter(ABC):
 
         if hasattr(manifest, "sources"):
             for node_name, source in manifest.sources.items():
-                if node_name.startswith("source"):
+                if node_name.startswith("source") and is_selected(node_name, source):
                     catalog_source = catalog.sources.get(node_name)
                     table = self.get_table(
                         node_name=node_name,
@@ -221,21 +342,22 @@ class BaseAlgoAdapter(ABC):
             List[Table]: Filtered tables
 
         """
-        return [
-            table
-            for table in tables
-            if is_selected_table(
-                table=table,
-                select_rules=kwargs.get("select") or [],
-                resource_types=kwargs.get("resource_type", []),
-                exclude_rules=kwargs.get("exclude") or [],
-            )
-        ]
+        selection = compile_selection(
+            select_rules=kwargs.get("select") or [],
+            exclude_rules=kwargs.get("exclude") or [],
+            resource_types=kwargs.get("resource_type", []),
+        )
+        return [table for table in tables if selection.is_selected(table)]
 
     def enrich_tables_from_relationships(self, tables: list[Table], relationships: list[Ref]) -> list[Table]:
         """
         Fulfill columns in Table due to `select *`.
 
+        Relationship columns are grouped by table name in a single pass. Only the
+        tables missing some of those columns are copied (shallowly) with the extra
+        columns appended; every other table is returned as-is, and the input tables
+        are never mutated.
+
         Args:
             tables (List[Table]): List of Tables
             relationships (List[Ref]): List of Relationships between Tables
@@ -244,22 +366,36 @@ class BaseAlgoAdapter(ABC):
             List[Table]: Enriched tables
 
         """
-        copied_tables = copy.deepcopy(tables)
+        relationship_columns: dict[str, list[str]] = {}
         for relationship in relationships:
-            for table in copied_tables:
-                if table.name == relationship.table_map[0]:
-                    table_columns = [x.name.lower() for x in table.columns]
-                    for col_name in relationship.column_map[0]:
-                        if col_name.lower() not in table_columns:
-                            table.columns.append(Column(name=col_name))
-                            table_columns.append(col_name.lower())
-                if table.name == relationship.table_map[1]:
-                    table_columns = [x.name.lower() for x in table.columns]
-                    for col_name in relationship.column_map[1]:
-                        if col_name.lower() not in table_columns:
-                            table.columns.append(Column(name=col_name))
-                            table_columns.append(col_name.lower())
-        return copied_tables
+            for table_name, col_names in zip(relationship.table_map, relationship.column_map):
+                relationship_columns.setdefault(table_name, []).extend(col_names)
+
+        enriched_tables = []
+        for table in tables:
+            col_names = relationship_columns.get(table.name)
+            if not col_names:
+                enriched_tables.append(table)
+                continue
+
+            table_columns = table.columns or []
+            known_columns = {x.name.lower() for x in table_columns}
+            missing_columns = []
+            for col_name in col_names:
+                if col_name.lower() not in known_columns:
+                    known_columns.add(col_name.lower())
+                    missing_columns.append(Column(name=col_name, source=ColumnSource.RELATIONSHIP))
+
+            if not missing_columns:
+                enriched_tables.append(table)
+                continue
+
+            # Shallow copy, rather than `dataclasses.replace`, to keep the compiled SQL unresolved
+            enriched_table = copy.copy(table)
+            enriched_table.columns = [*table_columns, *missing_columns]
+            enriched_tables.append(enriched_table)
+
+        return enriched_tables
 
     def get_table_from_metadata(self, model_metadata, exposures=None, **kwargs) -> Table:
         """
@@ -267,7 +403,8 @@ class BaseAlgoAdapter(ABC):
 
         Args:
             model_metadata (dict): Metadata model node
-            exposures (list, optional): List of parsed exposures. Defaults to [].
+            exposures (dict, optional): Mapping of node unique ID to exposure names.
+                The legacy flat list form is still accepted. Defaults to {}.
             **kwargs: Additional options including:
                 entity_name_format (str): Format string for entity names
                 omit_columns (bool): Whether to exclude columns from tables
@@ -276,8 +413,6 @@ class BaseAlgoAdapter(ABC):
             Table: Parsed table
 
         """
-        if exposures is None:
-            exposures = []
         node_name = model_metadata.get("node", {}).get("uniqueId")
         node_description = model_metadata.get("node", {}).get("description")
         node_database = model_metadata.get("node", {}).get("database").lower()
@@ -304,7 +439,7 @@ class BaseAlgoAdapter(ABC):
             schema=node_schema,
             columns=[],
             resource_type=node_name.split(".", maxsplit=1)[0],
-            exposures=[x.get("exposure_name") for x in exposures if x.get("node_name") == node_name],
+            exposures=get_exposure_names(node_name=node_name, exposures=exposures),
             description=node_description,
             label=node_label,
         )
@@ -318,6 +453,7 @@ class BaseAlgoAdapter(ABC):
                         name=column.get("name", "").lower(),
                         data_type=column.get("type", "").lower(),
                         description=column.get("description", ""),
+                        source=ColumnSource.CATALOG,
                     )
                 )
 
@@ -334,7 +470,8 @@ class BaseAlgoAdapter(ABC):
             node_name (str): Node name
             manifest_node (dict): Manifest node
             catalog_node (dict, optional): Catalog node. Defaults to None.
-            exposures (List, optional): List of table-exposure mapping. Defaults to [].
+            exposures (dict, optional): Mapping of node unique ID to exposure names.
+                The legacy flat list form is still accepted. Defaults to {}.
             **kwargs: Additional options including:
                 entity_name_format (str): Format string for entity names
                 omit_columns (bool): Whether to exclude columns from tables
@@ -343,8 +480,6 @@ class BaseAlgoAdapter(ABC):
             Table: Parsed table
 
         """
-        if exposures is None:
-            exposures = []
         node_name_parts = node_name.split(".")
         table = Table(
             name=self.get_table_name(
@@ -363,39 +498,46 @@ class BaseAlgoAdapter(ABC):
                 },
             ),
             node_name=node_name,
-            raw_sql=self.get_compiled_sql(manifest_node),
+            raw_sql=self.get_lazy_compiled_sql(manifest_node),
             database=manifest_node.database.lower(),
             schema=manifest_node.schema_.lower(),
             columns=[],
             resource_type=node_name.split(".", maxsplit=1)[0],
-            exposures=[x.get("exposure_name") for x in exposures if x.get("node_name") == node_name],
+            exposures=get_exposure_names(node_name=node_name, exposures=exposures),
             description=manifest_node.description,
             label=manifest_node.meta.get("label"),
         )
 
+        # Catalog and manifest column names are both lowercased, so a single
+        # lowercase-keyed index merges them in linear time.
+        column_index: dict[str, Column] = {}
         if catalog_node:
             for column, metadata in catalog_node.columns.items():
-                table.columns.append(
-                    Column(
-                        name=str(column).lower(),
-                        data_type=str(metadata.type).lower(),
-                        description=metadata.comment or "",
-                    )
+                catalog_column = Column(
+                    name=str(column).lower(),
+                    data_type=str(metadata.type).lower(),
+                    description=metadata.comment or "",
+                    source=ColumnSource.CATALOG,
                 )
+                table.columns.append(catalog_column)
+                column_index.setdefault(catalog_column.name, catalog_column)
 
         for original_column_name, column_metadata in manifest_node.columns.items():
-            column_name = original_column_name.strip('"')
-            find_columns = [c for c in table.columns if c.name.lower() == column_name.lower()]
-            if not find_columns:
-                table.columns.append(
-                    Column(
-                        name=column_name.lower(),
-                        data_type=str(column_metadata.data_type or "unknown").lower(),
-                        description=column_metadata.description or "",
-                    )
+            column_name = original_column_name.strip('"').lower()
+            found_column = column_index.get(column_name)
+            if found_column is None:
+                manifest_column = Column(
+                    name=column_name,
+                    data_type=str(column_metadata.data_type or "unknown").lower(),
+                    description=column_metadata.description or "",
+                    source=ColumnSource.MANIFEST,
                 )
+                table.columns.append(manifest_column)
+                column_index[column_name] = manifest_column
             else:
-                find_columns[0].description = find_columns[0].description or column_metadata.description or ""
+                found_column.description = found_column.description or column_metadata.description or ""
+                if found_column.source == ColumnSource.CATALOG:
+                    found_column.source = ColumnSource.BOTH
 
         if not table.columns:
             table.columns.append(Column())
@@ -413,6 +555,28 @@ class BaseAlgoAdapter(ABC):
             str: Compiled SQL
 
         """
+        compiled_sql = self.get_lazy_compiled_sql(manifest_node)
+        return compiled_sql() if callable(compiled_sql) else compiled_sql
+
+    def get_lazy_compiled_sql(self, manifest_node) -> Union[Optional[str], Callable[[], str]]:
+        """
+        Retrieve compiled SQL from manifest node, deferring the SQL to be generated.
+
+        The compiled (or raw) code is a string the node holds already, returned as-is.
+        The SQL generated from the node columns is returned as a callable, closing over
+        the column names only, so that a `Table.raw_sql` doesn't keep the node (or the
+        adapter) alive until it's read. An overridden `get_compiled_sql` is called upfront.
+
+        Args:
+            manifest_node (dict): Manifest node
+
+        Returns:
+            str | Callable: Compiled SQL, or a callable returning it
+
+        """
+        if type(self).get_compiled_sql is not BaseAlgoAdapter.get_compiled_sql:
+            return self.get_compiled_sql(manifest_node)
+
         if hasattr(manifest_node, "compiled_sql"):  # up to v6
             return manifest_node.compiled_sql
 
@@ -420,11 +584,11 @@ class BaseAlgoAdapter(ABC):
             return manifest_node.compiled_code
 
         if hasattr(manifest_node, "columns"):  # nodes having no compiled but just list of columns
-            columns = ",\n            ".join([str(x) for x in manifest_node.columns])
-            table = f"{manifest_node.database}.{manifest_node.schema}.undefined"
-            return f"""select
-            {columns}
-        from {table}"""
+            return partial(
+                get_columns_sql,
+                columns=tuple(str(x) for x in manifest_node.columns),
+                table=f"{manifest_node.database}.{manifest_node.schema}.undefined",
+            )
 
         return manifest_node.raw_sql  # fallback to raw dbt code
 
@@ -484,6 +648,37 @@ class BaseAlgoAdapter(ABC):
 
         return exposures
 
+    def get_node_exposure_map_from_metadata(self, data=None, **kwargs) -> NodeExposures:
+        """
+        Get the mapping of node name and its exposure names (for Metadata).
+
+        Built from `get_node_exposures_from_metadata`, so an adapter overriding it is honoured.
+
+        Args:
+            data (list, optional): Metadata result list. Defaults to [].
+            **kwargs: Additional options that might be passed from parent functions
+
+        Returns:
+            dict: Mapping of node unique ID to its exposure names
+
+        """
+        return exposure_list_to_mapping(self.get_node_exposures_from_metadata(data=data, **kwargs))
+
+    def get_node_exposure_map(self, manifest: Manifest) -> NodeExposures:
+        """
+        Get the mapping of node name and its exposure names.
+
+        Built from `get_node_exposures`, so an adapter overriding it is honoured.
+
+        Args:
+            manifest (dict): dbt manifest json
+
+        Returns:
+            dict: Mapping of node unique ID to its exposure names
+
+        """
+        return exposure_list_to_mapping(self.get_node_exposures(manifest=manifest))
+
     def get_table_name(self, format: str, **kwargs) -> str:
         """
         Get table name from the input format.
@@ -502,8 +697,31 @@ class BaseAlgoAdapter(ABC):
     # Common relationship methods
     # -------------------------------------------------------------------------
 
+    def get_table_index(self, tables: Optional[list[Table]] = None) -> dict[str, Table]:
+        """
+        Index the parsed Tables by their manifest node unique ID.
+
+        The index is built once per parse and can be shared by every step that needs
+        to look a Table up by node ID. When several Tables share a node ID, the first
+        one wins.
+
+        Args:
+            tables (List[Table], optional): Parsed tables. Defaults to [].
+
+        Returns:
+            Dict[str, Table]: Mapping of node unique ID to Table
+
+        """
+        table_index: dict[str, Table] = {}
+        for table in tables or []:
+            table_index.setdefault(table.node_name, table)
+        return table_index
+
     def make_up_relationships(
-        self, relationships: Optional[list[Ref]] = None, tables: Optional[list[Table]] = None
+        self,
+        relationships: Optional[list[Ref]] = None,
+        tables: Optional[list[Table]] = None,
+        table_index: Optional[dict[str, Table]] = None,
     ) -> list[Ref]:
         """
         Filter Refs given by the parsed Tables & applied the entity name format.
@@ -511,32 +729,35 @@ class BaseAlgoAdapter(ABC):
         Args:
             relationships (List[Ref], optional): Parsed relationships. Defaults to [].
             tables (List[Table], optional): Parsed tables. Defaults to [].
+            table_index (Dict[str, Table], optional): Prebuilt node ID index of the tables,
+                see `get_table_index`. Built from `tables` if not provided.
 
         Returns:
             List[Ref]: Cooked relationships
 
         """
-        if tables is None:
-            tables = []
         if relationships is None:
             relationships = []
-        node_names = [x.node_name for x in tables]
-        relationships = [
-            Ref(
-                name=x.name,
-                table_map=[
-                    next(t for t in tables if t.node_name == x.table_map[0]).name,
-                    next(t for t in tables if t.node_name == x.table_map[1]).name,
-                ],
-                column_map=x.column_map,
-                type=x.type,
-                relationship_label=x.relationship_label,
+        if table_index is None:
+            table_index = self.get_table_index(tables=tables)
+
+        cooked_relationships = []
+        for x in relationships:
+            to_table = table_index.get(x.table_map[0])
+            from_table = table_index.get(x.table_map[1])
+            if to_table is None or from_table is None:
+                continue
+            cooked_relationships.append(
+                Ref(
+                    name=x.name,
+                    table_map=[to_table.name, from_table.name],
+                    column_map=x.column_map,
+                    type=x.type,
+                    relationship_label=x.relationship_label,
+                )
             )
-            for x in relationships
-            if x.table_map[0] in node_names and x.table_map[1] in node_names
-        ]
 
-        return relationships
+        return cooked_relationships
 
     def get_unique_refs(self, refs: Optional[list[Ref]] = None) -> list[Ref]:
         """
@@ -554,10 +775,8 @@ class BaseAlgoAdapter(ABC):
         if not refs:
             return []
 
-        distinct_list = [refs[0]]
-        for ref in refs:
-            distinct_maps = [str((x.table_map, x.column_map)) for x in distinct_list]
-            if str((ref.table_map, ref.column_map)) not in distinct_maps:
-                distinct_list.append(ref)
+        dedup = RefDeduplicator(refs=refs)
+        if dedup.duplicates:
+            logger.debug(f"Merged {dedup.duplicates} duplicate relationship(s)")
 
-        return distinct_list
+        return dedup.refs
@@ -0,0 +1,177 @@
+"""Batch ERD generation.
+
+Many ERDs (e.g. one per exposure, per domain schema or per model) are built from a
+single load of the artifacts: every batch item only re-runs the algo parse with its
+own selection over the shared manifest/catalog, then renders its targets.
+
+Items are built in-process by default. With more than one worker they are spread
+over a process pool whose workers receive the loaded artifacts once, at start-up
+(inherited without any copy where processes are forked), rather than with every item.
+"""
+
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import re
+from typing import Any, Optional, Union
+
+import click
+
+from dbterd.core.adapters.algo import BaseAlgoAdapter
+from dbterd.core.adapters.target import BaseTargetAdapter
+from dbterd.types import Catalog, Manifest
+
+
+BATCH_SELECTION_SEPARATOR = "="
+
+
+@dataclass
+class BatchItem:
+    """A single ERD of a batch.
+
+    Attributes:
+        name: Item name, also used as the output file name (without extension)
+        select: Selection rules of the item, all tables if empty
+        exclude: Exclusion rules of the item
+    """
+
+    name: str
+    select: list[str] = field(default_factory=list)
+    exclude: list[str] = field(default_factory=list)
+
+    @property
+    def file_stem(self) -> str:
+        """Output file name without extension, safe to use as a file name."""
+        return re.sub(r"[^\w.-]+", "_", self.name)
+
+
+def parse_batch_selections(values: Optional[Iterable[str]] = None) -> dict[str, list[str]]:
+    """Parse the `NAME=RULE` batch selections.
+
+    Repeating a name adds its rule to the item's selection (OR logic, like repeating `--select`).
+    An empty rule (`NAME=`) selects everything.
+
+    Args:
+        values: Batch selections, e.g. `["orders=exposure:orders", "finance=schema:finance"]`
+
+    Raises:
+        click.UsageError: Malformed batch selection
+
+    Returns:
+        Mapping of item name to its selection rules, in the given order
+
+    """
+    selections: dict[str, list[str]] = {}
+    for value in values or []:
+        name, separator, rule = value.partition(BATCH_SELECTION_SEPARATOR)
+        if not separator or not name.strip():
+            raise click.UsageError(f"Batch selection must be formed as `NAME=RULE`, got: {value}")
+        rules = selections.setdefault(name.strip(), [])
+        if rule.strip():
+            rules.append(rule.strip())
+    return selections
+
+
+def build_batch_item(
+    item: BatchItem,
+    manifest: Union[Manifest, dict],
+    catalog: Union[Catalog, str],
+    algo_adapter: BaseAlgoAdapter,
+    target_adapters: dict[str, BaseTargetAdapter],
+    **kwargs: Any,
+) -> dict[str, tuple[str, str]]:
+    """Parse the item's selection over the shared artifacts, then render it to every target.
+
+    Args:
+        item: Batch item
+        manifest: Loaded manifest
+        catalog: Loaded catalog
+        algo_adapter: Algo adapter
+        target_adapters: Dict of target name to target adapter
+        **kwargs: Run options
+
+    Returns:
+        Dict of target name to `(file name, content)` result
+
+    """
+    item_kwargs = {**kwargs, "select": item.select, "exclude": item.exclude}
+    tables, relationships = algo_adapter.parse(manifest=manifest, catalog=catalog, **item_kwargs)
+    return {
+        target: target_adapter.run(
+            tables=tables,
+            relationships=relationships,
+            manifest=manifest,
+            **{**item_kwargs, "target": target, "output_file_name": f"{item.file_stem}{target_adapter.file_extension}"},
+        )
+        for target, target_adapter in target_adapters.items()
+    }
+
+
+_worker_context: dict[str, Any] = {}
+
+
+def _init_worker(
+    manifest: Union[Manifest, dict],
+    catalog: Union[Catalog, str],
+    algo_adapter: BaseAlgoAdapter,
+    target_adapters: dict[str, BaseTargetAdapter],
+    kwargs: dict,
+) -> None:
+    _worker_context.update(
+        manifest=manifest,
+        catalog=catalog,
+        algo_adapter=algo_adapter,
+        target_adapters=target_adapters,
+        kwargs=kwargs,
+    )
+
+
+def _build_batch_item_in_worker(item: BatchItem) -> dict[str, tuple[str, str]]:
+    return build_batch_item(
+        item,
+        _worker_context["manifest"],
+        _worker_context["catalog"],
+        _worker_context["algo_adapter"],
+        _worker_context["target_adapters"],
+        **_worker_context["kwargs"],
+    )
+
+
+def iter_batch_results(
+    items: list[BatchItem],
+    manifest: Union[Manifest, dict],
+    catalog: Union[Catalog, str],
+    *,
+    algo_adapter: BaseAlgoAdapter,
+    target_adapters: dict[str, BaseTargetAdapter],
+    workers: Optional[int] = None,
+    **kwargs: Any,
+) -> Iterator[tuple[BatchItem, dict[str, tuple[str, str]]]]:
+    """Build the batch items, in-process or over a process pool.
+
+    Args:
+        items: Batch items
+        manifest: Loaded manifest
+        catalog: Loaded catalog
+        algo_adapter: Algo adapter
+        target_adapters: Dict of target name to target adapter
+        workers: Number of worker processes, items are built in-process if not greater than 1
+        **kwargs: Run options
+
+    Yields:
+        Each batch item with its dict of target name to `(file name, content)` result, in order
+
+    """
+    if not workers or workers <= 1 or len(items) <= 1:
+        for item in items:
+            yield item, build_batch_item(item, manifest, catalog, algo_adapter, target_adapters, **kwargs)
+        return
+
+    workers = min(workers, len(items))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(manifest, catalog, algo_adapter, target_adapters, kwargs),
+    ) as pool:
+        results = pool.map(_build_batch_item_in_worker, items, chunksize=max(1, len(items) // (workers * 4)))
+        yield from zip(items, results)
@@ -3,11 +3,11 @@
 This module provides a builder for JSON-based ERD formats.
 """
 
-import json
 from typing import Any, Callable
 
 from dbterd.core.builder.base_builder import BaseERDBuilder
 from dbterd.core.models import Ref, Table
+from dbterd.helpers import json_codec
 
 
 class JsonERDBuilder(BaseERDBuilder):
@@ -152,7 +152,7 @@ class JsonERDBuilder(BaseERDBuilder):
             else:
                 result[key] = value
 
-        return json.dumps(result) + "\n"
+        return json_codec.dumps(result) + "\n"
 
     def clear(self) -> "JsonERDBuilder":
         """Clear all content and reset the builder.
@@ -0,0 +1,98 @@
+"""Relationship de-duplication engine.
+
+Relationships are keyed on a canonical, hashable form of their ``table_map``
+and ``column_map`` so that duplicates are detected in constant time while the
+first-seen order of the input is preserved.
+"""
+
+from collections.abc import Hashable, Iterable
+from typing import Any, Optional
+
+from dbterd.core.models import Ref
+
+
+RefKey = tuple[Hashable, Hashable]
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert nested lists/tuples into nested tuples, leaving scalars untouched."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(x) for x in value)
+    return value
+
+
+def ref_key(ref: Ref) -> RefKey:
+    """Build the canonical de-duplication key of a relationship.
+
+    Lists and tuples are treated the same way, so ``["a", "b"]`` and ``("a", "b")``
+    produce an identical key.
+
+    Args:
+        ref: Parsed relationship
+
+    Returns:
+        Hashable ``(table_map, column_map)`` key
+
+    """
+    return (_freeze(ref.table_map), _freeze(ref.column_map))
+
+
+class RefDeduplicator:
+    """Order-preserving de-duplicator of relationships.
+
+    The first occurrence of each ``(table_map, column_map)`` key is kept and any
+    later occurrence is counted as a merged duplicate.
+
+    Example:
+        dedup = RefDeduplicator()
+        dedup.extend(refs)
+        unique_refs = dedup.refs
+        logger.debug(f"Merged {dedup.duplicates} duplicate(s)")
+
+    """
+
+    def __init__(self, refs: Optional[Iterable[Ref]] = None) -> None:
+        """Initialize the engine, optionally feeding it an initial batch of refs."""
+        self._seen: set[RefKey] = set()
+        self.refs: list[Ref] = []
+        self.duplicates: int = 0
+        if refs:
+            self.extend(refs)
+
+    def __len__(self) -> int:
+        return len(self.refs)
+
+    def __contains__(self, ref: Ref) -> bool:
+        return ref_key(ref) in self._seen
+
+    def add(self, ref: Ref) -> bool:
+        """Add a relationship unless an equivalent one was already collected.
+
+        Args:
+            ref: Parsed relationship
+
+        Returns:
+            True if the relationship was kept, False if it was merged as a duplicate
+
+        """
+        key = ref_key(ref)
+        if key in self._seen:
+            self.duplicates += 1
+            return False
+        self._seen.add(key)
+        self.refs.append(ref)
+        return True
+
+    def extend(self, refs: Iterable[Ref]) -> "RefDeduplicator":
+        """Add many relationships at once.
+
+        Args:
+            refs: Parsed relationships
+
+        Returns:
+            Self for method chaining
+
+        """
+        for ref in refs:
+            self.add(ref)
+        return self
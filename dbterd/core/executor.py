@@ -4,12 +4,14 @@ This module provides the main Executor class that orchestrates
 ERD generation from dbt artifacts.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import functools
 import importlib
 import importlib.metadata
 import os
 from pathlib import Path
 import pkgutil
-from typing import Optional
+from typing import Optional, Union
 
 import click
 
@@ -17,14 +19,21 @@ from dbterd import default
 from dbterd.adapters import algos, targets
 from dbterd.core.adapters.algo import BaseAlgoAdapter
 from dbterd.core.adapters.target import BaseTargetAdapter
+from dbterd.core.batch import BatchItem, iter_batch_results
 from dbterd.core.filter import has_unsupported_rule
+from dbterd.core.graph import RelationshipGraph
+from dbterd.core.manifest_index import manifest_indexes
 from dbterd.core.models import Ref, Table
 from dbterd.core.registry.plugin_registry import PluginRegistry
+from dbterd.core.result_cache import CachedResult, load_cached_result, run_fingerprint, save_cached_result
+from dbterd.core.session import ArtifactSession
 from dbterd.helpers import cli_messaging, file as file_handlers
+from dbterd.helpers.artifact_cache import ArtifactCache
 from dbterd.helpers.log import logger
 from dbterd.plugins.dbt_cloud.administrative import DbtCloudArtifact
 from dbterd.plugins.dbt_cloud.discovery import DbtCloudMetadata
 from dbterd.plugins.dbt_core.dbt_invocation import DbtInvocation
+from dbterd.types import Catalog, Manifest
 
 
 def _register_adapters() -> None:
@@ -80,11 +89,72 @@ class Executor:
         kwargs = self.evaluate_kwargs(**kwargs)
         return self._run_by_strategy(node_unique_id=node_unique_id, **kwargs)
 
-    def run_metadata(self, **kwargs) -> tuple[list[Table], list[Ref]]:
+    def run_metadata(self, node_unique_id: Optional[str] = None, **kwargs) -> tuple[list[Table], list[Ref]]:
         """Generate ERD from API metadata."""
         logger.info(f"Using algorithm [{kwargs.get('algo')}]")
         kwargs = self.evaluate_kwargs(**kwargs)
-        return self._run_metadata_by_strategy(**kwargs)
+        return self._run_metadata_by_strategy(node_unique_id=node_unique_id, **kwargs)
+
+    def read_artifacts(self, **kwargs) -> tuple[Manifest, Catalog]:
+        """Read the manifest and catalog files of the evaluated options.
+
+        Returns:
+            Tuple of (manifest, catalog)
+
+        """
+        policies = self._resolve_validation_policies(kwargs.get("relax_policies"))
+        cache = self._get_artifact_cache(**kwargs)
+        manifest = self._read_manifest(
+            mp=kwargs.get("artifacts_dir"),
+            mv=kwargs.get("manifest_version"),
+            policies=policies,
+            cache=cache,
+            **self._get_manifest_projection(**kwargs),
+        )
+        catalog = self._read_catalog(
+            cp=kwargs.get("artifacts_dir"),
+            cv=kwargs.get("catalog_version"),
+            policies=policies,
+            cache=cache,
+        )
+        return manifest, catalog
+
+    def open_session(self, **kwargs) -> ArtifactSession:
+        """Open a session keeping the artifacts of the evaluated options in memory.
+
+        Returns:
+            ArtifactSession object, loading the artifacts on its first query
+
+        """
+        artifacts_dir = Path(kwargs["artifacts_dir"])
+        return ArtifactSession(
+            loader=functools.partial(self.read_artifacts, **kwargs),
+            paths=[str(artifacts_dir / self.filename_manifest), str(artifacts_dir / self.filename_catalog)],
+        )
+
+    def run_artifacts(
+        self, manifest: Manifest, catalog: Catalog, node_unique_id: Optional[str] = None, **kwargs
+    ) -> Union[str, dict[str, str]]:
+        """Generate ERD from already loaded artifacts, given the evaluated options.
+
+        Returns:
+            ERD content, or a dict of target name to ERD content for multiple targets
+
+        """
+        self._check_if_any_unsupported_selection(kwargs.get("select"), kwargs.get("exclude"))
+        targets = self._get_targets(**kwargs)
+        results = self._render_artifacts(targets, manifest, catalog, node_unique_id=node_unique_id, **kwargs)
+        if len(targets) == 1:
+            return results[targets[0]][1]
+        return {target: results[target][1] for target in targets}
+
+    def run_batch(
+        self, selections: Optional[dict[str, list[str]]] = None, **kwargs
+    ) -> dict[str, Union[str, dict[str, str]]]:
+        """Generate many ERDs from a single artifacts load."""
+        logger.info(f"Using algorithm [{kwargs.get('algo')}]")
+        kwargs = self.evaluate_kwargs(**kwargs)
+        return self._run_batch_by_strategy(selections=selections, **kwargs)
 
     def evaluate_kwargs(self, **kwargs) -> dict:
         """Re-calculate the options.
@@ -105,7 +175,7 @@ class Executor:
         if not kwargs.get("dbt"):
             self._check_if_any_unsupported_selection(select, exclude)
 
-        if command == "run":
+        if command in ("run", "batch", "serve"):
             if kwargs.get("dbt"):
                 logger.info(f"Using dbt project dir at: {dbt_project_dir}")
                 self.dbt = DbtInvocation(
@@ -199,11 +269,66 @@ class Executor:
             exclude_rules=kwargs.get("exclude"),
         )
 
+    def _get_manifest_projection(self, **kwargs) -> dict:
+        """Get the manifest projection declared by the algo when `--manifest-projection` is on.
+
+        Returns:
+            Dict of `sections`/`node_types` to read, empty if the whole manifest is needed
+
+        """
+        if not kwargs.get("manifest_projection"):
+            return {}
+
+        adapter_class = PluginRegistry.get_algo(kwargs["algo"].split(":", maxsplit=1)[0])
+        if adapter_class.manifest_sections is None and adapter_class.manifest_node_types is None:
+            logger.info(f"Algorithm [{kwargs['algo']}] doesn't declare its manifest needs, reading all")
+            return {}
+
+        return {
+            "sections": adapter_class.manifest_sections,
+            "node_types": adapter_class.manifest_node_types,
+        }
+
+    def _get_artifact_cache(self, **kwargs) -> Optional[ArtifactCache]:
+        """Get the parsed artifact cache, unless `--no-cache` is on.
+
+        If `no_cache` isn't given (e.g. by an API session or the server), the
+        `DBTERD_NO_CACHE` environment variable applies, as for the CLI.
+
+        Returns:
+            ArtifactCache object, None if caching is disabled
+
+        """
+        no_cache = kwargs.get("no_cache")
+        if no_cache is None:
+            no_cache = default.default_no_cache()
+        if no_cache:
+            return None
+        return ArtifactCache()
+
+    def _get_run_fingerprint(self, node_unique_id: Optional[str] = None, **kwargs) -> str:
+        """Fingerprint the artifacts and options of a run reusing its result, see `run_fingerprint`.
+
+        Returns:
+            Hex digest fingerprint
+
+        """
+        artifacts_dir = kwargs.get("artifacts_dir")
+        cli_messaging.check_existence(artifacts_dir, self.filename_manifest)
+        cli_messaging.check_existence(artifacts_dir, self.filename_catalog)
+        return run_fingerprint(
+            [f"{artifacts_dir}/{self.filename_manifest}", f"{artifacts_dir}/{self.filename_catalog}"],
+            node_unique_id=node_unique_id,
+            **kwargs,
+        )
+
     def _read_manifest(
         self,
         mp: str,
         mv: Optional[int] = None,
         policies: Optional[list[str]] = None,
+        cache: Optional[ArtifactCache] = None,
+        **projection,
     ):
         """Read the Manifest content.
 
@@ -211,6 +336,8 @@ class Executor:
             mp: manifest.json file path
             mv: Manifest version (None for auto-detect)
             policies: Validation relaxation policy names (None = all registered)
+            cache: Parsed artifact cache (None = no caching)
+            **projection: Optional `sections`/`node_types` to keep, see `_get_manifest_projection`
 
         Returns:
             Manifest object
@@ -225,13 +352,14 @@ class Executor:
         cli_messaging.check_existence(mp, self.filename_manifest)
         conditional = f" or provided version {mv} is incorrect" if mv else ""
         with cli_messaging.handle_read_errors(self.filename_manifest, conditional):
-            return file_handlers.read_manifest(path=mp, version=mv, policies=policies)
+            return file_handlers.read_manifest(path=mp, version=mv, policies=policies, cache=cache, **projection)
 
     def _read_catalog(
         self,
         cp: str,
         cv: Optional[int] = None,
         policies: Optional[list[str]] = None,
+        cache: Optional[ArtifactCache] = None,
     ):
         """Read the Catalog content.
 
@@ -239,6 +367,7 @@ class Executor:
             cp: catalog.json file path
             cv: Catalog version (None for auto-detect)
             policies: Validation relaxation policy names (None = all registered)
+            cache: Parsed artifact cache (None = no caching)
 
         Returns:
             Catalog object
@@ -252,7 +381,7 @@ class Executor:
 
         cli_messaging.check_existence(cp, self.filename_catalog)
         with cli_messaging.handle_read_errors(self.filename_catalog):
-            return file_handlers.read_catalog(path=cp, version=cv, policies=policies)
+            return file_handlers.read_catalog(path=cp, version=cv, policies=policies, cache=cache)
 
     def _save_result(self, path, data):
         """Save ERD data to file.
@@ -274,13 +403,19 @@ class Executor:
             logger.error(str(e))
             raise click.FileError(f"Could not save the output: {e!s}") from e
 
-    def _set_single_node_selection(self, manifest, node_unique_id: str, type: Optional[str] = None, **kwargs) -> dict:
+    def _set_single_node_selection(
+        self, manifest, node_unique_id: str, type: Optional[str] = None, catalog=None, **kwargs
+    ) -> dict:
         """Override the Selection for the specific manifest node.
 
+        The node and its related nodes up to `depth` relationship hops are selected,
+        as found in the relationship graph, see `_get_relationship_graph`.
+
         Args:
-            manifest: Manifest data
+            manifest: Manifest data, or the metadata result list
             node_unique_id: Manifest node unique ID
             type: Manifest type (file or metadata)
+            catalog: Catalog data, or "metadata"
 
         Returns:
             Edited kwargs dict
@@ -290,13 +425,93 @@ class Executor:
             return kwargs
 
         algo_adapter = self.load_algo(name=kwargs["algo"])
-        kwargs["select"] = algo_adapter.find_related_nodes_by_id(
-            manifest=manifest, node_unique_id=node_unique_id, type=type, **kwargs
+        kwargs["select"] = self._get_related_nodes(
+            algo_adapter, manifest, catalog, node_unique_id=node_unique_id, type=type, **kwargs
         )
         kwargs["exclude"] = []
 
         return kwargs
 
+    def _get_related_nodes(
+        self,
+        algo_adapter: BaseAlgoAdapter,
+        manifest,
+        catalog,
+        node_unique_id: str,
+        type: Optional[str] = None,
+        **kwargs,
+    ) -> list[str]:
+        """Get the node and its related nodes up to `depth` relationship hops, see `_set_single_node_selection`.
+
+        Every depth walks the same graph of the parsed relationships, so that a depth
+        always includes the nodes of the lower ones. On the metadata (Discovery API) data,
+        the default depth is 0 though, to keep the node alone unless `depth` is given.
+
+        Returns:
+            List of node unique IDs
+
+        """
+        depth = self._get_depth(type=type, **kwargs)
+        if depth == 0:
+            return [node_unique_id]
+        graph = self._get_relationship_graph(algo_adapter, manifest, catalog, **kwargs)
+        return graph.neighbourhood(node_unique_id, depth=depth)
+
+    @staticmethod
+    def _get_depth(type: Optional[str] = None, **kwargs) -> int:
+        """Get the number of relationship hops of a model ERD, 1 by default or 0 on the metadata.
+
+        Raises:
+            click.UsageError: Negative depth
+
+        """
+        depth = kwargs.get("depth")
+        if depth is None:
+            return 0 if type == "metadata" else 1
+        try:
+            depth = int(depth)
+        except ValueError as e:
+            raise click.UsageError(f"Depth must be an integer, got {depth}") from e
+        if depth < 0:
+            raise click.UsageError(f"Depth must be 0 or more, got {depth}")
+        return depth
+
+    @staticmethod
+    def _get_relationship_graph(algo_adapter: BaseAlgoAdapter, manifest, catalog, **kwargs) -> RelationshipGraph:
+        """Get the graph of all the parsed relationships, built once per manifest.
+
+        The selection is ignored, but not the resource types, so that the graph
+        links the same nodes whatever the model ERD.
+
+        Args:
+            algo_adapter: Algo adapter
+            manifest: Manifest data, or the metadata result list (never cached)
+            catalog: Catalog data, or "metadata"
+            **kwargs: Run options
+
+        Returns:
+            RelationshipGraph object
+
+        """
+        graph_kwargs = {**kwargs, "select": [], "exclude": []}
+        resource_type = kwargs.get("resource_type")
+
+        def build() -> RelationshipGraph:
+            tables, relationships = algo_adapter.parse(manifest=manifest, catalog=catalog, **graph_kwargs)
+            return RelationshipGraph.from_parsed(tables, relationships)
+
+        return manifest_indexes.get(
+            manifest,
+            key=(
+                type(algo_adapter),
+                "relationship_graph",
+                kwargs.get("algo"),
+                kwargs.get("entity_name_format"),
+                None if resource_type is None else tuple(resource_type),
+            ),
+            build=build,
+        )
+
     @staticmethod
     def _resolve_validation_policies(relax_policies: object) -> Optional[list[str]]:
         """Resolve the configured ``relax-policies`` value to a policy-name list.
@@ -326,56 +541,243 @@ class Executor:
             f"`relax-policies` must be a list or comma-separated string, got: {type(relax_policies).__name__}"
         )
 
-    def _run_by_strategy(self, node_unique_id: Optional[str] = None, **kwargs) -> tuple[list[Table], list[Ref]]:
-        """Local File - Read artifacts and export the diagram file following the target."""
+    @staticmethod
+    def _get_targets(**kwargs) -> list[str]:
+        """Get the target names, given as a comma-separated string (e.g. `dbml,mermaid`) or a list.
+
+        Raises:
+            click.UsageError: `--output-file-name` is used with multiple targets
+
+        Returns:
+            List of unique target names, in the given order
+
+        """
+        target = kwargs.get("target")
+        names = target.split(",") if isinstance(target, str) else list(target or [])
+        targets = list(dict.fromkeys(name.strip() for name in names if name and name.strip()))
+        if len(targets) > 1 and kwargs.get("output_file_name"):
+            raise click.UsageError("`--output-file-name` can't be used with multiple targets")
+        return targets
+
+    def _render_targets(
+        self,
+        target_adapters: dict[str, BaseTargetAdapter],
+        tables: list[Table],
+        relationships: list[Ref],
+        **kwargs,
+    ) -> dict[str, tuple[str, str]]:
+        """Render the parsed tables and relationships to every target, saving each result.
+
+        Multiple targets are rendered concurrently, and each result is saved as soon
+        as its own render finishes.
+
+        Args:
+            target_adapters: Dict of target name to target adapter
+            tables: Parsed tables, shared read-only by every render
+            relationships: Parsed relationships, shared read-only by every render
+            **kwargs: Run options, including the `manifest` if any
+
+        Returns:
+            Dict of target name to `(file name, content)` result
+
+        """
+        if len(target_adapters) == 1:
+            [(target, target_adapter)] = target_adapters.items()
+            result = target_adapter.run(tables=tables, relationships=relationships, **kwargs)
+            if not kwargs.get("api"):
+                self._save_result(path=kwargs.get("output"), data=result)
+            return {target: result}
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(target_adapters), thread_name_prefix="dbterd-render") as pool:
+            futures = {
+                pool.submit(
+                    target_adapter.run,
+                    tables=tables,
+                    relationships=relationships,
+                    **{**kwargs, "target": target},
+                ): target
+                for target, target_adapter in target_adapters.items()
+            }
+            for future in as_completed(futures):
+                result = future.result()
+                results[futures[future]] = result
+                if not kwargs.get("api"):
+                    self._save_result(path=kwargs.get("output"), data=result)
+
+        return results
+
+    def _run_by_strategy(self, node_unique_id: Optional[str] = None, **kwargs) -> Union[str, dict[str, str]]:
+        """Local File - Read artifacts and export the diagram file following the target.
+
+        Multiple comma-separated targets share a single read and parse of the artifacts.
+        With `reuse_result`, the targets whose artifacts and options are unchanged since the
+        previous run get its result back as-is, see `result_cache`.
+
+        Returns:
+            ERD content, or a dict of target name to ERD content for multiple targets
+
+        """
         if kwargs.get("dbt_cloud"):
             DbtCloudArtifact(**kwargs).get(artifacts_dir=kwargs.get("artifacts_dir"))
 
-        policies = self._resolve_validation_policies(kwargs.get("relax_policies"))
-        manifest = self._read_manifest(
-            mp=kwargs.get("artifacts_dir"),
-            mv=kwargs.get("manifest_version"),
-            policies=policies,
-        )
-        catalog = self._read_catalog(
-            cp=kwargs.get("artifacts_dir"),
-            cv=kwargs.get("catalog_version"),
-            policies=policies,
-        )
+        targets = self._get_targets(**kwargs)
+        results: dict[str, tuple[str, str]] = {}
+        fingerprints: dict[str, str] = {}
+        if kwargs.get("reuse_result"):
+            for target in targets:
+                fingerprint = self._get_run_fingerprint(node_unique_id=node_unique_id, **{**kwargs, "target": target})
+                cached = load_cached_result(kwargs.get("output"), target)
+                if cached is not None and cached.fingerprint == fingerprint:
+                    logger.info(f"Artifacts and options are unchanged, reusing the previous [{target}] ERD")
+                    results[target] = cached.result
+                    if not kwargs.get("api"):
+                        self._save_result(path=kwargs.get("output"), data=cached.result)
+                fingerprints[target] = fingerprint
+
+        pending_targets = [target for target in targets if target not in results]
+        if pending_targets:
+            manifest, catalog = self.read_artifacts(**kwargs)
+            rendered = self._render_artifacts(
+                pending_targets, manifest, catalog, node_unique_id=node_unique_id, **kwargs
+            )
+            results.update(rendered)
+            for target in pending_targets:
+                if target in fingerprints:
+                    save_cached_result(
+                        kwargs.get("output"),
+                        target,
+                        CachedResult(fingerprint=fingerprints[target], result=rendered[target]),
+                    )
+
+        if len(targets) == 1:
+            return results[targets[0]][1]
+        return {target: results[target][1] for target in targets}
+
+    def _render_artifacts(
+        self, targets: list[str], manifest: Manifest, catalog, node_unique_id: Optional[str] = None, **kwargs
+    ) -> dict[str, tuple[str, str]]:
+        """Parse the loaded artifacts once, then render them to every target.
+
+        Returns:
+            Dict of target name to `(file name, content)` result
 
+        """
         if node_unique_id:
-            kwargs = self._set_single_node_selection(manifest=manifest, node_unique_id=node_unique_id, **kwargs)
+            kwargs = self._set_single_node_selection(
+                manifest=manifest, node_unique_id=node_unique_id, catalog=catalog, **kwargs
+            )
 
         # Load adapters
         algo_adapter = self.load_algo(name=kwargs["algo"])
-        target_adapter = self.load_target(name=kwargs["target"])
+        target_adapters = {target: self.load_target(name=target) for target in targets}
 
         # Parse artifacts to get tables and relationships
         tables, relationships = algo_adapter.parse(manifest=manifest, catalog=catalog, **kwargs)
 
         # Generate ERD content
-        result = target_adapter.run(tables=tables, relationships=relationships, manifest=manifest, **kwargs)
+        return self._render_targets(target_adapters, tables, relationships, manifest=manifest, **kwargs)
 
-        if not kwargs.get("api"):
-            self._save_result(path=kwargs.get("output"), data=result)
+    def _run_metadata_by_strategy(self, node_unique_id: Optional[str] = None, **kwargs) -> Union[str, dict[str, str]]:
+        """Metadata - Read artifacts and export the diagram file following the target.
 
-        return result[1]
+        Returns:
+            ERD content, or a dict of target name to ERD content for multiple targets
 
-    def _run_metadata_by_strategy(self, **kwargs) -> tuple[list[Table], list[Ref]]:
-        """Metadata - Read artifacts and export the diagram file following the target."""
+        """
+        targets = self._get_targets(**kwargs)
         data = DbtCloudMetadata(**kwargs).query_erd_data()
+        if node_unique_id:
+            kwargs = self._set_single_node_selection(
+                manifest=data, node_unique_id=node_unique_id, type="metadata", catalog="metadata", **kwargs
+            )
 
         # Load adapters
         algo_adapter = self.load_algo(name=kwargs["algo"])
-        target_adapter = self.load_target(name=kwargs["target"])
+        target_adapters = {target: self.load_target(name=target) for target in targets}
 
         # Parse metadata to get tables and relationships
         tables, relationships = algo_adapter.parse(manifest=data, catalog="metadata", **kwargs)
 
         # Generate ERD content
-        result = target_adapter.run(tables=tables, relationships=relationships, **kwargs)
+        results = self._render_targets(target_adapters, tables, relationships, **kwargs)
+
+        if len(targets) == 1:
+            return results[targets[0]][1]
+        return {target: results[target][1] for target in targets}
+
+    def _get_per_model_items(self, algo_adapter: BaseAlgoAdapter, manifest: Manifest, catalog, **kwargs):
+        """Get one batch item per selected model, with its related models like `get_model_erd`.
 
-        if not kwargs.get("api"):
-            self._save_result(path=kwargs.get("output"), data=result)
+        Args:
+            algo_adapter: Algo adapter
+            manifest: Manifest data
+            catalog: Catalog data
+            **kwargs: Run options, the selection filters the models
+
+        Returns:
+            List of BatchItem objects
+
+        """
+        tables, _ = algo_adapter.parse(manifest=manifest, catalog=catalog, **kwargs)
+        return [
+            BatchItem(
+                name=table.node_name,
+                select=self._get_related_nodes(
+                    algo_adapter, manifest, catalog, node_unique_id=table.node_name, **kwargs
+                ),
+            )
+            for table in tables
+            if table.resource_type == "model"
+        ]
+
+    def _run_batch_by_strategy(
+        self, selections: Optional[dict[str, list[str]]] = None, **kwargs
+    ) -> dict[str, Union[str, dict[str, str]]]:
+        """Local File - Read artifacts once and export one diagram file per batch item and target.
+
+        Returns:
+            Dict of batch item name to ERD content, or to a dict of target name to ERD content
+            for multiple targets
+
+        """
+        if kwargs.get("output_file_name"):
+            raise click.UsageError("`--output-file-name` can't be used in batch mode, files are named after the items")
+        selections = selections or {}
+        if not selections and not kwargs.get("per_model"):
+            raise click.UsageError("Nothing to generate, specify `--batch-select` and/or `--per-model`")
+        for rules in selections.values():
+            self._check_if_any_unsupported_selection(select=rules)
+
+        if kwargs.get("dbt_cloud"):
+            DbtCloudArtifact(**kwargs).get(artifacts_dir=kwargs.get("artifacts_dir"))
+
+        targets = self._get_targets(**kwargs)
+        manifest, catalog = self.read_artifacts(**kwargs)
+
+        # Load adapters
+        algo_adapter = self.load_algo(name=kwargs["algo"])
+        target_adapters = {target: self.load_target(name=target) for target in targets}
+
+        items = [
+            BatchItem(name=name, select=rules, exclude=kwargs.get("exclude") or [])
+            for name, rules in selections.items()
+        ]
+        if kwargs.get("per_model"):
+            items.extend(self._get_per_model_items(algo_adapter, manifest, catalog, **kwargs))
+        logger.info(f"Generating {len(items)} batch ERD(s) from a single artifacts load")
+
+        results = {}
+        for item, item_results in iter_batch_results(
+            items, manifest, catalog, algo_adapter=algo_adapter, target_adapters=target_adapters, **kwargs
+        ):
+            if not kwargs.get("api"):
+                for target in targets:
+                    self._save_result(path=kwargs.get("output"), data=item_results[target])
+            results[item.name] = (
+                item_results[targets[0]][1]
+                if len(targets) == 1
+                else {target: item_results[target][1] for target in targets}
+            )
 
-        return result[1]
+        return results
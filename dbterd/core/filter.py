@@ -1,6 +1,10 @@
-from fnmatch import fnmatch
+from collections.abc import Callable, Iterable
+import fnmatch
+from functools import lru_cache
+import os
+import re
 import sys
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from dbterd.core.models import Table
 
@@ -8,6 +12,16 @@ from dbterd.core.models import Table
 RULE_FUNC_PREFIX = "is_satisfied_by_"
 
 
+class SelectableNode(NamedTuple):
+    """Node attributes evaluated by the selection rules, cheap to get before building its Table."""
+
+    node_name: str
+    database: str
+    schema: str
+    resource_type: str
+    exposures: list[str]
+
+
 def has_unsupported_rule(
     rules: Optional[list[str]] = None,
 ) -> tuple[bool, Optional[str]]:
@@ -34,6 +48,198 @@ def has_unsupported_rule(
     return (False, None)
 
 
+class PrefixTrie:
+    """Set of prefixes, matching any string starting with one of them in a single walk of the string."""
+
+    _END = ""  # never a character key
+
+    def __init__(self, prefixes: Iterable[str] = ()) -> None:
+        self._root: dict = {}
+        for prefix in prefixes:
+            self.add(prefix)
+
+    def add(self, prefix: str) -> None:
+        """Add a prefix."""
+        node = self._root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node[self._END] = True
+
+    def __bool__(self) -> bool:
+        return bool(self._root)
+
+    def matches(self, value: str) -> bool:
+        """Check if the value starts with any of the prefixes."""
+        node = self._root
+        if self._END in node:
+            return True
+        for char in value:
+            node = node.get(char)
+            if node is None:
+                return False
+            if self._END in node:
+                return True
+        return False
+
+
+def _parse_rule_part(part: str) -> tuple[str, str]:
+    rule_parts = part.lower().split(":")
+    if len(rule_parts) > 1:
+        return rule_parts[0], rule_parts[1]
+    return "name", rule_parts[0]
+
+
+def _compile_rule_part(type: str, rule: str) -> Callable[[Table], bool]:
+    if type == "wildcard":
+        match = re.compile(fnmatch.translate(os.path.normcase(rule))).match
+        return lambda table: match(os.path.normcase(table.node_name)) is not None
+
+    rule_func = getattr(sys.modules[__name__], f"{RULE_FUNC_PREFIX}{type}")
+    return lambda table: rule_func(table=table, rule=rule)
+
+
+class CompiledRules:
+    """Selection or exclusion rules compiled once, then matched against many tables.
+
+    A table matches if it satisfies any rule (OR logic), and satisfies a rule if it
+    satisfies all the comma-separated parts of that rule (AND logic), like
+    `evaluate_rule`. Single-part rules are indexed by type: `exact` rules in a set,
+    `name` rules in a prefix trie, `wildcard` rules in one precompiled regex and
+    `exposure` rules in a set. The others are compiled to predicates.
+    """
+
+    def __init__(self, rules: Iterable[str] = ()) -> None:
+        """Compile the rules.
+
+        Args:
+            rules: Selection or exclusion rules
+
+        Raises:
+            AttributeError: Unsupported rule type, see `has_unsupported_rule`
+
+        """
+        self.rules = tuple(rules)
+        self.match_all = False
+        self.exact_names: set[str] = set()
+        self.name_prefixes = PrefixTrie()
+        self.exposures: set[str] = set()
+        self.predicates: list[tuple[Callable[[Table], bool], ...]] = []
+        wildcards = []
+
+        for rule in self.rules:
+            parts = [_parse_rule_part(part) for part in rule.split(",")]
+            parts = [(type, value) for type, value in parts if value]  # empty rules are always satisfied
+            if not parts:
+                self.match_all = True
+            elif len(parts) > 1:
+                self.predicates.append(tuple(_compile_rule_part(type, value) for type, value in parts))
+            elif parts[0][0] == "exact":
+                self.exact_names.add(parts[0][1])
+            elif parts[0][0] == "name":
+                self.name_prefixes.add(parts[0][1])
+            elif parts[0][0] == "wildcard":
+                wildcards.append(fnmatch.translate(os.path.normcase(parts[0][1])))
+            elif parts[0][0] == "exposure":
+                self.exposures.add(parts[0][1])
+            else:
+                self.predicates.append((_compile_rule_part(*parts[0]),))
+
+        self.wildcard_match = re.compile("|".join(f"(?:{x})" for x in wildcards)).match if wildcards else None
+
+    def __bool__(self) -> bool:
+        return bool(self.rules)
+
+    def matches(self, table: Table) -> bool:
+        """Check if the table satisfies any of the rules.
+
+        Args:
+            table: Table object, or any object having its `node_name`, `database`, `schema`
+                and `exposures` attributes
+
+        Returns:
+            bool: True if satisfied
+
+        """
+        if self.match_all:
+            return True
+        node_name = table.node_name
+        if self.exact_names and node_name.lower() in self.exact_names:
+            return True
+        if self.name_prefixes and self.name_prefixes.matches(node_name):
+            return True
+        if self.wildcard_match is not None and self.wildcard_match(os.path.normcase(node_name)) is not None:
+            return True
+        if self.exposures and not self.exposures.isdisjoint(table.exposures or ()):
+            return True
+        return any(all(part(table) for part in parts) for parts in self.predicates)
+
+
+class CompiledSelection:
+    """Selection criteria (select, exclude and resource types) compiled once, see `CompiledRules`."""
+
+    def __init__(
+        self,
+        select_rules: Optional[Iterable[str]] = None,
+        exclude_rules: Optional[Iterable[str]] = None,
+        resource_types: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Compile the selection criteria.
+
+        Args:
+            select_rules: Selection rules. Defaults to [] (all).
+            exclude_rules: Exclusion rules. Defaults to [].
+            resource_types: Selected resource types. Defaults to ["model"], [] means all.
+
+        """
+        self.select = CompiledRules(select_rules or [])
+        self.exclude = CompiledRules(exclude_rules or [])
+        self.resource_types = frozenset(["model"] if resource_types is None else resource_types)
+
+    @property
+    def selects_all(self) -> bool:
+        """Whether every table is selected, without evaluating any of them."""
+        return not (self.resource_types or self.select or self.exclude)
+
+    def is_selected(self, table: Table) -> bool:
+        """Check if the table is selected and not excluded."""
+        if self.resource_types and table.resource_type not in self.resource_types:
+            return False
+        if self.select and not self.select.matches(table):
+            return False
+        return not (self.exclude and self.exclude.matches(table))
+
+
+@lru_cache(maxsize=128)
+def _compile_selection(
+    select_rules: tuple[str, ...], exclude_rules: tuple[str, ...], resource_types: Optional[tuple[str, ...]]
+) -> CompiledSelection:
+    return CompiledSelection(select_rules, exclude_rules, resource_types)
+
+
+def compile_selection(
+    select_rules: Optional[Iterable[str]] = None,
+    exclude_rules: Optional[Iterable[str]] = None,
+    resource_types: Optional[Iterable[str]] = None,
+) -> CompiledSelection:
+    """
+    Compile the selection criteria, reusing the previous compilation of the same criteria.
+
+    Args:
+        select_rules (List[str]): Selection rules. Defaults to [].
+        exclude_rules (List[str], optional): Exclusion rules. Defaults to [].
+        resource_types (List[str], optional): Selected resource types. Defaults to ["model"].
+
+    Returns:
+        CompiledSelection: Compiled selection criteria
+
+    """
+    return _compile_selection(
+        tuple(select_rules or []),
+        tuple(exclude_rules or []),
+        None if resource_types is None else tuple(resource_types),
+    )
+
+
 def is_selected_table(
     table: Table,
     select_rules: Optional[list[str]] = None,
@@ -43,6 +249,8 @@ def is_selected_table(
     """
     Check if Table is selected with defined selection criteria.
 
+    Prefer `compile_selection` to check many tables against the same criteria.
+
     Args:
         table (Table): Table object
         select_rules (List[str]): Selection rules. Defaults to [].
@@ -53,25 +261,7 @@ def is_selected_table(
         bool: True if Table is selected. False if Tables is excluded
 
     """
-    # Selection
-    if resource_types is None:
-        resource_types = ["model"]
-    if exclude_rules is None:
-        exclude_rules = []
-    if select_rules is None:
-        select_rules = []
-    selected = True
-    if select_rules:
-        selected = any(evaluate_rule(table=table, rule=rule) for rule in select_rules)
-    if resource_types:
-        selected = selected and table.resource_type in resource_types
-
-    # Exclusion
-    excluded = False
-    if exclude_rules:
-        excluded = any(evaluate_rule(table=table, rule=rule) for rule in exclude_rules)
-
-    return selected and not excluded
+    return compile_selection(select_rules, exclude_rules, resource_types).is_selected(table)
 
 
 def evaluate_rule(table: Table, rule: str) -> bool:
@@ -86,19 +276,7 @@ def evaluate_rule(table: Table, rule: str) -> bool:
         bool: True if satisfied all rules
 
     """
-    and_parts = rule.split(",")
-    results = []
-    for x in and_parts:
-        rule_parts = x.lower().split(":")
-        type, rule = "name", rule_parts[0]
-        if len(rule_parts) > 1:
-            type, rule = tuple(rule_parts[:2])
-
-        rule_func = f"{RULE_FUNC_PREFIX}{type}"
-        selected_func = getattr(sys.modules[__name__], rule_func)
-        results.append(selected_func(table=table, rule=rule))
-
-    return all(results)
+    return CompiledRules([rule]).matches(table)
 
 
 def is_satisfied_by_name(table: Table, rule: str = "") -> bool:
@@ -170,7 +348,7 @@ def is_satisfied_by_wildcard(table: Table, rule: str = "*") -> bool:
     """
     if not rule:
         return True
-    return fnmatch(table.node_name, rule)
+    return fnmatch.fnmatch(table.node_name, rule)
 
 
 def is_satisfied_by_exposure(table: Table, rule: str = "") -> bool:
@@ -0,0 +1,145 @@
+"""Graph of the parsed relationships, between manifest node unique IDs.
+
+Built once from an algo parse or a manifest index, whatever the algo and the
+artifact source, it answers the graph queries (neighbours, degree, the models
+within N relationship hops of a model, connected components) without rescanning
+the relationships.
+
+The neighbours of each node are kept in insertion order (a dict used as an
+ordered set), so that the query results don't depend on string hashing.
+"""
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+from dbterd.core.models import Ref, Table
+
+
+class RelationshipGraph:
+    """Undirected adjacency of node unique IDs linked by a relationship."""
+
+    def __init__(self, edges: Iterable[tuple[str, str]] = (), nodes: Iterable[str] = ()) -> None:
+        """Initialize the graph.
+
+        Duplicated edges, in either direction, are merged. An edge from a node to
+        itself makes the node its own neighbour.
+
+        Args:
+            edges: Pairs of linked node unique IDs
+            nodes: Node unique IDs to include even when not linked
+
+        """
+        adjacency: dict[str, dict[str, None]] = {node: {} for node in nodes}
+        for node, other in edges:  # `add_edge`, inlined
+            adjacency.setdefault(node, {})[other] = None
+            adjacency.setdefault(other, {})[node] = None
+        self._adjacency = adjacency
+
+    @classmethod
+    def from_parsed(cls, tables: list[Table], relationships: list[Ref]) -> "RelationshipGraph":
+        """Build the graph of an algo parse result.
+
+        The parsed relationships refer to the table names (see `entity_name_format`),
+        mapped back to the table node unique IDs. Every table is a node of the graph.
+
+        Args:
+            tables: Parsed tables
+            relationships: Parsed relationships
+
+        Returns:
+            RelationshipGraph object
+
+        """
+        node_names: dict[str, list[str]] = {}
+        for table in tables:
+            node_names.setdefault(table.name, []).append(table.node_name)
+
+        edges = (
+            (to_node, from_node)
+            for relationship in relationships
+            for to_node in node_names.get(relationship.table_map[0], ())
+            for from_node in node_names.get(relationship.table_map[1], ())
+        )
+        return cls(edges, nodes=(table.node_name for table in tables))
+
+    def __len__(self) -> int:
+        return len(self._adjacency)
+
+    def __contains__(self, node: str) -> bool:
+        return node in self._adjacency
+
+    def add_edge(self, node: str, other: str) -> None:
+        """Link two nodes, both ways."""
+        self._adjacency.setdefault(node, {})[other] = None
+        self._adjacency.setdefault(other, {})[node] = None
+
+    @property
+    def edge_count(self) -> int:
+        """Number of distinct edges."""
+        links = sum(len(neighbours) for neighbours in self._adjacency.values())
+        self_links = sum(node in neighbours for node, neighbours in self._adjacency.items())
+        return (links + self_links) // 2
+
+    def edges(self) -> Iterator[tuple[str, str]]:
+        """Iterate over the distinct edges, each once, from the node added first."""
+        order = {node: idx for idx, node in enumerate(self._adjacency)}
+        for node, neighbours in self._adjacency.items():
+            for other in sorted(neighbours, key=order.__getitem__):
+                if order[node] <= order[other]:
+                    yield node, other
+
+    def degree(self, node: str) -> int:
+        """Get the number of distinct neighbours of a node, 0 for an unknown node."""
+        return len(self._adjacency.get(node, ()))
+
+    def neighbours(self, node: str) -> set[str]:
+        """Get the nodes linked to a node, empty for an unknown node."""
+        return set(self._adjacency.get(node, ()))
+
+    def neighbourhood(self, node: str, depth: int = 1) -> list[str]:
+        """Get the nodes within `depth` relationship hops of a node, breadth-first.
+
+        Args:
+            node: Node unique ID
+            depth: Maximum number of hops, 0 for the node alone
+
+        Returns:
+            List of node unique IDs, the node first, then by increasing distance
+
+        """
+        found = {node: 0}
+        queue = deque([node])
+        while queue:
+            current = queue.popleft()
+            distance = found[current]
+            if distance >= depth:
+                continue
+            for neighbour in self._adjacency.get(current, ()):
+                if neighbour not in found:
+                    found[neighbour] = distance + 1
+                    queue.append(neighbour)
+        return list(found)
+
+    def components(self) -> list[list[str]]:
+        """Get the connected components of the graph.
+
+        Returns:
+            List of components, each a list of node unique IDs in insertion order,
+            ordered by their first node
+
+        """
+        order = {node: idx for idx, node in enumerate(self._adjacency)}
+        seen: set[str] = set()
+        components = []
+        for start in self._adjacency:
+            if start in seen:
+                continue
+            seen.add(start)
+            component = [start]
+            for current in component:  # grows while iterated, breadth-first
+                for neighbour in self._adjacency[current]:
+                    if neighbour not in seen:
+                        seen.add(neighbour)
+                        component.append(neighbour)
+            components.append(sorted(component, key=order.__getitem__))
+        return components
@@ -0,0 +1,75 @@
+"""Indexes derived from a loaded manifest, built once per manifest object.
+
+Algos scanning the whole manifest for every query (e.g. the relationship tests
+of a single model) build an index instead, cached here so that the following
+parses of the same manifest, like in a `DbtErdSession`, the `serve` command or a
+batch, reuse it. Manifests are unhashable models: entries are keyed by identity
+and dropped once the manifest is garbage collected. A manifest is expected not to
+change once loaded.
+"""
+
+from collections.abc import Callable, Hashable
+import threading
+from typing import Any, TypeVar
+import weakref
+
+
+T = TypeVar("T")
+
+
+class ManifestIndexCache:
+    """Cache of the indexes built from manifest objects, see module docstring."""
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._entries: dict[int, tuple[weakref.ref, dict[Hashable, Any]]] = {}
+        # Re-entrant: a manifest may be collected, calling `_discard`, while the lock is held
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _discard(self, key: int, ref: weakref.ref) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is ref:
+                del self._entries[key]
+
+    def get(self, manifest: Any, key: Hashable, build: Callable[[], T]) -> T:
+        """Get an index of the manifest, building it on the first call.
+
+        Args:
+            manifest: Loaded manifest, not cached if it cannot be weakly referenced
+            key: Index key, unique per kind of index and its parameters
+            build: Function building the index
+
+        Returns:
+            The index
+
+        """
+        manifest_id = id(manifest)
+        with self._lock:
+            entry = self._entries.get(manifest_id)
+            if entry is not None and entry[0]() is manifest and key in entry[1]:
+                return entry[1][key]
+
+        index = build()
+        try:
+            ref = weakref.ref(manifest, lambda ref: self._discard(manifest_id, ref))
+        except TypeError:
+            return index
+
+        with self._lock:
+            entry = self._entries.get(manifest_id)
+            if entry is None or entry[0]() is not manifest:
+                entry = (ref, {})
+                self._entries[manifest_id] = entry
+            return entry[1].setdefault(key, index)
+
+    def clear(self) -> None:
+        """Drop every cached index."""
+        with self._lock:
+            self._entries.clear()
+
+
+manifest_indexes = ManifestIndexCache()
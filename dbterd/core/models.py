@@ -1,9 +1,33 @@
-from dataclasses import dataclass, field
+from collections.abc import Callable
+from dataclasses import InitVar, dataclass, field
 from enum import Enum
-from typing import Optional
+import sys
+from typing import Any, Optional, Union
 
 
-@dataclass
+class ColumnSource(Enum):
+    """Where a parsed Column was found."""
+
+    CATALOG = "catalog"
+    MANIFEST = "manifest"
+    BOTH = "both"
+    RELATIONSHIP = "relationship"
+
+
+def intern(value: Any) -> Any:
+    """Intern a string, so that its repeated values (data types, schemas...) share one object.
+
+    Args:
+        value: Any value, only strings are interned
+
+    Returns:
+        The interned string, or the value as-is
+
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class Column:
     """Parsed Column object."""
 
@@ -11,25 +35,56 @@ class Column:
     data_type: str = "unknown"
     description: str = ""
     is_primary_key: bool = False
+    source: Optional[ColumnSource] = field(default=None, compare=False)
 
+    def __post_init__(self) -> None:
+        self.data_type = intern(self.data_type)
 
-@dataclass
+
+@dataclass(slots=True)
 class Table:
-    """Parsed Table object."""
+    """Parsed Table object.
+
+    `raw_sql` can be given a callable returning the SQL instead, called on first access
+    only (e.g. as the compiled SQL is only read by the json target). It's an init argument
+    and a property rather than a field, held unresolved in `_raw_sql`: it's left out of
+    eq/repr, not to resolve it as a side effect.
+    """
 
     name: str
     database: str
     schema: str
     columns: Optional[list[Column]] = None
-    raw_sql: Optional[str] = None
+    raw_sql: InitVar[Union[Optional[str], Callable[[], Optional[str]]]] = None
     resource_type: str = "model"
     exposures: list[str] = field(default_factory=list)
     node_name: Optional[str] = None
     description: str = ""
     label: Optional[str] = None
+    _raw_sql: Union[Optional[str], Callable[[], Optional[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self, raw_sql: Union[Optional[str], Callable[[], Optional[str]]]) -> None:
+        self.database = intern(self.database)
+        self.schema = intern(self.schema)
+        self.resource_type = intern(self.resource_type)
+        self._raw_sql = raw_sql
+
+    def _get_raw_sql(self) -> Optional[str]:
+        if callable(self._raw_sql):
+            self._raw_sql = self._raw_sql()
+        return self._raw_sql
+
+    def _set_raw_sql(self, value: Union[Optional[str], Callable[[], Optional[str]]]) -> None:
+        self._raw_sql = value
+
+
+# Set once the (slotted) dataclass is built, as the class attribute is the `raw_sql` init default until then
+Table.raw_sql = property(Table._get_raw_sql, Table._set_raw_sql, doc="SQL of the table, resolved on first access")
 
 
-@dataclass
+@dataclass(slots=True)
 class Ref:
     """Parsed Relationship object."""
 
@@ -40,7 +95,7 @@ class Ref:
     relationship_label: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SemanticEntity:
     """Parsed Semantic Model's Entity object."""
 
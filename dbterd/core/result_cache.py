@@ -0,0 +1,132 @@
+"""Result cache of the ERD generation.
+
+The rendered result of a run is kept per target next to the ERD output, with a
+fingerprint of the run inputs: manifest/catalog content hashes, every run option
+and the installed dbterd, artifact parser and plugin versions. When the next run
+has the same fingerprint, the previous result is reused as-is, without reading,
+parsing or rendering anything. This is not incremental: any change of the inputs,
+however small, regenerates the whole ERD.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+import hashlib
+import importlib.metadata
+from pathlib import Path
+import pickle
+from typing import Any, Optional
+
+from dbterd.helpers.artifact_cache import FINGERPRINT_PACKAGES, file_digest, package_version
+from dbterd.helpers.log import logger
+
+
+CACHED_RESULT_FILE = ".dbterd_result.{target}.pickle"
+# Options that never change the generated ERD
+FINGERPRINT_IGNORED_OPTIONS = ("reuse_result", "no_cache")
+# Entry-point groups of the external plugins, see `Executor` and `validation_policy`
+PLUGIN_ENTRY_POINT_GROUPS = ("dbterd.adapters", "dbterd.relax_policies")
+
+
+@dataclass
+class CachedResult:
+    """Result of a previous run, see module docstring.
+
+    Attributes:
+        fingerprint: Fingerprint of the run inputs, see `run_fingerprint`
+        result: Rendered `(file name, content)` result of the target
+    """
+
+    fingerprint: str
+    result: tuple[str, str]
+
+
+def _iter_plugin_entry_points(group: str):
+    try:
+        return importlib.metadata.entry_points(group=group)
+    except TypeError:
+        # Python < 3.12: entry_points() doesn't accept keyword arguments
+        return importlib.metadata.entry_points().get(group, [])
+
+
+def installed_versions() -> list[str]:
+    """Get the installed versions of the packages rendering the ERD.
+
+    These are dbterd, the artifact parsing dependencies (see `FINGERPRINT_PACKAGES`) and the
+    distributions of the external plugins: upgrading any of them may change the ERD of the
+    same artifacts and options.
+
+    Returns:
+        Sorted `name==version` strings
+    """
+    packages = set(FINGERPRINT_PACKAGES)
+    for group in PLUGIN_ENTRY_POINT_GROUPS:
+        for entry_point in _iter_plugin_entry_points(group):
+            dist = getattr(entry_point, "dist", None)
+            if dist is not None:
+                packages.add(dist.name)
+    return [f"{name}=={package_version(name)}" for name in sorted(packages)]
+
+
+def run_fingerprint(artifact_paths: Iterable[str], **kwargs: Any) -> str:
+    """Fingerprint the inputs of a run, including the installed versions, see `installed_versions`.
+
+    Args:
+        artifact_paths: Artifact file paths, their content is hashed
+        **kwargs: Run options; `FINGERPRINT_IGNORED_OPTIONS` are left out
+
+    Returns:
+        Hex digest fingerprint
+
+    """
+    parts = [file_digest(path) for path in artifact_paths]
+    parts.extend(installed_versions())
+    parts.extend(
+        f"{name}={value!r}" for name, value in sorted(kwargs.items()) if name not in FINGERPRINT_IGNORED_OPTIONS
+    )
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def get_cached_result_path(output_dir: str, target: str) -> Path:
+    """Get the cached result file path, one per target in the ERD output directory."""
+    return Path(output_dir) / CACHED_RESULT_FILE.format(target=target)
+
+
+def load_cached_result(output_dir: str, target: str) -> Optional[CachedResult]:
+    """Load the result of the previous run, if any.
+
+    Args:
+        output_dir: ERD output directory
+        target: Target name
+
+    Returns:
+        CachedResult object, None if missing or unreadable
+
+    """
+    path = get_cached_result_path(output_dir, target)
+    try:
+        with open(path, "rb") as handle:
+            cached = pickle.load(handle)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable cached result {path}: {e}")
+        return None
+
+    return cached if isinstance(cached, CachedResult) else None
+
+
+def save_cached_result(output_dir: str, target: str, cached: CachedResult) -> None:
+    """Persist the result of the run. Failing to write it is not fatal and only logged.
+
+    Args:
+        output_dir: ERD output directory
+        target: Target name
+        cached: CachedResult object
+
+    """
+    path = get_cached_result_path(output_dir, target)
+    try:
+        with open(path, "wb") as handle:
+            pickle.dump(cached, handle, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        logger.warning(f"Could not write the cached result {path}: {e}")
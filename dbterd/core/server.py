@@ -0,0 +1,272 @@
+"""Local HTTP ERD server.
+
+Serves ERDs from artifacts held in memory by an `ArtifactSession`:
+
+- ``GET /erd?target=mermaid&select=...&exclude=...&resource_type=...``: the whole project ERD,
+  `select`/`exclude`/`resource_type` may be repeated
+- ``GET /model/<unique_id>?target=mermaid&depth=2``: a model ERD, like `get_model_erd`
+
+Requests never touch the artifact files: a background watcher checks them every
+``reload_interval`` seconds and swaps in the freshly loaded artifacts atomically,
+while requests keep being served from the previous ones.
+Rendered responses are cached and tagged with an ETag derived from the artifacts
+content hash and the request, so `If-None-Match` revalidation costs no rendering.
+Requests are handled concurrently, one thread each.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+import hashlib
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+from typing import Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import click
+
+from dbterd.core.executor import Executor
+from dbterd.core.registry.plugin_registry import PluginRegistry
+from dbterd.core.session import ArtifactSnapshot
+from dbterd.helpers import json_codec
+from dbterd.helpers.log import logger
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8581
+DEFAULT_RELOAD_INTERVAL = 2.0
+DEFAULT_CACHE_SIZE = 256
+# Query string params overriding the served params, and whether they can be repeated
+SERVE_QUERY_PARAMS = {"target": False, "select": True, "exclude": True, "resource_type": True, "depth": False}
+CONTENT_TYPES = {".json": "application/json", ".md": "text/markdown; charset=utf-8"}
+DEFAULT_CONTENT_TYPE = "text/plain; charset=utf-8"
+
+
+@dataclass(frozen=True)
+class ErdResponse:
+    """Rendered HTTP response."""
+
+    status: int
+    body: bytes
+    content_type: str = DEFAULT_CONTENT_TYPE
+    etag: Optional[str] = None
+
+
+class ErdResponseCache:
+    """Thread-safe LRU cache of the rendered responses, keyed by ETag."""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, ErdResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, etag: str) -> Optional[ErdResponse]:
+        """Get a cached response, refreshing its recency."""
+        with self._lock:
+            response = self._entries.get(etag)
+            if response is not None:
+                self._entries.move_to_end(etag)
+            return response
+
+    def put(self, response: ErdResponse) -> None:
+        """Cache a response, evicting the least recently used ones over the limit."""
+        with self._lock:
+            self._entries[response.etag] = response
+            self._entries.move_to_end(response.etag)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def _error(status: HTTPStatus, message: str) -> ErdResponse:
+    return ErdResponse(status=status, body=f"{message}\n".encode())
+
+
+class ErdServer(ThreadingHTTPServer):
+    """HTTP server of ERDs, see module docstring."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        executor: Executor,
+        params: dict,
+        *,
+        address: tuple[str, int] = (DEFAULT_HOST, DEFAULT_PORT),
+        reload_interval: float = DEFAULT_RELOAD_INTERVAL,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        """Initialize the server, loading the artifacts.
+
+        Args:
+            executor: Executor rendering the ERDs
+            params: Evaluated options, the defaults of every request
+            address: `(host, port)` to listen on
+            reload_interval: Seconds between two checks of the artifact files, no watcher if 0
+            cache_size: Maximum number of cached responses
+
+        """
+        self.executor = executor
+        self.params = {**params, "api": True}
+        self.session = executor.open_session(**self.params)
+        self.session.latest()
+        self.reload_interval = reload_interval
+        self.cache = ErdResponseCache(max_entries=cache_size)
+        self._stopped = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+        super().__init__(address, ErdRequestHandler)
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(self.reload_interval):
+            try:
+                self.session.current()
+            except Exception as e:
+                logger.warning(f"Could not reload the artifacts, keep serving the previous ones: {e}")
+
+    def start_watcher(self) -> None:
+        """Start checking the artifact files for changes in the background."""
+        if self.reload_interval and self._watcher is None:
+            self._watcher = threading.Thread(target=self._watch, name="dbterd-watcher", daemon=True)
+            self._watcher.start()
+
+    def server_close(self) -> None:
+        """Stop the watcher, then close the server."""
+        self._stopped.set()
+        super().server_close()
+
+    @staticmethod
+    def _etag(snapshot: ArtifactSnapshot, route: str, query: dict) -> str:
+        parts = [*(digest or "" for digest in snapshot.digests), route]
+        parts.extend(f"{name}={value!r}" for name, value in sorted(query.items()))
+        digest = hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+        return f'"{digest[:32]}"'
+
+    @staticmethod
+    def _query(query_string: str) -> dict:
+        query = {}
+        for name, values in parse_qs(query_string).items():
+            if name in SERVE_QUERY_PARAMS:
+                query[name] = values if SERVE_QUERY_PARAMS[name] else values[-1]
+        return query
+
+    def render(self, path: str, if_none_match: Optional[str] = None) -> ErdResponse:
+        """Render the response of a request.
+
+        Args:
+            path: Request path, with its query string
+            if_none_match: `If-None-Match` request header
+
+        Returns:
+            ErdResponse object
+
+        """
+        url = urlsplit(path)
+        route = url.path.rstrip("/")
+        node_unique_id = None
+        if route.startswith("/model/"):
+            node_unique_id = unquote(route[len("/model/") :])
+        elif route != "/erd":
+            return _error(HTTPStatus.NOT_FOUND, f"Unknown path: {url.path}, use /erd or /model/<unique_id>")
+
+        snapshot = self.session.latest()
+        query = self._query(url.query)
+        etag = self._etag(snapshot, route, query)
+        if if_none_match and etag in {tag.strip() for tag in if_none_match.split(",")}:
+            return ErdResponse(status=HTTPStatus.NOT_MODIFIED, body=b"", etag=etag)
+        cached = self.cache.get(etag)
+        if cached is not None:
+            return cached
+
+        if node_unique_id and not any(
+            node_unique_id in (getattr(snapshot.manifest, section, None) or {}) for section in ("nodes", "sources")
+        ):
+            return _error(HTTPStatus.NOT_FOUND, f"Unknown node: {node_unique_id}")
+
+        response = self._render_erd(snapshot, node_unique_id=node_unique_id, params={**self.params, **query})
+        if response.status == HTTPStatus.OK:
+            response = replace(response, etag=etag)
+            self.cache.put(response)
+        return response
+
+    def _render_erd(self, snapshot: ArtifactSnapshot, node_unique_id: Optional[str], params: dict) -> ErdResponse:
+        try:
+            result = self.executor.run_artifacts(
+                snapshot.manifest, snapshot.catalog, node_unique_id=node_unique_id, **params
+            )
+        except click.UsageError as e:
+            return _error(HTTPStatus.BAD_REQUEST, e.message)
+        except KeyError as e:  # unknown target or algo
+            return _error(HTTPStatus.BAD_REQUEST, str(e.args[0]) if e.args else str(e))
+
+        if isinstance(result, dict):
+            return ErdResponse(
+                status=HTTPStatus.OK, body=json_codec.dumps(result).encode(), content_type="application/json"
+            )
+
+        target = str(params["target"]).split(",")[0].strip()
+        content_type = CONTENT_TYPES.get(PluginRegistry.get_target(target).file_extension, DEFAULT_CONTENT_TYPE)
+        return ErdResponse(status=HTTPStatus.OK, body=result.encode("utf-8"), content_type=content_type)
+
+
+class ErdRequestHandler(BaseHTTPRequestHandler):
+    """Request handler of `ErdServer`."""
+
+    server: ErdServer
+
+    def do_GET(self) -> None:
+        """Serve an ERD."""
+        try:
+            response = self.server.render(self.path, if_none_match=self.headers.get("If-None-Match"))
+        except Exception as e:
+            logger.error(f"Could not render {self.path}: {e}")
+            response = _error(HTTPStatus.INTERNAL_SERVER_ERROR, "Could not render the ERD")
+
+        self.send_response(response.status)
+        if response.etag:
+            self.send_header("ETag", response.etag)
+            self.send_header("Cache-Control", "no-cache")
+        if response.status != HTTPStatus.NOT_MODIFIED:
+            self.send_header("Content-Type", response.content_type)
+            self.send_header("Content-Length", str(len(response.body)))
+        self.end_headers()
+        if response.status != HTTPStatus.NOT_MODIFIED:
+            self.wfile.write(response.body)
+
+    def log_message(self, format: str, *args) -> None:
+        """Log the requests at debug level."""
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+def serve(
+    executor: Executor,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    reload_interval: float = DEFAULT_RELOAD_INTERVAL,
+    **kwargs,
+) -> None:
+    """Serve ERDs until interrupted.
+
+    Args:
+        executor: Executor rendering the ERDs
+        host: Host to listen on
+        port: Port to listen on
+        reload_interval: Seconds between two checks of the artifact files, no watcher if 0
+        **kwargs: Options similar to the `dbterd run` ones
+
+    """
+    server = ErdServer(
+        executor, executor.evaluate_kwargs(**kwargs), address=(host, port), reload_interval=reload_interval
+    )
+    server.start_watcher()
+    logger.info(f"Serving ERDs at http://{host}:{server.server_port}/erd (Press CTRL+C to quit)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,138 @@
+"""In-memory session of loaded dbt artifacts.
+
+An `ArtifactSession` keeps the loaded manifest/catalog in memory between queries.
+Before answering, it checks the artifact files for changes: a cheap `stat`
+(mtime and size) first, then only when that changed, the content hash, so a
+touched but identical file does not trigger a reload. Changed artifacts are
+reloaded and swapped in as a new snapshot, under a lock so that concurrent
+queries share a single reload.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+import os
+import threading
+from typing import Any, Optional
+
+from dbterd.helpers.artifact_cache import file_digest
+from dbterd.helpers.log import logger
+
+
+FileStat = tuple[int, int]
+
+
+@dataclass(frozen=True)
+class ArtifactSnapshot:
+    """Artifacts loaded at a point in time.
+
+    Attributes:
+        manifest: Loaded manifest
+        catalog: Loaded catalog
+        version: Load counter of the session, bumped on every reload
+        stats: `(mtime_ns, size)` of each artifact file when loaded
+        digests: Content hash of each artifact file when loaded
+    """
+
+    manifest: Any
+    catalog: Any
+    version: int
+    stats: tuple[Optional[FileStat], ...]
+    digests: tuple[Optional[str], ...]
+
+
+def _file_stat(path: str) -> Optional[FileStat]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _file_digest(path: str) -> Optional[str]:
+    try:
+        return file_digest(path)
+    except OSError:
+        return None
+
+
+class ArtifactSession:
+    """Loaded artifacts reloaded on change, see module docstring.
+
+    Example:
+        session = ArtifactSession(loader=lambda: read(...), paths=["target/manifest.json", "target/catalog.json"])
+        manifest, catalog = session.current().manifest, session.current().catalog
+
+    """
+
+    def __init__(self, loader: Callable[[], tuple[Any, Any]], paths: list[str]) -> None:
+        """Initialize the session, the artifacts are loaded on the first query.
+
+        Args:
+            loader: Function loading the artifacts, returning `(manifest, catalog)`
+            paths: Artifact file paths watched for changes
+
+        """
+        self.loader = loader
+        self.paths = list(paths)
+        self._snapshot: Optional[ArtifactSnapshot] = None
+        self._lock = threading.Lock()
+
+    def _stats(self) -> tuple[Optional[FileStat], ...]:
+        return tuple(_file_stat(path) for path in self.paths)
+
+    def _digests(self) -> tuple[Optional[str], ...]:
+        return tuple(_file_digest(path) for path in self.paths)
+
+    def _load(
+        self, stats: tuple[Optional[FileStat], ...], digests: Optional[tuple[Optional[str], ...]] = None
+    ) -> ArtifactSnapshot:
+        # Hashed before loading: a file changing while loaded gets another stat, then another hash
+        digests = digests or self._digests()
+        manifest, catalog = self.loader()
+        version = self._snapshot.version + 1 if self._snapshot else 1
+        return ArtifactSnapshot(manifest=manifest, catalog=catalog, version=version, stats=stats, digests=digests)
+
+    def current(self) -> ArtifactSnapshot:
+        """Get the loaded artifacts, reloading them first if their files changed.
+
+        Returns:
+            ArtifactSnapshot object
+
+        """
+        stats = self._stats()
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.stats == stats:
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None:
+                self._snapshot = self._load(stats)
+            elif snapshot.stats != stats:
+                digests = self._digests()
+                if digests == snapshot.digests:
+                    self._snapshot = replace(snapshot, stats=stats)
+                else:
+                    logger.info("Artifacts changed, reloading them")
+                    self._snapshot = self._load(stats, digests)
+            return self._snapshot
+
+    def latest(self) -> ArtifactSnapshot:
+        """Get the loaded artifacts without checking their files, loading them on the first call.
+
+        Returns:
+            ArtifactSnapshot object
+
+        """
+        return self._snapshot or self.current()
+
+    def reload(self) -> ArtifactSnapshot:
+        """Force reloading the artifacts.
+
+        Returns:
+            ArtifactSnapshot object
+
+        """
+        with self._lock:
+            self._snapshot = self._load(self._stats())
+            return self._snapshot
@@ -1,9 +1,8 @@
-import json
 import os
 from pathlib import Path
 from typing import Optional
 
-from dbterd.helpers.file import extract_artifact_version_from_file
+from dbterd.helpers.file import sniff_artifact_version
 
 
 def default_artifact_path() -> str:
@@ -97,6 +96,30 @@ def default_artifacts_dir() -> str:
     return os.environ.get("DBTERD_ARTIFACTS_DIR", "")
 
 
+def default_manifest_projection() -> bool:
+    return os.environ.get("DBTERD_MANIFEST_PROJECTION", "false").lower() in ["true", "yes", "1"]
+
+
+def default_no_cache() -> bool:
+    return os.environ.get("DBTERD_NO_CACHE", "false").lower() in ["true", "yes", "1"]
+
+
+def default_reuse_result() -> bool:
+    return os.environ.get("DBTERD_REUSE_RESULT", "false").lower() in ["true", "yes", "1"]
+
+
+def default_batch_workers() -> int:
+    return int(os.environ.get("DBTERD_BATCH_WORKERS", "1"))
+
+
+def default_serve_host() -> str:
+    return os.environ.get("DBTERD_SERVE_HOST", "127.0.0.1")
+
+
+def default_serve_port() -> int:
+    return int(os.environ.get("DBTERD_SERVE_PORT", "8581"))
+
+
 def default_init_template() -> str:
     return os.environ.get("DBTERD_INIT_TEMPLATE", "dbt-core")
 
@@ -125,12 +148,8 @@ def default_manifest_version(artifacts_dir: Optional[str] = None) -> Optional[st
 
     if manifest_path.exists():
         try:
-            with open(manifest_path, encoding="utf-8") as f:
-                manifest_data = json.load(f)
-                if "metadata" in manifest_data and "dbt_schema_version" in manifest_data["metadata"]:
-                    schema_version = manifest_data["metadata"]["dbt_schema_version"]
-                    return extract_artifact_version_from_file(schema_version)
-        except (json.JSONDecodeError, KeyError, OSError):
+            return sniff_artifact_version(manifest_path)
+        except OSError:
             pass
 
     return None
@@ -156,12 +175,8 @@ def default_catalog_version(artifacts_dir: Optional[str] = None) -> Optional[str
 
     if catalog_path.exists():
         try:
-            with open(catalog_path, encoding="utf-8") as f:
-                catalog_data = json.load(f)
-                if "metadata" in catalog_data and "dbt_schema_version" in catalog_data["metadata"]:
-                    schema_version = catalog_data["metadata"]["dbt_schema_version"]
-                    return extract_artifact_version_from_file(schema_version)
-        except (json.JSONDecodeError, KeyError, OSError):
+            return sniff_artifact_version(catalog_path)
+        except OSError:
             pass
 
     return None
@@ -0,0 +1,227 @@
+"""On-disk cache of parsed dbt artifacts.
+
+Decoding and validating manifest.json/catalog.json into the `artifact-parser` models
+is the most expensive step of a run. The parsed objects are pickled into a cache
+directory, keyed on:
+
+- the artifact content hash (sha256), so any change of the file is a miss
+- the artifact type and version, the relaxation policies and the manifest projection
+- the installed dbterd/artifact-parser/pydantic versions, so an upgrade never
+  unpickles objects of a changed model layout
+
+Entries are evicted least-recently-used first once the cache holds more than
+``max_entries`` entries or ``max_bytes`` bytes.
+
+The cache directory defaults to ``$DBTERD_CACHE_DIR``, or ``dbterd`` under
+``$XDG_CACHE_HOME`` (``~/.cache``). Only point it at a directory you own: cache
+entries are unpickled, so they must not come from untrusted sources.
+"""
+
+from collections.abc import Iterable
+import hashlib
+from importlib.metadata import PackageNotFoundError, version
+import mmap
+import os
+from pathlib import Path
+import pickle
+from typing import Any, Optional
+
+from dbterd.helpers.log import logger
+
+
+CACHE_FILE_SUFFIX = ".pickle"
+DEFAULT_MAX_ENTRIES = 8
+DEFAULT_MAX_BYTES = 2 * 1024**3
+FINGERPRINT_PACKAGES = ("dbterd", "artifact-parser", "pydantic")
+
+
+def default_cache_dir() -> Path:
+    """Get the default cache directory, see module docstring."""
+    if os.environ.get("DBTERD_CACHE_DIR"):
+        return Path(os.environ["DBTERD_CACHE_DIR"])
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "dbterd"
+
+
+def file_digest(path: str) -> str:
+    """Compute the sha256 hex digest of a file, memory-mapped rather than read into memory."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                digest.update(buffer)
+    return digest.hexdigest()
+
+
+def package_version(name: str) -> str:
+    """Get the installed version of a package, `unknown` if it is not installed."""
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _unlink(path: Path) -> bool:
+    """Remove a cache file, only logging a failure (e.g. a permission error)."""
+    try:
+        path.unlink(missing_ok=True)
+    except OSError as e:
+        logger.debug(f"Could not remove the cache file {path}: {e}")
+        return False
+    return True
+
+
+class ArtifactCache:
+    """Persistent cache of parsed artifacts, see module docstring.
+
+    Cache failures (e.g. a read-only directory, or entries evicted by another run
+    sharing the cache) are only logged: the artifacts are parsed again instead.
+
+    Example:
+        cache = ArtifactCache()
+        key = cache.make_key("target/manifest.json", artifact="manifest", version=12)
+        manifest = cache.get(key)
+        if manifest is None:
+            manifest = parse(...)
+            cache.put(key, manifest)
+
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Cache directory, see `default_cache_dir`
+            max_entries: Maximum number of cached artifacts
+            max_bytes: Maximum total size of the cached artifacts
+
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    def make_key(
+        self,
+        path: str,
+        artifact: str,
+        version: Optional[int] = None,
+        policies: Optional[Iterable[str]] = None,
+        **options: Optional[Iterable[str]],
+    ) -> str:
+        """Build the cache key of an artifact file.
+
+        Args:
+            path: Artifact file path
+            artifact: Artifact type ('manifest' or 'catalog')
+            version: Artifact version, None if the latest parser is used
+            policies: Validation relaxation policy names (None = all registered)
+            **options: Any other reading option changing the parsed result (e.g. the
+                manifest projection `sections`/`node_types`)
+
+        Returns:
+            Hex digest key
+
+        """
+        parts = [
+            artifact,
+            str(version),
+            "*" if policies is None else ",".join(policies),
+            *(f"{name}={'*' if value is None else ','.join(value)}" for name, value in sorted(options.items())),
+            *(f"{name}=={package_version(name)}" for name in FINGERPRINT_PACKAGES),
+            file_digest(path),
+        ]
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{CACHE_FILE_SUFFIX}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Load a cached artifact.
+
+        A hit refreshes the entry's recency. A corrupted entry is removed and counts as a miss.
+
+        Args:
+            key: Cache key, see `make_key`
+
+        Returns:
+            The cached object, None on a miss
+
+        """
+        entry = self._entry_path(key)
+        try:
+            with open(entry, "rb") as handle:
+                obj = pickle.load(handle)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Dropping unreadable cache entry {entry}: {e}")
+            _unlink(entry)
+            return None
+
+        try:
+            os.utime(entry)
+        except OSError as e:  # e.g. evicted by a concurrent run meanwhile
+            logger.debug(f"Could not refresh the cache entry {entry}: {e}")
+        logger.info(f"Loaded parsed artifact from cache {entry}")
+        return obj
+
+    def put(self, key: str, obj: Any) -> None:
+        """Store an artifact, then evict the least recently used entries over the limits.
+
+        Failing to write the cache is not fatal and only logged.
+
+        Args:
+            key: Cache key, see `make_key`
+            obj: Parsed artifact
+
+        """
+        entry = self._entry_path(key)
+        tmp_entry = entry.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_entry, "wb") as handle:
+                pickle.dump(obj, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_entry, entry)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:  # e.g. an unpicklable object
+            logger.warning(f"Could not write the artifact cache {entry}: {e}")
+            _unlink(tmp_entry)
+            return
+
+        self.evict()
+
+    def evict(self) -> list[Path]:
+        """Remove the least recently used entries until the cache is within its limits.
+
+        Entries removed meanwhile by a concurrent run sharing the cache are skipped.
+
+        Returns:
+            The removed entry paths
+
+        """
+        entries = []
+        for path in self.cache_dir.glob(f"*{CACHE_FILE_SUFFIX}"):
+            try:
+                entries.append((path, path.stat()))
+            except OSError as e:
+                logger.debug(f"Skipping the cache entry {path}: {e}")
+        entries.sort(key=lambda item: item[1].st_mtime, reverse=True)
+
+        removed = []
+        total_bytes = 0
+        for idx, (path, stat) in enumerate(entries):
+            total_bytes += stat.st_size
+            if (idx >= self.max_entries or (idx > 0 and total_bytes > self.max_bytes)) and _unlink(path):
+                removed.append(path)
+
+        if removed:
+            logger.debug(f"Evicted {len(removed)} artifact cache entries")
+        return removed
+
+    def clear(self) -> None:
+        """Remove every cache entry."""
+        for path in self.cache_dir.glob(f"*{CACHE_FILE_SUFFIX}"):
+            _unlink(path)
@@ -1,15 +1,19 @@
 from collections.abc import Iterable
-import json
+from dataclasses import dataclass
+import mmap
 import os
 import re
 import sys
-from typing import Optional
+import tracemalloc
+from typing import Any, Optional
 
 from artifact_parser.dbt.generated import parser
 
 # Importing relax_policies registers the built-in policies in the relax-policy registry.
 from dbterd.core import relax_policies  # noqa: F401
 from dbterd.core.validation_policy import get_relax_policy, known_relax_policies
+from dbterd.helpers import json_codec
+from dbterd.helpers.artifact_cache import ArtifactCache
 from dbterd.helpers.log import logger
 from dbterd.types import Catalog, Manifest
 
@@ -30,6 +34,48 @@ def extract_artifact_version_from_file(schema_version: str) -> Optional[str]:
     return None
 
 
+SCHEMA_VERSION_PATTERN = re.compile(rb'(?<!\\)"dbt_schema_version"\s*:\s*"([^"]*)"')
+SNIFF_HEAD_SIZE = 64 * 1024
+SNIFF_CHUNK_SIZE = 1024 * 1024
+SNIFF_CHUNK_OVERLAP = 1024
+
+
+def sniff_artifact_version(
+    path: str,
+    head_size: int = SNIFF_HEAD_SIZE,
+    chunk_size: int = SNIFF_CHUNK_SIZE,
+) -> Optional[str]:
+    """Detect the artifact version without decoding the whole JSON file.
+
+    dbt writes ``metadata.dbt_schema_version`` at the very top of its artifacts, so
+    only the leading bytes are read first. If the key is not found there (e.g. the
+    file was re-serialized with sorted keys), the rest of the file is scanned
+    incrementally in chunks, still without holding it fully in memory.
+
+    Args:
+        path: Artifact (manifest.json/catalog.json) file path
+        head_size: Number of leading bytes to look at first
+        chunk_size: Chunk size of the incremental fallback scan
+
+    Returns:
+        Version string like "12", or None if it cannot be found
+    """
+    with open(convert_path(str(path)), "rb") as handle:
+        buffer = handle.read(head_size)
+        while buffer:
+            match = SCHEMA_VERSION_PATTERN.search(buffer)
+            if match:
+                return extract_artifact_version_from_file(match.group(1).decode("utf-8", errors="ignore"))
+
+            chunk = handle.read(chunk_size)
+            if not chunk:
+                break
+            # keep a tail so a key split across two chunks is still matched
+            buffer = buffer[-SNIFF_CHUNK_OVERLAP:] + chunk
+
+    return None
+
+
 def get_sys_platform():  # pragma: no cover
     return sys.platform
 
@@ -52,16 +98,122 @@ def load_file_contents(path: str, strip: bool = True) -> str:
     return to_return
 
 
+def load_file_bytes(path: str) -> bytes:
+    """Read the raw bytes of a file, leveraging long path fixes.
+
+    Args:
+        path: File path
+
+    Returns:
+        File content, undecoded
+    """
+    with open(convert_path(path), "rb") as handle:
+        return handle.read()
+
+
+@dataclass
+class ReadReport:
+    """Memory report of a JSON artifact read.
+
+    Attributes:
+        path: File path
+        size: File size in bytes
+        mapped: Whether the file was memory-mapped rather than copied into a `bytes` object
+        peak_bytes: Peak bytes held while reading and decoding. Measured with `tracemalloc`
+            when it is tracing (e.g. ``PYTHONTRACEMALLOC=1``), so the decoded objects are
+            included; otherwise the raw document size, either mapped or copied into memory.
+        traced: Whether ``peak_bytes`` was measured with `tracemalloc`
+    """
+
+    path: str
+    size: int
+    mapped: bool
+    peak_bytes: int
+    traced: bool = False
+
+    def __str__(self) -> str:
+        how = "memory-mapped" if self.mapped else "buffered"
+        prefix = f"Read {self.path} ({format_bytes(self.size)}, {how})"
+        if not self.traced:
+            return f"{prefix}: raw document {format_bytes(self.peak_bytes)} {'mapped' if self.mapped else 'held'}"
+        # tracemalloc only sees the Python heap, not the pages of the mapped file
+        mapped = f" + {format_bytes(self.size)} mapped" if self.mapped else ""
+        return f"{prefix}: peak {format_bytes(self.peak_bytes)} held{mapped}"
+
+
+def format_bytes(num: float) -> str:
+    """Format a byte count in human-readable binary units, e.g. ``1.5 MiB``."""
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(num) < 1024:
+            return f"{num:.1f} {unit}" if unit != "B" else f"{int(num)} B"
+        num /= 1024
+    return f"{num:.1f} TiB"
+
+
+def load_json_with_report(
+    fp: str,
+    use_mmap: Optional[bool] = None,
+    backend: Optional[str] = None,
+) -> tuple[Any, ReadReport]:
+    """Decode a JSON file, memory-mapping it when the JSON codec can decode a buffer in place.
+
+    Reading through `load_file_contents` holds the raw `bytes`, the decoded `str` and possibly
+    its stripped copy at the same time. A memory-mapped file is instead handed to the decoder
+    as a zero-copy `memoryview`: its pages are backed by the OS page cache, not the Python heap.
+
+    Args:
+        fp: File path to JSON file
+        use_mmap: Force (or disable) memory-mapping. Defaults to the codec's `accepts_buffer`.
+        backend: JSON backend name, see `json_codec.get_json_codec`. Defaults to the configured one.
+
+    Returns:
+        Decoded JSON document and the read report
+    """
+    codec = json_codec.get_json_codec(backend)
+    if use_mmap is None:
+        use_mmap = codec.accepts_buffer
+
+    traced = tracemalloc.is_tracing()
+    if traced:
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    with open(convert_path(fp), "rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        mapped = bool(use_mmap and size)
+        if mapped:
+            with (
+                mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer,
+                memoryview(buffer) as view,
+            ):
+                data = codec.loads(view)
+        else:
+            content = handle.read()
+            if not codec.accepts_buffer:
+                # decoders without buffer support would copy the bytes into a str anyway,
+                # so decode upfront and let the bytes go before decoding the document
+                content = content.decode("utf-8")
+            data = codec.loads(content)
+
+    peak_bytes = tracemalloc.get_traced_memory()[1] - baseline if traced else size
+    return data, ReadReport(path=fp, size=size, mapped=mapped, peak_bytes=peak_bytes, traced=traced)
+
+
 def open_json(fp: str) -> dict:
     """Json loading utility, leveraging long path fixes.
 
+    The file is decoded by the configured JSON codec (see `json_codec`), memory-mapped
+    when the backend supports it, see `load_json_with_report`.
+
     Args:
         fp: File path to JSON file
 
     Returns:
         Parsed JSON as dictionary
     """
-    return json.loads(load_file_contents(fp))
+    data, report = load_json_with_report(fp)
+    logger.debug(str(report))
+    return data
 
 
 def patch_parser_compatibility(
@@ -194,10 +346,57 @@ def win_prepare_path(path: str) -> str:  # pragma: no cover
     return path
 
 
+def project_manifest(
+    manifest: dict,
+    sections: Optional[Iterable[str]] = None,
+    node_types: Optional[Iterable[str]] = None,
+) -> dict:
+    """
+    Keep only the manifest sections and node resource types that are consumed.
+
+    Sections which are not kept are emptied in place rather than removed, so the
+    versioned parser still finds every required top-level field. The ``metadata``
+    section is always kept.
+
+    Args:
+        manifest (dict): Decoded manifest.json content
+        sections (Iterable[str], optional): Top-level sections to keep. ``None`` keeps all.
+        node_types (Iterable[str], optional): Resource types (e.g. ``model``, ``test``) to
+            keep in ``nodes``. ``None`` keeps all.
+
+    Returns:
+        dict: The projected manifest dict
+
+    """
+    if sections is not None:
+        kept_sections = {"metadata", *sections}
+        for section, value in manifest.items():
+            if section in kept_sections:
+                continue
+            if isinstance(value, dict):
+                manifest[section] = {}
+            elif isinstance(value, list):
+                manifest[section] = []
+
+    if node_types is not None and isinstance(manifest.get("nodes"), dict):
+        kept_node_types = set(node_types)
+        manifest["nodes"] = {
+            node_name: node
+            for node_name, node in manifest["nodes"].items()
+            if node_name.split(".", maxsplit=1)[0] in kept_node_types
+        }
+
+    return manifest
+
+
 def read_manifest(
     path: str,
     version: Optional[int] = None,
     policies: Optional[Iterable[str]] = None,
+    sections: Optional[Iterable[str]] = None,
+    node_types: Optional[Iterable[str]] = None,
+    *,
+    cache: Optional[ArtifactCache] = None,
 ) -> Manifest:
     """
     Reads in the manifest.json file, with optional version specification.
@@ -207,15 +406,37 @@ def read_manifest(
         version (int, optional): Manifest version. Defaults to None (auto-detect).
         policies (Iterable[str], optional): Validation relaxation policy names. ``None``
             applies all registered policies; an empty list enforces strict validation.
+        sections (Iterable[str], optional): Projected reading - top-level sections to
+            keep before validation, see `project_manifest`. ``None`` keeps all.
+        node_types (Iterable[str], optional): Projected reading - node resource types to
+            keep before validation, see `project_manifest`. ``None`` keeps all.
+        cache (ArtifactCache, optional): Parsed artifact cache to look up first and fill
+            afterwards. Defaults to None (no caching).
 
     Returns:
         dict: Manifest dict
 
     """
+    manifest_path = f"{path}/manifest.json"
+    if cache is not None:
+        cache_key = cache.make_key(
+            manifest_path,
+            artifact="manifest",
+            version=version,
+            policies=policies,
+            sections=sections,
+            node_types=node_types,
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
     if version:
         patch_parser_compatibility(artifact="manifest", artifact_version=version, policies=policies)
 
-    _dict = open_json(f"{path}/manifest.json")
+    _dict = open_json(manifest_path)
+    if sections is not None or node_types is not None:
+        _dict = project_manifest(_dict, sections=sections, node_types=node_types)
     default_parser = "parse_manifest"
     parser_version = f"parse_manifest_v{version}" if version else default_parser
     if not hasattr(parser, parser_version):
@@ -227,13 +448,18 @@ def read_manifest(
         )
         parser_version = default_parser
     parse_func = getattr(parser, parser_version)
-    return parse_func(manifest=_dict)
+    manifest = parse_func(manifest=_dict)
+    if cache is not None:
+        cache.put(cache_key, manifest)
+    return manifest
 
 
 def read_catalog(
     path: str,
     version: Optional[int] = None,
     policies: Optional[Iterable[str]] = None,
+    *,
+    cache: Optional[ArtifactCache] = None,
 ) -> Catalog:
     """
     Reads in the catalog.json file, with optional version specification.
@@ -243,15 +469,24 @@ def read_catalog(
         version (int, optional): Catalog version. Defaults to None.
         policies (Iterable[str], optional): Validation relaxation policy names. ``None``
             applies all registered policies; an empty list enforces strict validation.
+        cache (ArtifactCache, optional): Parsed artifact cache to look up first and fill
+            afterwards. Defaults to None (no caching).
 
     Returns:
         dict: Catalog dict
 
     """
+    catalog_path = f"{path}/catalog.json"
+    if cache is not None:
+        cache_key = cache.make_key(catalog_path, artifact="catalog", version=version, policies=policies)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
     if version:
         patch_parser_compatibility(artifact="catalog", artifact_version=version, policies=policies)
 
-    _dict = open_json(f"{path}/catalog.json")
+    _dict = open_json(catalog_path)
     default_parser = "parse_catalog"
     parser_version = f"parse_catalog_v{version}" if version else default_parser
     if not hasattr(parser, parser_version):
@@ -263,7 +498,10 @@ def read_catalog(
         )
         parser_version = default_parser
     parse_func = getattr(parser, parser_version)
-    return parse_func(catalog=_dict)
+    catalog = parse_func(catalog=_dict)
+    if cache is not None:
+        cache.put(cache_key, catalog)
+    return catalog
 
 
 def write_json(data: str, path: str) -> None:
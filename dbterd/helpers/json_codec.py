@@ -0,0 +1,181 @@
+"""Pluggable JSON codec.
+
+Artifacts (manifest.json/catalog.json) are decoded through a `JsonCodec`. An
+accelerated backend is used when its package is installed, falling back to the
+standard library otherwise:
+
+- ``orjson``: `pip install orjson`
+- ``msgspec``: `pip install msgspec`
+- ``json``: Python standard library, always available
+
+The backend can be forced with the ``DBTERD_JSON_BACKEND`` environment variable
+(``auto`` by default, which picks the first available one in the order above).
+
+The generated files (e.g. the ``json`` and ``drawdb`` targets) are encoded with
+the standard library by default, whose output (separators, ASCII escaping) the
+other backends don't reproduce. Set ``DBTERD_JSON_FAST_ENCODE`` to encode them
+with the configured backend as well: the documents are equal once decoded, but
+compact and UTF-8 encoded rather than byte-identical.
+"""
+
+from abc import ABC, abstractmethod
+import json
+import os
+from typing import Any, ClassVar, Optional, Union
+
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+
+AUTO_BACKEND = "auto"
+FAST_ENCODE_ENV = "DBTERD_JSON_FAST_ENCODE"
+
+
+class JsonCodec(ABC):
+    """Base JSON codec: decode bytes/str into Python objects and encode them back to str."""
+
+    name: ClassVar[str] = ""
+    # Whether `loads` decodes a buffer (e.g. a memory-mapped file) in place, without copying it
+    accepts_buffer: ClassVar[bool] = False
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Whether the backend package is importable."""
+        return True
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """Decode a JSON document.
+
+        Args:
+            data: JSON document, as UTF-8 bytes-like object or str
+
+        Returns:
+            Decoded Python object
+
+        Raises:
+            ValueError: The document is not valid JSON
+
+        """
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> str:
+        """Encode a Python object as a JSON string.
+
+        Args:
+            obj: Object made of dict/list/tuple/str/int/float/bool/None
+
+        Returns:
+            JSON string
+
+        """
+
+
+class StdlibJsonCodec(JsonCodec):
+    """Standard library `json` codec."""
+
+    name = "json"
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+
+class OrjsonCodec(JsonCodec):
+    """`orjson` codec, decoding straight from bytes without an intermediate str."""
+
+    name = "orjson"
+    accepts_buffer = True
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return orjson is not None
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
+class MsgspecCodec(JsonCodec):
+    """`msgspec` codec."""
+
+    name = "msgspec"
+    accepts_buffer = True
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return msgspec is not None
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(self, obj: Any) -> str:
+        return msgspec.json.encode(obj).decode("utf-8")
+
+
+JSON_CODECS: dict[str, type[JsonCodec]] = {codec.name: codec for codec in (OrjsonCodec, MsgspecCodec, StdlibJsonCodec)}
+
+
+def available_json_backends() -> list[str]:
+    """List the installed JSON backends, in order of preference."""
+    return [name for name, codec in JSON_CODECS.items() if codec.is_available()]
+
+
+def get_json_codec(backend: Optional[str] = None) -> JsonCodec:
+    """Get the JSON codec of a backend.
+
+    Args:
+        backend: Backend name (``orjson``, ``msgspec``, ``json``) or ``auto``.
+            Defaults to the ``DBTERD_JSON_BACKEND`` environment variable, then ``auto``.
+
+    Returns:
+        JsonCodec instance
+
+    Raises:
+        LookupError: The backend is unknown or its package is not installed
+
+    """
+    backend = (backend or os.environ.get("DBTERD_JSON_BACKEND") or AUTO_BACKEND).lower()
+    if backend == AUTO_BACKEND:
+        backend = available_json_backends()[0]
+
+    codec = JSON_CODECS.get(backend)
+    if codec is None:
+        raise LookupError(f"Unknown JSON backend '{backend}'. Choose one of: {AUTO_BACKEND}, {', '.join(JSON_CODECS)}")
+    if not codec.is_available():
+        raise LookupError(f"JSON backend '{backend}' is not installed, try: pip install {backend}")
+
+    return codec()
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Decode a JSON document with the configured backend, see `get_json_codec`."""
+    return get_json_codec().loads(data)
+
+
+def fast_encode_enabled() -> bool:
+    """Whether the generated JSON is encoded with the configured backend, see module docstring."""
+    return os.environ.get(FAST_ENCODE_ENV, "false").lower() in ["true", "yes", "1"]
+
+
+def dumps(obj: Any) -> str:
+    """Encode an object as JSON string, with the standard library unless `fast_encode_enabled`."""
+    codec = get_json_codec() if fast_encode_enabled() else StdlibJsonCodec()
+    return codec.dumps(obj)
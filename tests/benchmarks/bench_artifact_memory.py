@@ -0,0 +1,57 @@
+"""Compare the peak memory of reading a synthetic large manifest, buffered vs memory-mapped.
+
+Peak bytes are measured with `tracemalloc`, so they cover the Python heap only:
+memory-mapped pages live in the OS page cache and are not counted.
+
+Usage:
+    python -m tests.benchmarks.bench_artifact_memory --models 20000
+"""
+
+import argparse
+import json
+from pathlib import Path
+import tempfile
+import tracemalloc
+
+from dbterd.helpers import json_codec
+from dbterd.helpers.file import format_bytes, load_file_contents, load_json_with_report
+from tests.benchmarks.synthetic import write_artifacts
+
+
+def _traced_peak(func) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--models", type=int, default=10000, help="Number of synthetic models")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manifest_path = str(write_artifacts(Path(tmp_dir), models=args.models) / "manifest.json")
+        size = Path(manifest_path).stat().st_size
+        print(f"manifest.json: {args.models} models, {format_bytes(size)}")
+
+        print(f"{'reader':<28}{'peak held':>14}")
+        legacy_peak = _traced_peak(lambda: json.loads(load_file_contents(manifest_path)))
+        print(f"{'str + strip + json':<28}{format_bytes(legacy_peak):>14}")
+        for backend in json_codec.available_json_backends():
+            codec = json_codec.get_json_codec(backend)
+            modes = [False, True] if codec.accepts_buffer else [False]
+            for use_mmap in modes:
+                label = f"{backend} ({'mmap' if use_mmap else 'bytes'})"
+                peak = _traced_peak(
+                    lambda backend=backend, use_mmap=use_mmap: load_json_with_report(
+                        manifest_path, use_mmap=use_mmap, backend=backend
+                    )
+                )
+                print(f"{label:<28}{format_bytes(peak):>14}")
+
+
+if __name__ == "__main__":
+    main()
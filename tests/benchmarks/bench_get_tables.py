@@ -0,0 +1,50 @@
+"""Compare building every table then filtering it vs the selection pushed down into `get_tables`.
+
+Usage:
+    python -m tests.benchmarks.bench_get_tables --models 10000 --select 20
+"""
+
+import argparse
+from pathlib import Path
+import tempfile
+import time
+
+from dbterd.adapters.algos.test_relationship import TestRelationshipAlgo
+from dbterd.helpers.file import read_catalog, read_manifest
+from tests.benchmarks.synthetic import write_artifacts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--models", type=int, default=10000, help="Number of synthetic models")
+    parser.add_argument("--select", type=int, default=20, help="Number of selected models")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        artifacts_dir = write_artifacts(Path(tmp_dir), models=args.models)
+        manifest = read_manifest(path=str(artifacts_dir))
+        catalog = read_catalog(path=str(artifacts_dir))
+
+    algo = TestRelationshipAlgo()
+    kwargs = {
+        "entity_name_format": "resource.package.model",
+        "select": [f"exact:model.jaffle_shop.bench_model_{idx}" for idx in range(args.select)],
+        "resource_type": ["model"],
+    }
+    print(f"{args.models} models, {args.select} selected")
+
+    start = time.perf_counter()
+    all_tables = algo.get_tables(manifest=manifest, catalog=catalog, **{**kwargs, "select": [], "resource_type": []})
+    expected = algo.filter_tables_based_on_selection(tables=all_tables, **kwargs)
+    build_then_filter = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = algo.get_tables(manifest=manifest, catalog=catalog, **kwargs)
+    pushed_down = time.perf_counter() - start
+
+    assert actual == expected
+    print(f"build then filter {build_then_filter:8.3f}s  pushed down {pushed_down:8.3f}s  ({len(actual)} tables)")
+
+
+if __name__ == "__main__":
+    main()
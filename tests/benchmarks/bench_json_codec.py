@@ -0,0 +1,47 @@
+"""Compare the JSON backends on a synthetic large manifest.
+
+Usage:
+    python -m tests.benchmarks.bench_json_codec --models 20000 --repeat 3
+"""
+
+import argparse
+from pathlib import Path
+import tempfile
+import time
+
+from dbterd.helpers import json_codec
+from dbterd.helpers.file import load_file_bytes
+from tests.benchmarks.synthetic import write_artifacts
+
+
+def _best_of(repeat: int, func) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--models", type=int, default=10000, help="Number of synthetic models")
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of repeat count")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manifest_path = write_artifacts(Path(tmp_dir), models=args.models) / "manifest.json"
+        raw = load_file_bytes(str(manifest_path))
+        print(f"manifest.json: {args.models} models, {len(raw) / 1024 / 1024:.1f} MiB")
+
+        document = json_codec.get_json_codec("json").loads(raw)
+        print(f"{'backend':<10}{'loads (s)':>12}{'dumps (s)':>12}")
+        for backend in json_codec.available_json_backends():
+            codec = json_codec.get_json_codec(backend)
+            loads_time = _best_of(args.repeat, lambda codec=codec: codec.loads(raw))
+            dumps_time = _best_of(args.repeat, lambda codec=codec: codec.dumps(document))
+            print(f"{backend:<10}{loads_time:>12.3f}{dumps_time:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
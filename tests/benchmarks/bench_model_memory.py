@@ -0,0 +1,92 @@
+"""Compare the memory held by parsed tables, plain dataclasses vs the slotted and interned models.
+
+Column data types, databases and schemas are built as fresh strings for every
+table, like when they are lowercased from the catalog/manifest.
+
+Usage:
+    python -m tests.benchmarks.bench_model_memory --tables 10000 --columns 30
+"""
+
+import argparse
+from dataclasses import dataclass, field
+import gc
+import tracemalloc
+from typing import Optional
+
+from dbterd.core.models import Column, Table
+from dbterd.helpers.file import format_bytes
+
+
+DATA_TYPES = ["VARCHAR", "INTEGER", "TIMESTAMP_NTZ", "NUMBER(38,0)", "BOOLEAN", "DATE"]
+
+
+@dataclass
+class PlainColumn:
+    """`Column` as a plain dataclass, as before slots and interning."""
+
+    name: str = "unknown"
+    data_type: str = "unknown"
+    description: str = ""
+    is_primary_key: bool = False
+    source: Optional[object] = None
+
+
+@dataclass
+class PlainTable:
+    """`Table` as a plain dataclass, as before slots and interning."""
+
+    name: str
+    database: str
+    schema: str
+    columns: Optional[list] = None
+    raw_sql: Optional[str] = None
+    resource_type: str = "model"
+    exposures: list[str] = field(default_factory=list)
+    node_name: Optional[str] = None
+    description: str = ""
+    label: Optional[str] = None
+
+
+def _build(table_cls: type, column_cls: type, tables: int, columns: int) -> list:
+    return [
+        table_cls(
+            name=f"model.bench.model_{idx}",
+            node_name=f"model.bench.model_{idx}",
+            database="ANALYTICS".lower(),
+            schema=f"MART_{idx % 20}".lower(),
+            columns=[
+                column_cls(name=f"column_{col}", data_type=DATA_TYPES[col % len(DATA_TYPES)].lower())
+                for col in range(columns)
+            ],
+        )
+        for idx in range(tables)
+    ]
+
+
+def _held(table_cls: type, column_cls: type, tables: int, columns: int) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        parsed = _build(table_cls, column_cls, tables, columns)
+        held = tracemalloc.get_traced_memory()[0]
+        del parsed
+        return held
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tables", type=int, default=10000, help="Number of tables")
+    parser.add_argument("--columns", type=int, default=30, help="Number of columns per table")
+    args = parser.parse_args()
+
+    print(f"{args.tables} tables x {args.columns} columns")
+    plain = _held(PlainTable, PlainColumn, args.tables, args.columns)
+    compact = _held(Table, Column, args.tables, args.columns)
+    print(f"{'plain dataclasses':<28}{format_bytes(plain):>14}")
+    print(f"{'slotted and interned':<28}{format_bytes(compact):>14}  ({1 - compact / plain:.0%} less)")
+
+
+if __name__ == "__main__":
+    main()
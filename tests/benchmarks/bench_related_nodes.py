@@ -0,0 +1,63 @@
+"""Compare finding the related nodes of single models, full manifest scan vs the test index.
+
+Usage:
+    python -m tests.benchmarks.bench_related_nodes --models 20000 --lookups 100
+"""
+
+import argparse
+from pathlib import Path
+import tempfile
+import time
+
+from dbterd.adapters.algos.test_relationship import TestRelationshipAlgo
+from dbterd.constants import TEST_META_IGNORE_IN_ERD
+from dbterd.helpers.file import read_manifest
+from tests.benchmarks.synthetic import write_artifacts
+
+
+def _scan_related_nodes(manifest, node_unique_id: str) -> list[str]:
+    # Every test node scanned for every lookup, as before the test index
+    found_nodes = [node_unique_id]
+    for node_name, node in manifest.nodes.items():
+        if (
+            node_name.startswith("test")
+            and "relationship" in node_name.lower()
+            and node.meta.get(TEST_META_IGNORE_IN_ERD, "0") == "0"
+            and node_unique_id in (node.depends_on.nodes or [])
+        ):
+            found_nodes.extend(node.depends_on.nodes)
+    return list(set(found_nodes))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--models", type=int, default=20000, help="Number of synthetic models")
+    parser.add_argument("--lookups", type=int, default=100, help="Number of single model lookups")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manifest = read_manifest(path=str(write_artifacts(Path(tmp_dir), models=args.models)))
+    node_ids = [f"model.jaffle_shop.bench_model_{idx}" for idx in range(0, args.models, args.models // args.lookups)]
+    print(f"{len(manifest.nodes)} nodes, {len(node_ids)} lookups")
+
+    start = time.perf_counter()
+    expected = [sorted(_scan_related_nodes(manifest, node_id)) for node_id in node_ids]
+    scan = time.perf_counter() - start
+
+    algo = TestRelationshipAlgo()
+    start = time.perf_counter()
+    algo.get_test_index(manifest=manifest, rule_name="relationship")
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [sorted(algo.find_related_nodes_by_id(manifest=manifest, node_unique_id=node_id)) for node_id in node_ids]
+    indexed = time.perf_counter() - start
+
+    assert actual == expected
+    print(f"scan per lookup    {scan / len(node_ids) * 1e6:12.1f}us")
+    print(f"index build (once) {build * 1e6:12.1f}us")
+    print(f"index per lookup   {indexed / len(node_ids) * 1e6:12.1f}us")
+
+
+if __name__ == "__main__":
+    main()
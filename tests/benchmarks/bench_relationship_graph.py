@@ -0,0 +1,93 @@
+"""Compare a set of neighbours per node vs the relationship graph, build, memory and neighbourhoods.
+
+Usage:
+    python -m tests.benchmarks.bench_relationship_graph --nodes 50000 --edges 200000 --lookups 1000
+"""
+
+import argparse
+from collections import deque
+import gc
+import random
+import time
+import tracemalloc
+
+from dbterd.core.graph import RelationshipGraph
+from dbterd.helpers.file import format_bytes
+
+
+def _build_sets(edges: list[tuple[str, str]]) -> dict[str, set[str]]:
+    # One set of neighbours per node, as before the relationship graph
+    adjacency: dict[str, set[str]] = {}
+    for node, other in edges:
+        adjacency.setdefault(node, set()).add(other)
+        adjacency.setdefault(other, set()).add(node)
+    return adjacency
+
+
+def _sets_neighbourhood(adjacency: dict[str, set[str]], node: str, depth: int) -> list[str]:
+    found = {node: 0}
+    queue = deque([node])
+    while queue:
+        current = queue.popleft()
+        if found[current] >= depth:
+            continue
+        for neighbour in adjacency.get(current, ()):
+            if neighbour not in found:
+                found[neighbour] = found[current] + 1
+                queue.append(neighbour)
+    return list(found)
+
+
+def _measure(build, edges: list[tuple[str, str]]) -> tuple[object, float, int]:
+    # Timed apart from the memory tracing, which slows the allocations down
+    gc.collect()
+    start = time.perf_counter()
+    build(edges)
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        built = build(edges)
+        return built, elapsed, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=50000, help="Number of nodes")
+    parser.add_argument("--edges", type=int, default=200000, help="Number of relationships")
+    parser.add_argument("--lookups", type=int, default=1000, help="Number of depth-2 neighbourhood lookups")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    node_names = [f"model.jaffle_shop.bench_model_{idx}" for idx in range(args.nodes)]
+    edges = [(rng.choice(node_names), rng.choice(node_names)) for _ in range(args.edges)]
+    lookups = rng.sample(node_names, min(args.lookups, args.nodes))
+    print(f"{args.nodes} nodes, {args.edges} edges, {len(lookups)} lookups")
+
+    adjacency, sets_build, sets_memory = _measure(_build_sets, edges)
+    graph, graph_build, graph_memory = _measure(RelationshipGraph, edges)
+
+    start = time.perf_counter()
+    expected = [sorted(_sets_neighbourhood(adjacency, node, depth=2)) for node in lookups]
+    sets_lookups = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [sorted(graph.neighbourhood(node, depth=2)) for node in lookups]
+    graph_lookups = time.perf_counter() - start
+
+    assert actual == expected
+    start = time.perf_counter()
+    components = graph.components()
+    graph_components = time.perf_counter() - start
+
+    print(f"{'':<18}{'build':>10}{'memory':>14}{'lookups':>10}")
+    print(f"{'neighbour sets':<18}{sets_build:>9.3f}s{format_bytes(sets_memory):>14}{sets_lookups:>9.3f}s")
+    print(f"{'graph':<18}{graph_build:>9.3f}s{format_bytes(graph_memory):>14}{graph_lookups:>9.3f}s")
+    print(f"{graph.edge_count} distinct edges, {len(components)} components in {graph_components:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Compare filtering tables through per-table rule parsing vs the compiled selection.
+
+Usage:
+    python -m tests.benchmarks.bench_selection --tables 20000 --rules 500
+"""
+
+import argparse
+import sys
+import time
+
+from dbterd.core import filter
+from dbterd.core.models import Table
+
+
+def _uncompiled_is_selected(table: Table, select_rules: list[str]) -> bool:
+    # Rule strings parsed and resolved for every table, as before the compiled selection
+    for rule in select_rules:
+        results = []
+        for part in rule.split(","):
+            rule_parts = part.lower().split(":")
+            type, value = ("name", rule_parts[0]) if len(rule_parts) == 1 else tuple(rule_parts[:2])
+            rule_func = getattr(sys.modules[filter.__name__], f"{filter.RULE_FUNC_PREFIX}{type}")
+            results.append(rule_func(table=table, rule=value))
+        if all(results):
+            return table.resource_type == "model"
+    return False
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tables", type=int, default=20000, help="Number of synthetic tables")
+    parser.add_argument("--rules", type=int, default=500, help="Number of `exact:` rules (like the --dbt mode)")
+    args = parser.parse_args()
+
+    tables = [
+        Table(name=f"t{idx}", node_name=f"model.bench.model_{idx}", database="db", schema=f"schema_{idx % 20}")
+        for idx in range(args.tables)
+    ]
+    step = max(1, args.tables // args.rules)
+    select_rules = [f"exact:model.bench.model_{idx}" for idx in range(0, args.tables, step)][: args.rules]
+    print(f"{args.tables} tables, {len(select_rules)} exact rules")
+
+    for label, rules in (("exact", select_rules), ("wildcard", ["wildcard:*model_1?", "wildcard:*_99*"] * 10)):
+        start = time.perf_counter()
+        expected = [table for table in tables if _uncompiled_is_selected(table, rules)]
+        uncompiled = time.perf_counter() - start
+
+        start = time.perf_counter()
+        selection = filter.compile_selection(select_rules=rules)
+        actual = [table for table in tables if selection.is_selected(table)]
+        compiled = time.perf_counter() - start
+
+        assert actual == expected
+        print(f"{label:<10}uncompiled {uncompiled:8.3f}s  compiled {compiled:8.3f}s  ({len(actual)} selected)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Synthetic large dbt artifacts for benchmarks.
+
+The jaffle-shop sample is used as a template: its ``orders`` model, catalog entry
+and one ``relationships`` test are cloned ``models`` times, each model referencing
+its predecessor, so the generated artifacts stay parseable by every algo.
+"""
+
+import copy
+import json
+from pathlib import Path
+
+
+SAMPLE_DIR = Path(__file__).parent.parent.parent / "samples" / "jaffle-shop"
+TEMPLATE_MODEL_ID = "model.jaffle_shop.orders"
+
+
+def _model_id(idx: int) -> str:
+    return f"model.jaffle_shop.bench_model_{idx}"
+
+
+def make_manifest(models: int) -> dict:
+    """Build a manifest dict with ``models`` chained models and their relationship tests."""
+    manifest = json.loads((SAMPLE_DIR / "manifest.json").read_text(encoding="utf-8"))
+    template_model = manifest["nodes"][TEMPLATE_MODEL_ID]
+    template_test = next(
+        node
+        for node_id, node in manifest["nodes"].items()
+        if node_id.startswith("test.") and (node.get("test_metadata") or {}).get("name") == "relationships"
+    )
+
+    for idx in range(models):
+        name = f"bench_model_{idx}"
+        node = copy.deepcopy(template_model)
+        node.update(
+            name=name,
+            alias=name,
+            unique_id=_model_id(idx),
+            relation_name=f'"demo"."public"."{name}"',
+            fqn=["jaffle_shop", "bench", name],
+        )
+        node["checksum"] = {"name": "sha256", "checksum": f"{idx:064x}"}
+        manifest["nodes"][node["unique_id"]] = node
+
+        if idx == 0:
+            continue
+        test_name = f"relationships_{name}_order_id__order_id__ref_bench_model_{idx - 1}_"
+        test = copy.deepcopy(template_test)
+        test.update(
+            name=test_name,
+            alias=test_name,
+            unique_id=f"test.jaffle_shop.{test_name}.{idx:010x}",
+            attached_node=node["unique_id"],
+            column_name="order_id",
+            fqn=["jaffle_shop", "bench", test_name],
+        )
+        test["test_metadata"] = copy.deepcopy(template_test["test_metadata"])
+        test["test_metadata"]["kwargs"].update(
+            to=f"ref('bench_model_{idx - 1}')",
+            field="order_id",
+            column_name="order_id",
+            model=f"{{{{ get_where_subquery(ref('{name}')) }}}}",
+        )
+        test["depends_on"] = {
+            "macros": template_test["depends_on"]["macros"],
+            "nodes": [_model_id(idx - 1), node["unique_id"]],
+        }
+        manifest["nodes"][test["unique_id"]] = test
+
+    return manifest
+
+
+def make_catalog(models: int) -> dict:
+    """Build a catalog dict matching `make_manifest`."""
+    catalog = json.loads((SAMPLE_DIR / "catalog.json").read_text(encoding="utf-8"))
+    template = catalog["nodes"][TEMPLATE_MODEL_ID]
+    for idx in range(models):
+        entry = copy.deepcopy(template)
+        entry["unique_id"] = _model_id(idx)
+        entry["metadata"]["name"] = f"bench_model_{idx}"
+        catalog["nodes"][_model_id(idx)] = entry
+    return catalog
+
+
+def write_artifacts(artifacts_dir: Path, models: int) -> Path:
+    """Write synthetic manifest.json and catalog.json into ``artifacts_dir``.
+
+    Args:
+        artifacts_dir: Output directory, created if missing
+        models: Number of generated models
+
+    Returns:
+        The artifacts directory
+
+    """
+    artifacts_dir = Path(artifacts_dir)
+    artifacts_dir.mkdir(parents=True, exist_ok=True)
+    (artifacts_dir / "manifest.json").write_text(json.dumps(make_manifest(models)), encoding="utf-8")
+    (artifacts_dir / "catalog.json").write_text(json.dumps(make_catalog(models)), encoding="utf-8")
+    return artifacts_dir
@@ -1,8 +1,13 @@
 from unittest import mock
 
 from dbterd.adapters.algos.test_relationship import TestRelationshipAlgo
-from dbterd.core.adapters.algo import BaseAlgoAdapter
-from dbterd.core.models import Ref, Table
+from dbterd.core.adapters.algo import (
+    BaseAlgoAdapter,
+    exposure_list_to_mapping,
+    exposure_mapping_to_list,
+    get_exposure_names,
+)
+from dbterd.core.models import Column, Ref, Table
 
 
 class TestAlgoBase:
@@ -40,7 +45,7 @@ class TestAlgoBase:
         return_value="test_table",
     )
     @mock.patch(
-        "dbterd.core.adapters.algo.BaseAlgoAdapter.get_compiled_sql",
+        "dbterd.core.adapters.algo.BaseAlgoAdapter.get_lazy_compiled_sql",
         return_value="SELECT * FROM test",
     )
     def test_get_table_with_none_exposures(self, mock_get_compiled_sql, mock_get_table_name):
@@ -110,3 +115,97 @@ class TestAlgoBase:
         algo = MinimalAlgo()
         result = algo.find_related_nodes_by_id(manifest={}, node_unique_id="model.pkg.test_table")
         assert result == ["model.pkg.test_table"]
+
+    def test_get_table_index_keeps_first_table_per_node(self):
+        """Test that get_table_index maps node IDs to tables, first one winning."""
+        first = Table(name="t1", node_name="model.pkg.t1", database="db", schema="sc")
+        duplicate = Table(name="t1_dup", node_name="model.pkg.t1", database="db", schema="sc")
+        second = Table(name="t2", node_name="model.pkg.t2", database="db", schema="sc")
+
+        algo = TestRelationshipAlgo()
+        result = algo.get_table_index(tables=[first, duplicate, second])
+        assert result == {"model.pkg.t1": first, "model.pkg.t2": second}
+        assert algo.get_table_index(tables=None) == {}
+
+    def test_make_up_relationships_with_table_index(self):
+        """Test that make_up_relationships resolves names through the node ID index."""
+        tables = [
+            Table(name="orders", node_name="model.pkg.orders", database="db", schema="sc"),
+            Table(name="customers", node_name="model.pkg.customers", database="db", schema="sc"),
+        ]
+        relationships = [
+            Ref(
+                name="r1",
+                table_map=("model.pkg.customers", "model.pkg.orders"),
+                column_map=(["id"], ["customer_id"]),
+            ),
+            Ref(name="r2", table_map=("model.pkg.missing", "model.pkg.orders"), column_map=(["id"], ["missing_id"])),
+        ]
+
+        algo = TestRelationshipAlgo()
+        result = algo.make_up_relationships(
+            relationships=relationships, table_index=algo.get_table_index(tables=tables)
+        )
+        assert [(x.name, x.table_map) for x in result] == [("r1", ["customers", "orders"])]
+
+    def test_enrich_tables_from_relationships_copies_only_touched_tables(self):
+        """Test that enrichment appends missing columns on a copy and leaves other tables untouched."""
+        orders = Table(name="orders", node_name="model.pkg.orders", database="db", schema="sc", columns=[Column("id")])
+        customers = Table(
+            name="customers", node_name="model.pkg.customers", database="db", schema="sc", columns=[Column("ID")]
+        )
+        products = Table(name="products", node_name="model.pkg.products", database="db", schema="sc", columns=[])
+        relationships = [
+            Ref(name="r1", table_map=["customers", "orders"], column_map=(["id"], ["customer_id"])),
+            Ref(name="r2", table_map=["customers", "orders"], column_map=(["id"], ["Customer_ID"])),
+        ]
+
+        algo = TestRelationshipAlgo()
+        result = algo.enrich_tables_from_relationships(
+            tables=[orders, customers, products], relationships=relationships
+        )
+
+        assert [c.name for c in result[0].columns] == ["id", "customer_id"]
+        assert result[0] is not orders
+        assert [c.name for c in orders.columns] == ["id"]
+        assert result[1] is customers
+        assert result[2] is products
+
+    def test_exposure_list_shim_roundtrip(self):
+        """Test that the legacy exposure list converts to and from the node mapping."""
+        legacy = [
+            {"node_name": "model.pkg.t1", "exposure_name": "e1"},
+            {"node_name": "model.pkg.t2", "exposure_name": "e1"},
+            {"node_name": "model.pkg.t1", "exposure_name": "e2"},
+        ]
+        mapping = exposure_list_to_mapping(legacy)
+        assert mapping == {"model.pkg.t1": ["e1", "e2"], "model.pkg.t2": ["e1"]}
+        assert sorted(exposure_mapping_to_list(mapping), key=str) == sorted(legacy, key=str)
+
+    def test_get_node_exposure_map(self):
+        """Test that the exposure mapping is built from the (overridable) legacy list."""
+        algo = TestRelationshipAlgo()
+        legacy = [
+            {"node_name": "model.pkg.t1", "exposure_name": "e1"},
+            {"node_name": "model.pkg.t1", "exposure_name": "e2"},
+        ]
+        with mock.patch.object(TestRelationshipAlgo, "get_node_exposures", return_value=legacy) as mock_exposures:
+            assert algo.get_node_exposure_map(manifest="manifest") == {"model.pkg.t1": ["e1", "e2"]}
+            mock_exposures.assert_called_once_with(manifest="manifest")
+        with mock.patch.object(
+            TestRelationshipAlgo, "get_node_exposures_from_metadata", return_value=legacy
+        ) as mock_exposures:
+            assert algo.get_node_exposure_map_from_metadata(data=[], resource_type=["model"]) == {
+                "model.pkg.t1": ["e1", "e2"]
+            }
+            mock_exposures.assert_called_once_with(data=[], resource_type=["model"])
+        assert algo.get_node_exposure_map_from_metadata(data=None, resource_type=["model"]) == {}
+
+    def test_get_exposure_names_accepts_both_forms(self):
+        """Test that exposures are looked up from either the mapping or the legacy list."""
+        mapping = {"model.pkg.t1": ["e1", "e2"]}
+        assert get_exposure_names("model.pkg.t1", mapping) == ["e1", "e2"]
+        assert get_exposure_names("model.pkg.t1", mapping) is not mapping["model.pkg.t1"]
+        assert get_exposure_names("model.pkg.t1", exposure_mapping_to_list(mapping)) == ["e1", "e2"]
+        assert get_exposure_names("model.pkg.t9", mapping) == []
+        assert get_exposure_names("model.pkg.t1", None) == []
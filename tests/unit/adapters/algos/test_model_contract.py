@@ -6,10 +6,9 @@ import pytest
 
 from dbterd.adapters.algos.model_contract import (
     ModelContractAlgo,
+    NodeResolver,
     _extract_pk_column_names,
     _get_relationship_type,
-    _resolve_ref_to_node_id,
-    _resolve_to_node_id,
 )
 from dbterd.core.models import Column, Ref, Table
 from tests.unit.adapters.algos import (
@@ -44,13 +43,13 @@ class TestResolveToNodeId:
             ("db.other.customers", "model.other_pkg.customers"),
             ("db.nonexistent.table", None),
             ("", None),
-            # An unrendered ref(...) is delegated to _resolve_ref_to_node_id (covered
+            # An unrendered ref(...) is delegated to resolve_ref (covered
             # exhaustively in test_resolve_ref_to_node_id); one case proves the fallback.
             ("ref('orders')", "model.pkg.orders"),
         ],
     )
     def test_resolve_to_node_id(self, to_str, expected):
-        result = _resolve_to_node_id(to_str, self.NODES)
+        result = NodeResolver(self.NODES).resolve(to_str)
         assert result == expected
 
     @pytest.mark.parametrize(
@@ -66,7 +65,7 @@ class TestResolveToNodeId:
         ],
     )
     def test_resolve_ref_to_node_id(self, to_str, expected):
-        assert _resolve_ref_to_node_id(to_str, self.NODES) == expected
+        assert NodeResolver(self.NODES).resolve_ref(to_str) == expected
 
     def test_model_takes_priority_over_seed(self):
         """When relation_name matches both a model and another resource, model wins."""
@@ -79,7 +78,34 @@ class TestResolveToNodeId:
             "seed.pkg.raw": _Node(relation_name="db.public.raw"),
             "model.pkg.raw": _Node(relation_name="db.public.raw"),
         }
-        assert _resolve_to_node_id("db.public.raw", nodes) == "model.pkg.raw"
+        assert NodeResolver(nodes).resolve("db.public.raw") == "model.pkg.raw"
+
+
+class TestNodeResolver:
+    @dataclass
+    class _Node:
+        relation_name: str
+
+    def test_ref_with_package_prefers_that_package(self):
+        nodes = {
+            "model.pkg.customers": self._Node(relation_name="db.public.customers"),
+            "model.other_pkg.customers": self._Node(relation_name="db.other.customers"),
+        }
+        resolver = NodeResolver(nodes)
+        assert resolver.resolve("ref('other_pkg', 'customers')") == "model.other_pkg.customers"
+        assert resolver.resolve("ref('customers')") == "model.pkg.customers"
+        assert resolver.resolve("ref('unknown_pkg', 'customers')") == "model.pkg.customers"
+
+    def test_resolver_is_cached_per_manifest(self):
+        manifest = DummyManifestWithColumnLevelConstraints()
+        resolver = ModelContractAlgo().get_node_resolver(manifest=manifest)
+        # Shared by the adapter instances, like the ones `Executor.load_algo` creates for each call
+        assert ModelContractAlgo().get_node_resolver(manifest=manifest) is resolver
+
+        class _Manifest:
+            nodes: ClassVar[dict] = {}
+
+        assert ModelContractAlgo().get_node_resolver(manifest=_Manifest()) is not resolver
 
 
 class TestGetRelationshipType:
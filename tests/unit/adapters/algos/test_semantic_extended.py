@@ -1,7 +1,8 @@
 from unittest import mock
 
-from dbterd.adapters.algos.semantic import SemanticAlgo
+from dbterd.adapters.algos.semantic import SemanticAlgo, link_semantic_entities
 from dbterd.core.models import SemanticEntity
+from tests.unit.adapters.algos import DummyManifestRel
 
 
 class TestSemanticExtended:
@@ -74,3 +75,31 @@ class TestSemanticExtended:
         # Check when the node_unique_id doesn't match either model
         result = algo.find_related_nodes_by_id(manifest={}, node_unique_id="model.pkg.other_model")
         assert result == ["model.pkg.other_model"]
+
+    def test_link_semantic_entities_matches_nested_loop(self):
+        def entity(model, name, type):
+            return SemanticEntity(
+                semantic_model=f"sm_{model}",
+                model=model,
+                entity_name=name,
+                entity_type=type,
+                column_name=name,
+                relationship_type="",
+            )
+
+        foreigns = [entity("f1", "a", "foreign"), entity("f2", "b", "foreign"), entity("f3", "a", "foreign")]
+        primaries = [entity("p1", "a", "primary"), entity("p2", "c", "primary"), entity("p3", "a", "primary")]
+        expected = [(f, p) for f in foreigns for p in primaries if f.entity_name == p.entity_name]
+        assert link_semantic_entities(foreigns, primaries) == expected
+        assert link_semantic_entities([], primaries) == []
+
+    def test_linked_entities_joined_once_per_manifest(self):
+        algo = SemanticAlgo()
+        manifest = DummyManifestRel()
+        with mock.patch.object(SemanticAlgo, "get_semantic_entities", wraps=algo.get_semantic_entities) as mock_get:
+            linked = algo.get_linked_semantic_entities(manifest=manifest)
+            assert algo.get_linked_semantic_entities(manifest=manifest) == linked
+            related = algo.find_related_nodes_by_id(manifest=manifest, node_unique_id="model.dbt_resto.table1")
+            assert algo.find_related_nodes_by_id(manifest=manifest, node_unique_id="model.dbt_resto.table1") == related
+        mock_get.assert_called_once()
+        assert sorted(related) == ["model.dbt_resto.table1", "model.dbt_resto.table2", "model.dbt_resto.tablex"]
@@ -1,11 +1,19 @@
+import copy
+import gc
 from unittest import mock
 from unittest.mock import MagicMock
+import weakref
 
 import click
 import pytest
 
-from dbterd.adapters.algos.test_relationship import TestRelationshipAlgo
-from dbterd.core.models import Column, Ref, Table
+from dbterd.adapters.algos.test_relationship import (
+    AlgoRule,
+    TestRelationshipAlgo,
+    compile_algo_rule,
+    parse_to_models,
+)
+from dbterd.core.models import Column, ColumnSource, Ref, Table
 from tests.unit.adapters.algos import (
     DummyCatalogTable,
     DummyManifestError,
@@ -76,7 +84,7 @@ class TestAlgoTestRelationship:
     def test_get_tables(self, manifest, catalog, expected):
         algo = TestRelationshipAlgo()
         with mock.patch(
-            "dbterd.core.adapters.algo.BaseAlgoAdapter.get_compiled_sql",
+            "dbterd.core.adapters.algo.BaseAlgoAdapter.get_lazy_compiled_sql",
             return_value="--irrelevant--",
         ) as mock_get_compiled_sql:
             assert (
@@ -89,6 +97,81 @@ class TestAlgoTestRelationship:
             )
             mock_get_compiled_sql.assert_called()
 
+    @mock.patch("dbterd.core.adapters.algo.BaseAlgoAdapter.get_lazy_compiled_sql", return_value="--irrelevant--")
+    def test_get_tables_records_column_source(self, mock_get_compiled_sql):
+        algo = TestRelationshipAlgo()
+        tables = algo.get_tables(
+            DummyManifestTable(),
+            DummyCatalogTable(),
+            **{"entity_name_format": "resource.package.model"},
+        )
+        sources = {t.node_name: [(c.name, c.source) for c in t.columns] for t in tables}
+        assert sources["model.dbt_resto.table1"] == [("name1", ColumnSource.CATALOG)]
+        assert sources["model.dbt_resto.table2"] == [
+            ("name3", ColumnSource.BOTH),
+            ("name2", ColumnSource.MANIFEST),
+        ]
+        assert sources["model.dbt_resto.table_dummy_columns"] == [("unknown", None)]
+
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            ({"select": ["exact:model.dbt_resto.table2"]}, ["model.dbt_resto.table2"]),
+            ({"select": ["schema:--schema--"], "resource_type": ["source"]}, ["source.dummy.source_table"]),
+            ({"exclude": ["model.dbt_resto.table"], "resource_type": []}, ["source.dummy.source_table"]),
+        ],
+    )
+    @mock.patch("dbterd.core.adapters.algo.BaseAlgoAdapter.get_lazy_compiled_sql", return_value="--irrelevant--")
+    def test_get_tables_builds_selected_only(self, mock_get_compiled_sql, kwargs, expected):
+        algo = TestRelationshipAlgo()
+        kwargs = {"entity_name_format": "resource.package.model", **kwargs}
+        all_tables = algo.get_tables(
+            DummyManifestTable(), DummyCatalogTable(), entity_name_format="resource.package.model", resource_type=[]
+        )
+        with mock.patch.object(TestRelationshipAlgo, "get_table", wraps=algo.get_table) as mock_get_table:
+            tables = algo.get_tables(DummyManifestTable(), DummyCatalogTable(), **kwargs)
+
+        assert [t.node_name for t in tables] == expected
+        assert tables == algo.filter_tables_based_on_selection(tables=all_tables, **kwargs)
+        assert [c.kwargs["node_name"] for c in mock_get_table.call_args_list] == expected
+
+    def test_get_tables_resolves_compiled_sql_lazily(self):
+        algo = TestRelationshipAlgo()
+        resolver = mock.Mock(return_value="--compiled--")
+        with mock.patch.object(TestRelationshipAlgo, "get_lazy_compiled_sql", return_value=resolver):
+            tables = algo.get_tables(
+                DummyManifestTable(), DummyCatalogTable(), entity_name_format="resource.package.model", resource_type=[]
+            )
+        relationships = [Ref(name="r", table_map=(tables[0].name, tables[1].name), column_map=(["new"], ["name3"]))]
+        tables = algo.enrich_tables_from_relationships(tables=tables, relationships=relationships)
+        assert repr(tables[0])
+        assert tables[0] == copy.copy(tables[0])
+        resolver.assert_not_called()
+
+        assert tables[0].raw_sql == "--compiled--"
+        resolver.assert_called_once_with()
+
+    def test_get_lazy_compiled_sql_holds_no_node(self):
+        algo = TestRelationshipAlgo()
+        node = DummyManifestHasColumns()
+        expected = algo.get_compiled_sql(node)
+        lazy_sql = algo.get_lazy_compiled_sql(node)
+        assert callable(lazy_sql)
+
+        node_ref = weakref.ref(node)
+        del node
+        gc.collect()
+        assert node_ref() is None
+        assert lazy_sql() == expected
+        assert algo.get_lazy_compiled_sql(DummyManifestV7()) == "compiled_code"
+
+    def test_get_lazy_compiled_sql_overridden(self):
+        class CustomAlgo(TestRelationshipAlgo):
+            def get_compiled_sql(self, manifest_node):
+                return "--custom--"
+
+        assert CustomAlgo().get_lazy_compiled_sql(DummyManifestHasColumns()) == "--custom--"
+
     @pytest.mark.parametrize(
         "manifest, expected",
         [
@@ -735,12 +818,64 @@ class TestAlgoTestRelationship:
         with pytest.raises(click.BadParameter):
             algo.get_relationships_from_metadata(data=data, **kwargs)
 
+    def test_compile_algo_rule(self):
+        rule = compile_algo_rule("test_relationship:(name:Foreign_Key|c_from:fk_column_name|t_to:pk_table_name)")
+        assert rule is compile_algo_rule(
+            "test_relationship:(name:Foreign_Key|c_from:fk_column_name|t_to:pk_table_name)"
+        )
+        assert rule == AlgoRule(
+            rules=(("name", "Foreign_Key"), ("c_from", "fk_column_name"), ("t_to", "pk_table_name")),
+            name="foreign_key",
+            c_from="fk_column_name",
+            t_to="pk_table_name",
+        )
+        assert compile_algo_rule(None) == compile_algo_rule("test_relationship")
+        assert compile_algo_rule(None).t_to == "to"
+
+    @pytest.mark.parametrize(
+        "test_kwargs, expected",
+        [
+            ({"to": "ref('Table2')"}, True),
+            ({"to": 'ref("table2")'}, True),
+            ({"to": "ref('table21')"}, False),
+            ({"to": "ref('other_table2')"}, False),
+            ({"to": "source('src', 'table2')"}, False),
+            ({"to": '{{ ref("TABLE2") }}'}, True),
+            ({"to": None}, False),
+            ({}, False),
+        ],
+    )
+    def test_algo_rule_points_to(self, test_kwargs, expected):
+        assert compile_algo_rule(None).points_to(test_kwargs, "model.dbt_resto.table2") is expected
+
+    def test_algo_rule_to_models(self):
+        rule = compile_algo_rule("test_relationship:(name:foreign_key|t_to:pk_table_name)")
+        assert rule.to_models({"pk_table_name": "ref('Orders')"}) == {"orders"}
+        assert rule.to_models({"pk_table_name": "source('src', 'orders')"}) == set()
+        assert rule.to_models({"to": "ref('orders')"}) == set()
+        assert parse_to_models("ref('Orders')") is parse_to_models("ref('Orders')")
+
     def test_find_related_nodes_by_id_not_supported_type(self):
         algo = TestRelationshipAlgo()
         assert algo.find_related_nodes_by_id(manifest="irrelevant", type="metadata", node_unique_id="model.p.abc") == [
             "model.p.abc"
         ]
 
+    def test_get_test_index_built_once_per_manifest(self):
+        algo = TestRelationshipAlgo()
+        manifest = DummyManifestRel()
+        with mock.patch.object(TestRelationshipAlgo, "build_test_index", wraps=algo.build_test_index) as mock_build:
+            index = algo.get_test_index(manifest=manifest, rule_name="relationship")
+            assert algo.get_test_index(manifest=manifest, rule_name="relationship") is index
+            assert algo.find_related_nodes_by_id(manifest=manifest, node_unique_id="model.dbt_resto.tablex")
+            algo.get_test_index(manifest=manifest, rule_name="foreign_key")
+            algo.get_test_index(manifest=DummyManifestRel(), rule_name="relationship")
+        assert mock_build.call_count == 3
+
+        assert "test.dbt_resto.relationships_tablex" not in index.tests  # ignored in ERD
+        assert index.graph.neighbours("model.dbt_resto.table1") == {"model.dbt_resto.table1", "model.dbt_resto.table2"}
+        assert index.graph.neighbours("model.dbt_resto.tablex") == {"model.dbt_resto.tablex", "model.dbt_resto.tabley"}
+
     def test_find_related_nodes_by_id(self):
         algo = TestRelationshipAlgo()
         assert sorted(["model.dbt_resto.table1", "model.dbt_resto.table2"]) == sorted(
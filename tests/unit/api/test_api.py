@@ -2,7 +2,7 @@ from pathlib import Path
 from unittest import mock
 
 from dbterd import default
-from dbterd.api import DbtErd
+from dbterd.api import DbtErd, DbtErdSession
 
 
 class TestDbtErd:
@@ -16,6 +16,20 @@ class TestDbtErd:
         mock_executor_run.return_value = "expected-result"
         assert DbtErd().get_model_erd(node_unique_id="any") == "expected-result"
 
+    @mock.patch("dbterd.core.executor.Executor.run")
+    def test_get_model_erd_depth(self, mock_executor_run):
+        DbtErd(depth=3).get_model_erd(node_unique_id="any")
+        assert mock_executor_run.call_args.kwargs["depth"] == 3
+        DbtErd(depth=3).get_model_erd(node_unique_id="any", depth=2)
+        assert mock_executor_run.call_args.kwargs["depth"] == 2
+
+    @mock.patch("dbterd.core.executor.Executor.run_batch")
+    def test_get_batch_erd(self, mock_executor_run_batch):
+        mock_executor_run_batch.return_value = {"orders": "expected-result"}
+        assert DbtErd().get_batch_erd(selections={"orders": ["exposure:orders"]}) == {"orders": "expected-result"}
+        assert mock_executor_run_batch.call_args.kwargs["selections"] == {"orders": ["exposure:orders"]}
+        assert mock_executor_run_batch.call_args.kwargs["per_model"] is False
+
     def test_init_default(self):
         actual = DbtErd()
         actual_dict = dict(vars(actual))
@@ -31,6 +45,32 @@ class TestDbtErd:
                 "omit_columns": False,
                 "artifacts_dir": Path.cwd(),
                 "target": default.default_target(),
+                "no_cache": default.default_no_cache(),
             }
         }
         assert actual.executor.ctx.command.name == "run"
+
+    def test_init_no_cache_from_env(self):
+        with mock.patch.dict("os.environ", {"DBTERD_NO_CACHE": "1"}):
+            assert DbtErd().params["no_cache"] is True
+            assert DbtErd(no_cache=False).params["no_cache"] is False
+
+
+class TestDbtErdSession:
+    def test_get_erd_from_memory(self, tmp_path):
+        (tmp_path / "manifest.json").write_text("{}")
+        with (
+            mock.patch("dbterd.core.executor.Executor.read_artifacts", return_value=("m", "c")) as mock_read,
+            mock.patch("dbterd.core.executor.Executor.run_artifacts", return_value="expected-result") as mock_run,
+        ):
+            session = DbtErdSession(artifacts_dir=str(tmp_path))
+            assert session.get_erd(select="exposure:orders") == "expected-result"
+            assert session.get_model_erd(node_unique_id="any", target="mermaid") == "expected-result"
+
+        mock_read.assert_called_once()
+        assert mock_run.call_args_list[0].args == ("m", "c")
+        assert mock_run.call_args_list[0].kwargs["select"] == ["exposure:orders"]
+        assert mock_run.call_args_list[1].kwargs["node_unique_id"] == "any"
+        assert mock_run.call_args_list[1].kwargs["target"] == "mermaid"
+        assert mock_run.call_args_list[1].kwargs["select"] == []
+        assert session.session.paths == [str(tmp_path / "manifest.json"), str(tmp_path / "catalog.json")]
@@ -167,6 +167,40 @@ class TestRunner:
             dbterd.invoke(["run-metadata"])
             mock_run_metadata.assert_called_once()
 
+    def test_invoke_run_model_ok(self, dbterd: DbterdRunner) -> None:
+        with mock.patch("dbterd.cli.main.Executor.run", return_value=None) as mock_run:
+            dbterd.invoke(["run", "--node-unique-id", "model.p.orders", "--depth", "2"])
+            mock_run.assert_called_once()
+            assert mock_run.call_args.kwargs["node_unique_id"] == "model.p.orders"
+            assert mock_run.call_args.kwargs["depth"] == 2
+
+    def test_invoke_run_reuse_result_ok(self, dbterd: DbterdRunner) -> None:
+        with mock.patch("dbterd.cli.main.Executor.run", return_value=None) as mock_run:
+            dbterd.invoke(["run", "--reuse-result"])
+            assert mock_run.call_args.kwargs["reuse_result"] is True
+
+    @pytest.mark.parametrize("command", ["batch", "serve", "debug", "run-metadata"])
+    def test_reuse_result_run_only(self, command, dbterd: DbterdRunner) -> None:
+        with pytest.raises(Exception) as excinfo:
+            dbterd.invoke([command, "--reuse-result"])
+        assert "No such option" in str(excinfo.value)
+
+    def test_invoke_batch_ok(self, dbterd: DbterdRunner) -> None:
+        with mock.patch("dbterd.cli.main.Executor.run_batch", return_value={}) as mock_run_batch:
+            dbterd.invoke(["batch", "-bs", "orders=exposure:orders", "-bs", "orders=schema:sales", "--per-model"])
+            mock_run_batch.assert_called_once()
+            assert mock_run_batch.call_args.kwargs["selections"] == {"orders": ["exposure:orders", "schema:sales"]}
+            assert mock_run_batch.call_args.kwargs["per_model"] is True
+            assert mock_run_batch.call_args.kwargs["workers"] == 1
+            assert mock_run_batch.call_args.kwargs["depth"] is None
+
+    def test_invoke_serve_ok(self, dbterd: DbterdRunner) -> None:
+        with mock.patch("dbterd.cli.main.serve_erd", return_value=None) as mock_serve:
+            dbterd.invoke(["serve", "--port", "8000", "--reload-interval", "0"])
+            mock_serve.assert_called_once()
+            assert mock_serve.call_args.kwargs["port"] == 8000
+            assert mock_serve.call_args.kwargs["reload_interval"] == 0
+
     def test_config_error_handling(self, dbterd: DbterdRunner) -> None:
         with (
             mock.patch("dbterd.cli.main.load_config", side_effect=ConfigError("Test config error")),
@@ -0,0 +1,92 @@
+from unittest import mock
+
+import click
+import pytest
+
+from dbterd.core import batch
+from dbterd.core.batch import BatchItem
+
+
+def _target_adapter(extension):
+    adapter = mock.Mock(file_extension=extension)
+    adapter.run.side_effect = lambda **kwargs: (kwargs["output_file_name"], ",".join(kwargs["select"]))
+    return adapter
+
+
+class TestBatch:
+    def test_parse_batch_selections(self):
+        assert batch.parse_batch_selections(None) == {}
+        assert batch.parse_batch_selections(
+            ["orders=exposure:orders", "all=", " orders = schema:sales", "eq=exact:model.p.a=b"]
+        ) == {"orders": ["exposure:orders", "schema:sales"], "all": [], "eq": ["exact:model.p.a=b"]}
+
+    @pytest.mark.parametrize("value", ["orders", "=exposure:orders", " =x"])
+    def test_parse_batch_selections_malformed(self, value):
+        with pytest.raises(click.UsageError):
+            batch.parse_batch_selections([value])
+
+    def test_batch_item_file_stem(self):
+        assert BatchItem(name="model.p.orders").file_stem == "model.p.orders"
+        assert BatchItem(name="sales / EU").file_stem == "sales_EU"
+
+    def test_build_batch_item(self):
+        algo_adapter = mock.Mock()
+        algo_adapter.parse.return_value = (["table"], ["ref"])
+        target_adapters = {"dbml": _target_adapter(".dbml"), "mermaid": _target_adapter(".md")}
+
+        actual = batch.build_batch_item(
+            BatchItem(name="orders", select=["exposure:orders"], exclude=["name:x"]),
+            "manifest",
+            "catalog",
+            algo_adapter,
+            target_adapters,
+            algo="test_relationship",
+            select=["ignored"],
+        )
+
+        assert actual == {"dbml": ("orders.dbml", "exposure:orders"), "mermaid": ("orders.md", "exposure:orders")}
+        algo_adapter.parse.assert_called_once_with(
+            manifest="manifest",
+            catalog="catalog",
+            algo="test_relationship",
+            select=["exposure:orders"],
+            exclude=["name:x"],
+        )
+        assert target_adapters["mermaid"].run.call_args.kwargs["target"] == "mermaid"
+
+    def test_iter_batch_results_in_process(self):
+        algo_adapter = mock.Mock(**{"parse.return_value": ([], [])})
+        items = [BatchItem(name="a", select=["name:a"]), BatchItem(name="b", select=["name:b"])]
+        with mock.patch("dbterd.core.batch.ProcessPoolExecutor") as mock_pool:
+            actual = list(
+                batch.iter_batch_results(
+                    items, {}, {}, algo_adapter=algo_adapter, target_adapters={"dbml": _target_adapter(".dbml")}
+                )
+            )
+        mock_pool.assert_not_called()
+        assert actual == [(items[0], {"dbml": ("a.dbml", "name:a")}), (items[1], {"dbml": ("b.dbml", "name:b")})]
+
+    def test_iter_batch_results_process_pool(self):
+        items = [BatchItem(name="a"), BatchItem(name="b"), BatchItem(name="c")]
+        with mock.patch("dbterd.core.batch.ProcessPoolExecutor") as mock_pool:
+            pool = mock_pool.return_value.__enter__.return_value
+            pool.map.return_value = iter(
+                [{"dbml": ("a.dbml", "a")}, {"dbml": ("b.dbml", "b")}, {"dbml": ("c.dbml", "c")}]
+            )
+            actual = list(
+                batch.iter_batch_results(
+                    items, {}, {}, algo_adapter=mock.Mock(), target_adapters={}, workers=8, algo="semantic"
+                )
+            )
+        assert mock_pool.call_args.kwargs["max_workers"] == 3
+        assert mock_pool.call_args.kwargs["initargs"][-1] == {"algo": "semantic"}
+        assert [item.name for item, _ in actual] == ["a", "b", "c"]
+        assert actual[2][1] == {"dbml": ("c.dbml", "c")}
+
+    def test_build_batch_item_in_worker(self):
+        algo_adapter = mock.Mock(**{"parse.return_value": ([], [])})
+        batch._init_worker({}, {}, algo_adapter, {"dbml": _target_adapter(".dbml")}, {"algo": "semantic"})
+        assert batch._build_batch_item_in_worker(BatchItem(name="a", select=["name:a"])) == {
+            "dbml": ("a.dbml", "name:a")
+        }
+        assert algo_adapter.parse.call_args.kwargs["algo"] == "semantic"
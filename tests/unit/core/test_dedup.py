@@ -0,0 +1,38 @@
+from dbterd.core.dedup import RefDeduplicator, ref_key
+from dbterd.core.models import Ref
+
+
+def _ref(name, table_map=("model.p.a", "model.p.b"), column_map=(["id"], ["a_id"])):
+    return Ref(name=name, table_map=table_map, column_map=column_map)
+
+
+class TestRefDeduplicator:
+    def test_ref_key_ignores_list_vs_tuple(self):
+        assert ref_key(_ref("r1", table_map=["model.p.a", "model.p.b"], column_map=[["id"], ["a_id"]])) == ref_key(
+            _ref("r2")
+        )
+
+    def test_ref_key_distinguishes_string_from_list(self):
+        assert ref_key(_ref("r1", column_map=("ab", "c"))) != ref_key(_ref("r2", column_map=(["a", "b"], ["c"])))
+
+    def test_keeps_first_occurrence_in_order(self):
+        refs = [
+            _ref("r1"),
+            _ref("r2", column_map=(["id"], ["other_id"])),
+            _ref("r3"),
+            _ref("r4", table_map=("model.p.c", "model.p.b")),
+            _ref("r5", column_map=(["id"], ["other_id"])),
+        ]
+        dedup = RefDeduplicator(refs=refs)
+        assert [x.name for x in dedup.refs] == ["r1", "r2", "r4"]
+        assert dedup.duplicates == 2
+        assert len(dedup) == 3
+
+    def test_add_and_contains(self):
+        dedup = RefDeduplicator()
+        assert dedup.add(_ref("r1")) is True
+        assert dedup.add(_ref("r2")) is False
+        assert _ref("r3") in dedup
+        assert _ref("r4", table_map=("model.p.x", "model.p.y")) not in dedup
+        assert dedup.extend([_ref("r5", table_map=("model.p.x", "model.p.y"))]) is dedup
+        assert dedup.duplicates == 1
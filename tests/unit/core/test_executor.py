@@ -102,7 +102,7 @@ class TestBase:
             mock_default_manifest_version.assert_called_once_with(artifacts_dir=Path.cwd())
         else:
             assert mock_default_manifest_version.call_count == 0
-        mock_read_manifest.assert_called_once_with(path=Path.cwd(), version=expected_version, policies=None)
+        mock_read_manifest.assert_called_once_with(path=Path.cwd(), version=expected_version, policies=None, cache=None)
 
     @pytest.mark.parametrize(
         "cv, default_version_return, expected_version, should_call_default",
@@ -125,7 +125,7 @@ class TestBase:
             mock_default_catalog_version.assert_called_once_with(artifacts_dir=Path.cwd())
         else:
             assert mock_default_catalog_version.call_count == 0
-        mock_read_catalog.assert_called_once_with(path=Path.cwd(), version=expected_version, policies=None)
+        mock_read_catalog.assert_called_once_with(path=Path.cwd(), version=expected_version, policies=None, cache=None)
 
     @mock.patch("dbterd.core.executor.DbtInvocation.get_selection", return_value="dummy")
     def test__get_selection(self, mock_dbt_invocation, dummy_executor):
@@ -277,15 +277,15 @@ class TestBase:
         result = dummy_executor._set_single_node_selection(manifest="irrelevant", node_unique_id=None, **{"i": "irr"})
         assert result == {"i": "irr"}
 
-    @mock.patch("dbterd.adapters.algos.test_relationship.TestRelationshipAlgo.find_related_nodes_by_id")
-    def test__set_single_node_selection(self, mock_find_related_nodes_by_id, dummy_executor):
-        mock_find_related_nodes_by_id.return_value = ["irr"]
+    @mock.patch("dbterd.core.executor.Executor._get_relationship_graph")
+    def test__set_single_node_selection(self, mock_get_relationship_graph, dummy_executor):
+        mock_get_relationship_graph.return_value.neighbourhood.return_value = ["irr"]
         assert dummy_executor._set_single_node_selection(
             manifest="irrelevant",
             node_unique_id="irrelevant",
             **{"algo": "test_relationship"},
         ) == {"algo": "test_relationship", "select": ["irr"], "exclude": []}
-        assert mock_find_related_nodes_by_id.call_count == 1
+        mock_get_relationship_graph.return_value.neighbourhood.assert_called_once_with("irrelevant", depth=1)
 
     @mock.patch("dbterd.core.executor.Executor.load_algo")
     @mock.patch("dbterd.core.executor.Executor.load_target")
@@ -326,10 +326,10 @@ class TestBase:
             "i": "irr"
         }
         assert mock_parent.mock_calls == [
-            mock.call.mock_read_manifest(mp=None, mv=None, policies=None),
-            mock.call.mock_read_catalog(cp=None, cv=None, policies=None),
+            mock.call.mock_read_manifest(mp=None, mv=None, policies=None, cache=mock.ANY),
+            mock.call.mock_read_catalog(cp=None, cv=None, policies=None, cache=mock.ANY),
             mock.call.mock_set_single_node_selection(
-                manifest={}, node_unique_id="irr", algo="test_relationship", target="dbml"
+                manifest={}, node_unique_id="irr", catalog={}, algo="test_relationship", target="dbml"
             ),
             mock.call.mock_load_algo(name="test_relationship"),
             mock.call.mock_load_target(name="dbml"),
@@ -1,7 +1,13 @@
+import os
+from unittest import mock
+
 import click
 import pytest
 
+from dbterd.core.adapters.algo import BaseAlgoAdapter
 from dbterd.core.executor import Executor
+from dbterd.core.models import Ref, Table
+from dbterd.helpers.artifact_cache import ArtifactCache
 
 
 class TestBaseExtended:
@@ -25,3 +31,260 @@ class TestBaseExtended:
         with pytest.raises(click.UsageError) as excinfo:
             worker._check_if_any_unsupported_selection(select=["invalid:test"], exclude=[])
         assert "Unsupported Selection found: invalid" in str(excinfo.value)
+
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            ({"algo": "test_relationship"}, {}),
+            ({"algo": "test_relationship", "manifest_projection": False}, {}),
+            (
+                {"algo": "test_relationship:(name:relationship|c_to:field)", "manifest_projection": True},
+                {
+                    "sections": ("nodes", "sources", "exposures"),
+                    "node_types": ("model", "seed", "snapshot", "test"),
+                },
+            ),
+            (
+                {"algo": "semantic", "manifest_projection": True},
+                {
+                    "sections": ("nodes", "sources", "exposures", "semantic_models"),
+                    "node_types": ("model", "seed", "snapshot"),
+                },
+            ),
+        ],
+    )
+    def test_get_manifest_projection(self, kwargs, expected):
+        worker = Executor(ctx=click.Context(command=click.Command("run")))
+        assert worker._get_manifest_projection(**kwargs) == expected
+
+    def test_get_manifest_projection_undeclared_algo(self):
+        class _UndeclaredAlgo(BaseAlgoAdapter):
+            def parse_artifacts(self, manifest, catalog, **kwargs):
+                return [], []
+
+            def parse_metadata(self, data, **kwargs):
+                return [], []
+
+        worker = Executor(ctx=click.Context(command=click.Command("run")))
+        with mock.patch("dbterd.core.executor.PluginRegistry.get_algo", return_value=_UndeclaredAlgo):
+            assert worker._get_manifest_projection(algo="undeclared", manifest_projection=True) == {}
+
+    def test_get_artifact_cache(self):
+        worker = Executor(ctx=click.Context(command=click.Command("run")))
+        assert worker._get_artifact_cache(no_cache=True) is None
+        assert isinstance(worker._get_artifact_cache(no_cache=False), ArtifactCache)
+        assert isinstance(worker._get_artifact_cache(), ArtifactCache)
+        with mock.patch.dict(os.environ, {"DBTERD_NO_CACHE": "1"}):
+            assert worker._get_artifact_cache() is None
+            assert isinstance(worker._get_artifact_cache(no_cache=False), ArtifactCache)
+
+    def test_run_by_strategy_reuse_result(self, tmp_path):
+        (tmp_path / "manifest.json").write_text("{}")
+        (tmp_path / "catalog.json").write_text("{}")
+        kwargs = {
+            "artifacts_dir": str(tmp_path),
+            "output": str(tmp_path),
+            "algo": "test_relationship",
+            "target": "dbml",
+            "reuse_result": True,
+        }
+        worker = Executor(ctx=click.Context(command=click.Command("run")))
+        target_adapter = mock.Mock()
+        target_adapter.run.return_value = ("output.dbml", "erd")
+        with (
+            mock.patch.object(Executor, "_read_manifest", return_value={}) as mock_read_manifest,
+            mock.patch.object(Executor, "_read_catalog", return_value={}),
+            mock.patch.object(Executor, "load_algo") as mock_load_algo,
+            mock.patch.object(Executor, "load_target", return_value=target_adapter),
+        ):
+            mock_load_algo.return_value.parse.return_value = ([], [])
+            assert worker._run_by_strategy(**kwargs) == "erd"
+            assert worker._run_by_strategy(**kwargs) == "erd"
+            assert mock_read_manifest.call_count == 1
+            assert target_adapter.run.call_count == 1
+
+            (tmp_path / "catalog.json").write_text('{"nodes": {}}')
+            assert worker._run_by_strategy(**kwargs) == "erd"
+            assert mock_read_manifest.call_count == 2
+
+            assert worker._run_by_strategy(**{**kwargs, "reuse_result": False}) == "erd"
+            assert mock_read_manifest.call_count == 3
+
+        assert (tmp_path / "output.dbml").read_text() == "erd"
+
+    def test_get_targets(self):
+        assert Executor._get_targets(target="dbml") == ["dbml"]
+        assert Executor._get_targets(target="dbml, mermaid,dbml,json") == ["dbml", "mermaid", "json"]
+        assert Executor._get_targets(target=["d2", "dbml"]) == ["d2", "dbml"]
+        assert Executor._get_targets(target="dbml,mermaid", output_file_name=None) == ["dbml", "mermaid"]
+        with pytest.raises(click.UsageError):
+            Executor._get_targets(target="dbml,mermaid", output_file_name="erd.txt")
+
+    def test_run_by_strategy_multiple_targets(self, tmp_path):
+        kwargs = {
+            "artifacts_dir": str(tmp_path),
+            "output": str(tmp_path),
+            "algo": "test_relationship",
+            "target": "dbml,mermaid",
+        }
+        worker = Executor(ctx=click.Context(command=click.Command("run")))
+        target_adapters = {
+            "dbml": mock.Mock(**{"run.return_value": ("output.dbml", "dbml erd")}),
+            "mermaid": mock.Mock(**{"run.return_value": ("output.md", "mermaid erd")}),
+        }
+        with (
+            mock.patch.object(Executor, "_read_manifest", return_value={}),
+            mock.patch.object(Executor, "_read_catalog", return_value={}),
+            mock.patch.object(Executor, "load_algo") as mock_load_algo,
+            mock.patch.object(Executor, "load_target", side_effect=lambda name: target_adapters[name]),
+        ):
+            mock_load_algo.return_value.parse.return_value = ([], [])
+            assert worker._run_by_strategy(**kwargs) == {"dbml": "dbml erd", "mermaid": "mermaid erd"}
+            mock_load_algo.return_value.parse.assert_called_once()
+
+        target_adapters["mermaid"].run.assert_called_once_with(
+            tables=[], relationships=[], manifest={}, **{**kwargs, "target": "mermaid"}
+        )
+        assert (tmp_path / "output.dbml").read_text() == "dbml erd"
+        assert (tmp_path / "output.md").read_text() == "mermaid erd"
+
+    def test_run_batch_by_strategy(self, tmp_path):
+        kwargs = {
+            "artifacts_dir": str(tmp_path),
+            "output": str(tmp_path),
+            "algo": "test_relationship",
+            "target": "dbml",
+            "exclude": ["name:x"],
+            "per_model": True,
+        }
+        worker = Executor(ctx=click.Context(command=click.Command("batch")))
+        target_adapter = mock.Mock(file_extension=".dbml")
+        target_adapter.run.side_effect = lambda **kw: (kw["output_file_name"], ",".join(kw["select"]))
+        with (
+            mock.patch.object(Executor, "_read_manifest", return_value={}) as mock_read_manifest,
+            mock.patch.object(Executor, "_read_catalog", return_value={}),
+            mock.patch.object(Executor, "load_algo") as mock_load_algo,
+            mock.patch.object(Executor, "load_target", return_value=target_adapter),
+            mock.patch.object(Executor, "_get_relationship_graph") as mock_get_relationship_graph,
+        ):
+            algo_adapter = mock_load_algo.return_value
+            algo_adapter.parse.return_value = (
+                [mock.Mock(node_name="model.p.a", resource_type="model"), mock.Mock(resource_type="source")],
+                [],
+            )
+            mock_get_relationship_graph.return_value.neighbourhood.return_value = ["model.p.a", "model.p.b"]
+            actual = worker._run_batch_by_strategy(selections={"orders": ["exposure:orders"]}, **kwargs)
+            mock_read_manifest.assert_called_once()
+
+        assert actual == {"orders": "exposure:orders", "model.p.a": "model.p.a,model.p.b"}
+        assert algo_adapter.parse.call_args_list[-1].kwargs["exclude"] == []
+        assert algo_adapter.parse.call_args_list[-2].kwargs["exclude"] == ["name:x"]
+        assert (tmp_path / "orders.dbml").read_text() == "exposure:orders"
+        assert (tmp_path / "model.p.a.dbml").read_text() == "model.p.a,model.p.b"
+
+    @pytest.mark.parametrize(
+        "selections, kwargs",
+        [
+            ({}, {}),
+            ({"orders": ["exposure:orders"]}, {"output_file_name": "erd.dbml"}),
+            ({"orders": ["invalid:orders"]}, {}),
+        ],
+    )
+    def test_run_batch_by_strategy_usage_error(self, selections, kwargs):
+        worker = Executor(ctx=click.Context(command=click.Command("batch")))
+        with pytest.raises(click.UsageError):
+            worker._run_batch_by_strategy(selections=selections, target="dbml", **kwargs)
+
+    def test_run_artifacts(self):
+        worker = Executor(ctx=click.Context(command=click.Command("run")))
+        target_adapter = mock.Mock(**{"run.return_value": ("output.dbml", "erd")})
+        with (
+            mock.patch.object(Executor, "load_algo") as mock_load_algo,
+            mock.patch.object(Executor, "load_target", return_value=target_adapter),
+            mock.patch.object(Executor, "_save_result") as mock_save_result,
+        ):
+            mock_load_algo.return_value.parse.return_value = ([], [])
+            mock_load_algo.return_value.find_related_nodes_by_id.return_value = ["model.p.a"]
+            actual = worker.run_artifacts(
+                "manifest", "catalog", node_unique_id="model.p.a", algo="test_relationship", target="dbml", api=True
+            )
+            with pytest.raises(click.UsageError):
+                worker.run_artifacts("manifest", "catalog", select=["invalid:x"], target="dbml")
+
+        assert actual == "erd"
+        mock_save_result.assert_not_called()
+        assert mock_load_algo.return_value.parse.call_args.kwargs["select"] == ["model.p.a"]
+
+    @pytest.mark.parametrize(
+        "type, depth, expected",
+        [(None, None, 1), ("metadata", None, 0), (None, 0, 0), ("metadata", 1, 1), (None, "2", 2)],
+    )
+    def test_get_depth(self, type, depth, expected):
+        assert Executor._get_depth(type=type, depth=depth) == expected
+
+    @pytest.mark.parametrize("depth", [-1, "x"])
+    def test_get_depth_usage_error(self, depth):
+        with pytest.raises(click.UsageError):
+            Executor._get_depth(depth=depth)
+
+    def test_get_related_nodes_depth_zero_parses_nothing(self):
+        worker = Executor(ctx=click.Context(command=click.Command("run")))
+        algo_adapter = mock.Mock()
+        for type, catalog in [(None, {}), ("metadata", "metadata")]:
+            assert worker._get_related_nodes(
+                algo_adapter, manifest=[{}], catalog=catalog, node_unique_id="model.p.a", type=type, depth=0
+            ) == ["model.p.a"]
+        algo_adapter.parse.assert_not_called()
+
+    def test_set_single_node_selection_metadata_default_depth(self):
+        worker = Executor(ctx=click.Context(command=click.Command("run_metadata")))
+        tables = [Table(name=name, node_name=f"model.p.{name}", database="db", schema="s") for name in "abc"]
+        relationships = [Ref(name="r", table_map=("a", "b"), column_map=(["id"], ["a_id"]))]
+        with mock.patch.object(Executor, "load_algo") as mock_load_algo:
+            algo_adapter = mock_load_algo.return_value
+            algo_adapter.parse.return_value = (tables, relationships)
+            kwargs = worker._set_single_node_selection(
+                [{}], "model.p.a", type="metadata", catalog="metadata", algo="x", depth=None
+            )
+            assert kwargs["select"] == ["model.p.a"]
+            algo_adapter.parse.assert_not_called()
+
+            kwargs = worker._set_single_node_selection(
+                [{}], "model.p.a", type="metadata", catalog="metadata", algo="x", depth=1
+            )
+            assert kwargs["select"] == ["model.p.a", "model.p.b"]
+
+    def test_set_single_node_selection_depth(self):
+        class Manifest:
+            pass
+
+        worker = Executor(ctx=click.Context(command=click.Command("run")))
+        manifest = Manifest()
+        tables = [Table(name=name, node_name=f"model.p.{name}", database="db", schema="s") for name in "abcd"]
+        relationships = [
+            Ref(name=f"r{idx}", table_map=(to_name, from_name), column_map=(["id"], ["id"]))
+            for idx, (to_name, from_name) in enumerate([("a", "b"), ("b", "c"), ("c", "d")])
+        ]
+        with mock.patch.object(Executor, "load_algo") as mock_load_algo:
+            algo_adapter = mock_load_algo.return_value
+            algo_adapter.parse.return_value = (tables, relationships)
+
+            kwargs = worker._set_single_node_selection(manifest, "model.p.a", algo="x", select=["y"], exclude=["z"])
+            assert (kwargs["select"], kwargs["exclude"]) == (["model.p.a", "model.p.b"], [])
+
+            for depth, expected in [
+                (1, ["model.p.a", "model.p.b"]),
+                (2, ["model.p.a", "model.p.b", "model.p.c"]),
+                (0, ["model.p.a"]),
+            ]:
+                kwargs = worker._set_single_node_selection(manifest, "model.p.a", algo="x", depth=depth)
+                assert kwargs["select"] == expected
+            algo_adapter.parse.assert_called_once()  # graph built once per manifest
+            assert algo_adapter.parse.call_args.kwargs["select"] == []
+
+            kwargs = worker._set_single_node_selection(
+                [{}], "model.p.b", type="metadata", catalog="metadata", algo="x", depth=1
+            )
+            assert sorted(kwargs["select"]) == ["model.p.a", "model.p.b", "model.p.c"]
+            assert algo_adapter.parse.call_args.kwargs["catalog"] == "metadata"
+        algo_adapter.find_related_nodes_by_id.assert_not_called()
@@ -1,3 +1,5 @@
+import pytest
+
 from dbterd.core import filter
 from dbterd.core.models import Table
 
@@ -109,3 +111,108 @@ class TestFilterExtended:
         result, rule = filter.has_unsupported_rule(rules=None)
         assert result is False
         assert rule is None
+
+
+RULES = [
+    "",
+    "model.pkg",
+    "Model.pkg.orders",
+    "model.pkg.Orders",
+    "exact:model.pkg.orders",
+    "exact:MODEL.PKG.ORDERS",
+    "exact:model.pkg.orders:ignored",
+    "exact:",
+    "schema:mart",
+    "schema:db.mart",
+    "schema:other.mart",
+    "wildcard:*orders*",
+    "wildcard:model.pkg.cust?mers",
+    "wildcard:*[!s]",
+    "exposure:dashboard",
+    "exposure:Dashboard",
+    "schema:mart,wildcard:*orders",
+    "schema:mart,exact:model.pkg.customers",
+    "name:model.pkg.o,exposure:dashboard",
+    "exact:model.pkg.orders,",
+]
+TABLES = [
+    Table(name="orders", node_name="model.pkg.orders", database="db", schema="mart", exposures=["dashboard"]),
+    Table(name="customers", node_name="model.pkg.customers", database="db", schema="mart_v2"),
+    Table(name="Orders", node_name="model.pkg.Orders", database="DB", schema="staging", exposures=["Dashboard"]),
+    Table(name="seed", node_name="seed.pkg.orders_seed", database="db", schema="seeds", resource_type="seed"),
+]
+
+
+def _reference_evaluate_rule(table, rule):
+    # Per-table rule parsing, as before the compiled selection
+    results = []
+    for part in rule.split(","):
+        rule_parts = part.lower().split(":")
+        type, value = ("name", rule_parts[0]) if len(rule_parts) == 1 else tuple(rule_parts[:2])
+        results.append(getattr(filter, f"is_satisfied_by_{type}")(table=table, rule=value))
+    return all(results)
+
+
+class TestCompiledSelection:
+    @pytest.mark.parametrize("rule", RULES)
+    def test_compiled_rules_match_reference(self, rule):
+        compiled = filter.CompiledRules([rule])
+        for table in TABLES:
+            assert compiled.matches(table) is _reference_evaluate_rule(table, rule), table.node_name
+            assert filter.evaluate_rule(table=table, rule=rule) is _reference_evaluate_rule(table, rule)
+
+    def test_compiled_rules_any_of(self):
+        compiled = filter.CompiledRules(["exact:model.pkg.none", "wildcard:*customers", "exposure:none"])
+        assert [compiled.matches(table) for table in TABLES] == [False, True, False, False]
+        assert not filter.CompiledRules([])
+        assert filter.CompiledRules([""]).match_all
+
+    def test_compiled_rules_unsupported(self):
+        with pytest.raises(AttributeError):
+            filter.CompiledRules(["dummy:rule"])
+
+    @pytest.mark.parametrize(
+        "select_rules, exclude_rules, resource_types",
+        [
+            ([], [], None),
+            (["model.pkg", "schema:seeds"], ["wildcard:*v2*"], []),
+            (["exposure:dashboard"], ["exact:model.pkg.orders"], ["model", "seed"]),
+            (["schema:mart,wildcard:*s"], [], ["model"]),
+        ],
+    )
+    def test_compile_selection(self, select_rules, exclude_rules, resource_types):
+        selection = filter.compile_selection(select_rules, exclude_rules, resource_types)
+        assert selection is filter.compile_selection(select_rules, exclude_rules, resource_types)
+        types = ["model"] if resource_types is None else resource_types
+        for table in TABLES:
+            expected = (
+                (not select_rules or any(_reference_evaluate_rule(table, rule) for rule in select_rules))
+                and (not types or table.resource_type in types)
+                and not any(_reference_evaluate_rule(table, rule) for rule in exclude_rules)
+            )
+            assert selection.is_selected(table) is expected
+            assert filter.is_selected_table(table, select_rules, exclude_rules, resource_types) is expected
+
+    def test_selects_all(self):
+        assert filter.compile_selection([], [], []).selects_all
+        assert not filter.compile_selection([], [], None).selects_all
+        assert not filter.compile_selection(["model.pkg"], [], []).selects_all
+        assert not filter.compile_selection([], ["model.pkg"], []).selects_all
+
+    def test_selectable_node(self):
+        node = filter.SelectableNode(
+            node_name="model.pkg.orders", database="db", schema="mart", resource_type="model", exposures=["dashboard"]
+        )
+        selection = filter.compile_selection(["schema:db.mart,exposure:dashboard"], [], None)
+        assert selection.is_selected(node)
+        assert not selection.is_selected(node._replace(schema="staging"))
+
+    def test_prefix_trie(self):
+        trie = filter.PrefixTrie(["model.a", "model.ab", "seed."])
+        assert trie.matches("model.a")
+        assert trie.matches("model.abc")
+        assert trie.matches("seed.x")
+        assert not trie.matches("model.")
+        assert not trie.matches("source.a")
+        assert not filter.PrefixTrie()
+        assert filter.PrefixTrie([""]).matches("anything")
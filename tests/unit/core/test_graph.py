@@ -0,0 +1,51 @@
+from dbterd.core.graph import RelationshipGraph
+from dbterd.core.models import Ref, Table
+
+
+def _table(node_name: str, name: str = "") -> Table:
+    return Table(name=name or node_name, node_name=node_name, database="db", schema="s")
+
+
+class TestRelationshipGraph:
+    def test_neighbourhood(self):
+        graph = RelationshipGraph([("a", "b"), ("b", "c"), ("c", "d"), ("x", "y")])
+        assert graph.neighbourhood("a", depth=0) == ["a"]
+        assert graph.neighbourhood("a", depth=1) == ["a", "b"]
+        assert graph.neighbourhood("a", depth=2) == ["a", "b", "c"]
+        assert graph.neighbourhood("a", depth=10) == ["a", "b", "c", "d"]
+        assert graph.neighbourhood("c", depth=1) == ["c", "b", "d"]
+        assert graph.neighbourhood("unknown", depth=2) == ["unknown"]
+
+    def test_dedup_and_degree(self):
+        graph = RelationshipGraph([("a", "b"), ("b", "a"), ("a", "b"), ("a", "a"), ("a", "c")], nodes=["z"])
+        assert len(graph) == 4
+        assert graph.edge_count == 3
+        assert list(graph.edges()) == [("a", "a"), ("a", "b"), ("a", "c")]
+        assert graph.neighbours("a") == {"a", "b", "c"}
+        assert graph.neighbours("b") == {"a"}
+        assert (graph.degree("a"), graph.degree("b"), graph.degree("z"), graph.degree("unknown")) == (3, 1, 0, 0)
+
+    def test_add_edge(self):
+        graph = RelationshipGraph(nodes=["a"])
+        graph.add_edge("a", "b")
+        graph.add_edge("b", "a")
+        assert graph.edge_count == 1
+        assert graph.neighbourhood("b") == ["b", "a"]
+
+    def test_components(self):
+        graph = RelationshipGraph([("c", "d"), ("x", "y"), ("a", "d"), ("y", "y")], nodes=["b"])
+        assert graph.components() == [["b"], ["c", "d", "a"], ["x", "y"]]
+        assert RelationshipGraph().components() == []
+
+    def test_from_parsed_maps_table_names_to_node_ids(self):
+        tables = [_table("model.p.a", "A"), _table("model.p.b", "B"), _table("model.p.c", "C")]
+        relationships = [
+            Ref(name="r1", table_map=("B", "A"), column_map=(["id"], ["b_id"])),
+            Ref(name="r2", table_map=("B", "unknown"), column_map=(["id"], ["b_id"])),
+        ]
+        graph = RelationshipGraph.from_parsed(tables, relationships)
+        assert len(graph) == 3
+        assert "model.p.c" in graph
+        assert graph.edge_count == 1
+        assert graph.neighbours("model.p.a") == {"model.p.b"}
+        assert graph.neighbours("model.p.c") == set()
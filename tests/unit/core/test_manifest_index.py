@@ -0,0 +1,47 @@
+import gc
+from unittest import mock
+
+from dbterd.core.manifest_index import ManifestIndexCache
+
+
+class DummyManifest:
+    __hash__ = None  # like the artifact models
+
+
+class TestManifestIndexCache:
+    def test_get_builds_once_per_manifest_and_key(self):
+        cache = ManifestIndexCache()
+        manifest, other = DummyManifest(), DummyManifest()
+        build = mock.Mock(side_effect=object)
+
+        index = cache.get(manifest, key="a", build=build)
+        assert cache.get(manifest, key="a", build=build) is index
+        assert cache.get(manifest, key="b", build=build) is not index
+        assert cache.get(other, key="a", build=build) is not index
+        assert build.call_count == 3
+        assert len(cache) == 2
+
+    def test_entries_dropped_with_the_manifest(self):
+        cache = ManifestIndexCache()
+        manifest = DummyManifest()
+        cache.get(manifest, key="a", build=dict)
+        assert len(cache) == 1
+
+        del manifest
+        gc.collect()
+        assert len(cache) == 0
+
+    def test_not_cached_if_not_weakly_referenceable(self):
+        cache = ManifestIndexCache()
+        build = mock.Mock(return_value={})
+        cache.get("manifest", key="a", build=build)
+        cache.get("manifest", key="a", build=build)
+        assert build.call_count == 2
+        assert len(cache) == 0
+
+    def test_clear(self):
+        cache = ManifestIndexCache()
+        manifest = DummyManifest()
+        cache.get(manifest, key="a", build=dict)
+        cache.clear()
+        assert len(cache) == 0
@@ -0,0 +1,58 @@
+import copy
+from unittest import mock
+
+from dbterd.core.models import Column, Ref, Table
+
+
+class TestTable:
+    def test_raw_sql_defaults_to_none(self):
+        assert Table(name="t", database="db", schema="s").raw_sql is None
+
+    def test_raw_sql_resolved_once_on_access(self):
+        resolver = mock.Mock(return_value="select 1")
+        table = Table(name="t", database="db", schema="s", raw_sql=resolver)
+        resolver.assert_not_called()
+
+        assert table.raw_sql == "select 1"
+        assert table.raw_sql == "select 1"
+        resolver.assert_called_once()
+
+    def test_raw_sql_not_resolved_by_eq_or_repr(self):
+        resolver = mock.Mock(return_value="select 1")
+        lazy = Table(name="t", database="db", schema="s", raw_sql=resolver)
+        assert lazy == Table(name="t", database="db", schema="s", raw_sql="select 2")
+        assert "select" not in repr(lazy)
+        resolver.assert_not_called()
+
+    def test_raw_sql_assigned(self):
+        table = Table("t", "db", "s", None, "select 1")
+        assert table.raw_sql == "select 1"
+        table.raw_sql = lambda: "select 2"
+        assert table.raw_sql == "select 2"
+
+    def test_copy_keeps_raw_sql_unresolved(self):
+        resolver = mock.Mock(return_value="select 1")
+        table = copy.copy(Table(name="t", database="db", schema="s", raw_sql=resolver))
+        resolver.assert_not_called()
+        assert table.raw_sql == "select 1"
+
+    def test_slotted(self):
+        table = Table(name="t", database="db", schema="s", raw_sql=lambda: "select 1")
+        assert not hasattr(table, "__dict__")
+        assert "_raw_sql" in Table.__slots__
+        assert copy.copy(table).raw_sql == "select 1"
+
+    def test_repeated_strings_interned(self):
+        tables = [Table(name=f"t{i}", database="".join(["d", "b"]), schema="".join(["s", "1"])) for i in range(2)]
+        assert tables[0].database is tables[1].database
+        assert tables[0].schema is tables[1].schema
+
+
+class TestColumn:
+    def test_slotted(self):
+        assert not hasattr(Column(), "__dict__")
+        assert not hasattr(Ref(name="r", table_map=("a", "b"), column_map=(["x"], ["y"])), "__dict__")
+
+    def test_data_type_interned(self):
+        assert Column(data_type="".join(["var", "char"])).data_type is Column(data_type="varchar").data_type
+        assert Column(data_type=None).data_type is None
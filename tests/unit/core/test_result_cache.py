@@ -0,0 +1,60 @@
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from dbterd.core import result_cache
+from dbterd.core.result_cache import CachedResult
+
+
+@pytest.fixture
+def artifacts(tmp_path):
+    (tmp_path / "manifest.json").write_text('{"nodes": {}}')
+    (tmp_path / "catalog.json").write_text('{"nodes": {}}')
+    return [str(tmp_path / "manifest.json"), str(tmp_path / "catalog.json")]
+
+
+class TestResultCache:
+    def test_run_fingerprint(self, artifacts):
+        fingerprint = result_cache.run_fingerprint(artifacts, target="dbml", algo="test_relationship")
+        assert fingerprint == result_cache.run_fingerprint(artifacts, algo="test_relationship", target="dbml")
+        assert fingerprint == result_cache.run_fingerprint(
+            artifacts, target="dbml", algo="test_relationship", reuse_result=True, no_cache=True
+        )
+        assert fingerprint != result_cache.run_fingerprint(artifacts, target="mermaid", algo="test_relationship")
+
+        with open(artifacts[1], "w") as f:
+            f.write('{"nodes": {"model.a": {}}}')
+        assert fingerprint != result_cache.run_fingerprint(artifacts, target="dbml", algo="test_relationship")
+
+    def test_run_fingerprint_installed_versions(self, artifacts):
+        fingerprint = result_cache.run_fingerprint(artifacts, target="dbml")
+        with mock.patch("dbterd.core.result_cache.package_version", return_value="0.0.0"):
+            assert fingerprint != result_cache.run_fingerprint(artifacts, target="dbml")
+
+    def test_installed_versions_include_plugins(self):
+        plugin = SimpleNamespace(dist=SimpleNamespace(name="dbterd-plugin"))
+        with (
+            mock.patch.object(result_cache, "_iter_plugin_entry_points", return_value=[plugin]),
+            mock.patch("dbterd.core.result_cache.package_version", side_effect=lambda name: f"{name}-1.0"),
+        ):
+            versions = result_cache.installed_versions()
+        assert "dbterd-plugin==dbterd-plugin-1.0" in versions
+        assert "dbterd==dbterd-1.0" in versions
+
+    def test_save_load_cached_result(self, tmp_path):
+        assert result_cache.load_cached_result(str(tmp_path), "dbml") is None
+
+        cached = CachedResult(fingerprint="f", result=("output.dbml", "content"))
+        result_cache.save_cached_result(str(tmp_path), "dbml", cached)
+        assert result_cache.load_cached_result(str(tmp_path), "dbml") == cached
+        assert result_cache.load_cached_result(str(tmp_path), "mermaid") is None
+        assert (tmp_path / ".dbterd_result.dbml.pickle").exists()
+
+    def test_load_cached_result_unreadable(self, tmp_path):
+        (tmp_path / ".dbterd_result.dbml.pickle").write_bytes(b"garbage")
+        assert result_cache.load_cached_result(str(tmp_path), "dbml") is None
+
+    def test_save_cached_result_failure_is_not_fatal(self, tmp_path):
+        with mock.patch("dbterd.core.result_cache.pickle.dump", side_effect=OSError("read-only")):
+            result_cache.save_cached_result(str(tmp_path), "dbml", CachedResult(fingerprint="f", result=("a", "b")))
@@ -0,0 +1,144 @@
+from concurrent.futures import ThreadPoolExecutor
+import json
+import shutil
+import threading
+from unittest import mock
+import urllib.error
+import urllib.request
+
+import click
+import pytest
+
+from dbterd.core.executor import Executor
+from dbterd.core.server import ErdResponse, ErdResponseCache, ErdServer
+
+
+SAMPLE_DIR = "samples/jaffle-shop"
+
+
+def _start_server(tmp_path):
+    for artifact in ("manifest.json", "catalog.json"):
+        shutil.copy(f"{SAMPLE_DIR}/{artifact}", tmp_path)
+    executor = Executor(ctx=click.Context(command=click.Command("serve")))
+    params = executor.evaluate_kwargs(
+        artifacts_dir=str(tmp_path),
+        select=[],
+        exclude=[],
+        resource_type=["model"],
+        algo="test_relationship",
+        entity_name_format="resource.package.model",
+        target="dbml",
+        no_cache=True,
+    )
+    server = ErdServer(executor, params, address=("127.0.0.1", 0), reload_interval=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture(scope="module")
+def server(tmp_path_factory):
+    server = _start_server(tmp_path_factory.mktemp("artifacts"))
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def reloading_server(tmp_path):
+    server = _start_server(tmp_path)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _get(server, path, headers=None):
+    request = urllib.request.Request(f"http://127.0.0.1:{server.server_port}{path}", headers=headers or {})
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, dict(response.headers), response.read().decode()
+    except urllib.error.HTTPError as e:
+        return e.code, dict(e.headers), e.read().decode()
+
+
+class TestErdServer:
+    def test_get_erd(self, server):
+        status, headers, body = _get(server, "/erd?target=mermaid&select=exact:model.jaffle_shop.orders")
+        assert status == 200
+        assert headers["Content-Type"] == "text/markdown; charset=utf-8"
+        assert body.startswith("erDiagram")
+        assert "ORDERS" in body
+        assert "CUSTOMERS" not in body
+
+    def test_get_model_erd(self, server):
+        status, headers, body = _get(server, "/model/model.jaffle_shop.orders")
+        assert status == 200
+        assert headers["Content-Type"] == "text/plain; charset=utf-8"
+        assert 'Table "model.jaffle_shop.orders"' in body
+
+    def test_get_model_erd_depth(self, server):
+        status, _, body = _get(server, "/model/model.jaffle_shop.orders?depth=0")
+        assert status == 200
+        assert body.count("Table ") == 1
+
+    def test_get_multiple_targets(self, server):
+        status, headers, body = _get(server, "/erd?target=dbml,json")
+        assert status == 200
+        assert headers["Content-Type"] == "application/json"
+        assert sorted(json.loads(body)) == ["dbml", "json"]
+
+    def test_etag(self, server):
+        with mock.patch.object(Executor, "run_artifacts", wraps=server.executor.run_artifacts) as mock_run:
+            _, headers, body = _get(server, "/erd")
+            assert _get(server, "/erd")[2] == body
+            status, _, not_modified = _get(server, "/erd", headers={"If-None-Match": headers["ETag"]})
+            assert mock_run.call_count == 1
+        assert (status, not_modified) == (304, "")
+        assert _get(server, "/erd?target=d2")[1]["ETag"] != headers["ETag"]
+
+    @pytest.mark.parametrize(
+        "path, expected_status",
+        [
+            ("/unknown", 404),
+            ("/model/model.jaffle_shop.unknown", 404),
+            ("/erd?target=unknown", 400),
+            ("/erd?select=unknown:x", 400),
+            ("/model/model.jaffle_shop.orders?depth=x", 400),
+            ("/model/model.jaffle_shop.orders?depth=-1", 400),
+        ],
+    )
+    def test_errors(self, server, path, expected_status):
+        assert _get(server, path)[0] == expected_status
+
+    def test_reload(self, reloading_server):
+        server = reloading_server
+        etag = _get(server, "/erd")[1]["ETag"]
+        manifest_path = server.session.paths[0]
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        manifest["nodes"].pop("model.jaffle_shop.orders")
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f)
+
+        assert _get(server, "/erd")[1]["ETag"] == etag  # served from the previous artifacts until reloaded
+        server.session.current()
+        _, headers, body = _get(server, "/erd")
+        assert headers["ETag"] != etag
+        assert 'Table "model.jaffle_shop.orders"' not in body
+
+    def test_concurrent_requests(self, server):
+        paths = [f"/model/model.jaffle_shop.{name}" for name in ("orders", "customers", "products", "locations")] * 5
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda path: _get(server, path), paths))
+        assert {status for status, _, _ in results} == {200}
+        assert results[0][2] == results[4][2]
+
+
+class TestErdResponseCache:
+    def test_lru(self):
+        cache = ErdResponseCache(max_entries=2)
+        for etag in ("a", "b"):
+            cache.put(ErdResponse(status=200, body=etag.encode(), etag=etag))
+        assert cache.get("a").body == b"a"
+        cache.put(ErdResponse(status=200, body=b"c", etag="c"))
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
@@ -0,0 +1,75 @@
+import os
+from unittest import mock
+
+import pytest
+
+from dbterd.core.session import ArtifactSession
+
+
+@pytest.fixture
+def paths(tmp_path):
+    (tmp_path / "manifest.json").write_text('{"nodes": {}}')
+    (tmp_path / "catalog.json").write_text('{"nodes": {}}')
+    return [str(tmp_path / "manifest.json"), str(tmp_path / "catalog.json")]
+
+
+@pytest.fixture
+def loader():
+    return mock.Mock(side_effect=lambda: (mock.Mock(), mock.Mock()))
+
+
+class TestArtifactSession:
+    def test_current_loads_once(self, paths, loader):
+        session = ArtifactSession(loader=loader, paths=paths)
+        loader.assert_not_called()
+
+        snapshot = session.current()
+        assert session.current() is snapshot
+        assert snapshot.version == 1
+        loader.assert_called_once()
+
+    def test_current_touched_file_is_not_reloaded(self, paths, loader):
+        session = ArtifactSession(loader=loader, paths=paths)
+        snapshot = session.current()
+
+        os.utime(paths[0], ns=(0, 0))
+        touched = session.current()
+        assert (touched.manifest, touched.version) == (snapshot.manifest, 1)
+        assert touched.stats != snapshot.stats
+        loader.assert_called_once()
+
+    def test_current_changed_file_is_reloaded(self, paths, loader):
+        session = ArtifactSession(loader=loader, paths=paths)
+        snapshot = session.current()
+
+        with open(paths[1], "w") as f:
+            f.write('{"nodes": {"model.a": {}}}')
+        reloaded = session.current()
+        assert reloaded.manifest is not snapshot.manifest
+        assert reloaded.version == 2
+        assert loader.call_count == 2
+
+    def test_current_failed_reload_keeps_snapshot(self, paths, loader):
+        session = ArtifactSession(loader=loader, paths=paths)
+        snapshot = session.current()
+
+        os.remove(paths[0])
+        loader.side_effect = FileNotFoundError("manifest.json")
+        with pytest.raises(FileNotFoundError):
+            session.current()
+        assert session._snapshot is snapshot
+
+    def test_reload(self, paths, loader):
+        session = ArtifactSession(loader=loader, paths=paths)
+        session.current()
+        assert session.reload().version == 2
+        assert loader.call_count == 2
+
+    def test_latest_skips_the_check(self, paths, loader):
+        session = ArtifactSession(loader=loader, paths=paths)
+        snapshot = session.latest()
+        with open(paths[0], "w") as f:
+            f.write('{"nodes": {"model.a": {}}}')
+        assert session.latest() is snapshot
+        assert session.current() is not snapshot
+        assert loader.call_count == 2
@@ -0,0 +1,132 @@
+import os
+from pathlib import Path
+import threading
+from unittest import mock
+
+import pytest
+
+from dbterd.helpers import artifact_cache
+from dbterd.helpers.artifact_cache import ArtifactCache
+
+
+@pytest.fixture
+def artifact(tmp_path) -> str:
+    path = tmp_path / "manifest.json"
+    path.write_text('{"metadata": {}}')
+    return str(path)
+
+
+@pytest.fixture
+def cache(tmp_path) -> ArtifactCache:
+    return ArtifactCache(cache_dir=str(tmp_path / "cache"))
+
+
+class TestArtifactCache:
+    def test_default_cache_dir(self):
+        with mock.patch.dict(os.environ, {"DBTERD_CACHE_DIR": "/tmp/dbterd-cache"}):
+            assert artifact_cache.default_cache_dir() == Path("/tmp/dbterd-cache")
+        with mock.patch.dict(os.environ, {"DBTERD_CACHE_DIR": "", "XDG_CACHE_HOME": "/tmp/xdg"}):
+            assert artifact_cache.default_cache_dir() == Path("/tmp/xdg/dbterd")
+
+    def test_file_digest(self, artifact, tmp_path):
+        empty = tmp_path / "empty.json"
+        empty.write_bytes(b"")
+        assert artifact_cache.file_digest(artifact) != artifact_cache.file_digest(str(empty))
+        assert artifact_cache.file_digest(str(empty)) == (
+            "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+        )
+
+    def test_make_key(self, cache, artifact):
+        key = cache.make_key(artifact, artifact="manifest", version=12)
+        assert key == cache.make_key(artifact, artifact="manifest", version=12)
+        assert key != cache.make_key(artifact, artifact="manifest", version=11)
+        assert key != cache.make_key(artifact, artifact="catalog", version=12)
+        assert key != cache.make_key(artifact, artifact="manifest", version=12, policies=[])
+        assert key != cache.make_key(artifact, artifact="manifest", version=12, sections=["nodes"])
+        assert cache.make_key(artifact, artifact="manifest", version=12, sections=None) != cache.make_key(
+            artifact, artifact="manifest", version=12, sections=[]
+        )
+
+        Path(artifact).write_text('{"metadata": {"changed": true}}')
+        assert key != cache.make_key(artifact, artifact="manifest", version=12)
+
+    def test_make_key_fingerprints_package_versions(self, cache, artifact):
+        key = cache.make_key(artifact, artifact="manifest")
+        with mock.patch("dbterd.helpers.artifact_cache.package_version", return_value="0.0.0"):
+            assert key != cache.make_key(artifact, artifact="manifest")
+
+    def test_package_version_unknown(self):
+        assert artifact_cache.package_version("surely-not-an-installed-package") == "unknown"
+
+    def test_get_put(self, cache):
+        assert cache.get("key") is None
+        cache.put("key", {"nodes": ["a"]})
+        assert cache.get("key") == {"nodes": ["a"]}
+        assert [path.name for path in cache.cache_dir.iterdir()] == ["key.pickle"]
+
+    def test_get_corrupted_entry(self, cache):
+        cache.cache_dir.mkdir(parents=True)
+        (cache.cache_dir / "key.pickle").write_bytes(b"not a pickle")
+        assert cache.get("key") is None
+        assert not (cache.cache_dir / "key.pickle").exists()
+
+    @pytest.mark.parametrize("error", [OSError("disk full"), TypeError("cannot pickle"), AttributeError("local")])
+    def test_put_failure_is_not_fatal(self, cache, error):
+        with mock.patch("dbterd.helpers.artifact_cache.pickle.dump", side_effect=error):
+            cache.put("key", {})
+        assert cache.get("key") is None
+        assert list(cache.cache_dir.iterdir()) == []
+
+    def test_put_unpicklable_object_is_not_fatal(self, cache):
+        cache.put("key", {"lock": threading.Lock()})
+        assert cache.get("key") is None
+
+    def test_evict_max_entries_lru(self, tmp_path):
+        cache = ArtifactCache(cache_dir=str(tmp_path), max_entries=3)
+        for idx, key in enumerate(["a", "b", "c"]):
+            cache.put(key, key)
+            os.utime(tmp_path / f"{key}.pickle", (idx, idx))
+        cache.max_entries = 2
+        cache.get("a")  # refreshes "a", so "b" is now the least recently used
+        assert cache.evict() == [tmp_path / "b.pickle"]
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["a.pickle", "c.pickle"]
+
+    def test_evict_max_bytes_keeps_latest(self, tmp_path):
+        cache = ArtifactCache(cache_dir=str(tmp_path), max_bytes=1)
+        cache.put("a", "a" * 100)
+        os.utime(tmp_path / "a.pickle", (0, 0))
+        cache.put("b", "b" * 100)
+        assert [path.name for path in tmp_path.iterdir()] == ["b.pickle"]
+
+    def test_evict_skips_entries_removed_concurrently(self, tmp_path):
+        cache = ArtifactCache(cache_dir=str(tmp_path))
+        for idx, key in enumerate(["a", "b", "c"]):
+            cache.put(key, key)
+            os.utime(tmp_path / f"{key}.pickle", (idx, idx))
+        cache.max_entries = 1
+        real_stat = Path.stat
+
+        def stat(path, *args, **kwargs):
+            if path.name == "c.pickle":  # evicted by another run between the glob and the stat
+                raise FileNotFoundError(path)
+            return real_stat(path, *args, **kwargs)
+
+        with mock.patch.object(Path, "stat", stat):
+            assert cache.evict() == [tmp_path / "a.pickle"]
+
+    def test_cache_file_errors_are_not_fatal(self, cache):
+        cache.put("key", {"nodes": ["a"]})
+        with mock.patch("dbterd.helpers.artifact_cache.os.utime", side_effect=FileNotFoundError("evicted")):
+            assert cache.get("key") == {"nodes": ["a"]}
+        with mock.patch.object(Path, "unlink", side_effect=PermissionError("read-only")):
+            assert cache.evict() == []
+            cache.max_entries = 0
+            assert cache.evict() == []
+            cache.clear()
+        assert [path.name for path in cache.cache_dir.iterdir()] == ["key.pickle"]
+
+    def test_clear(self, cache):
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.clear()
+        assert list(cache.cache_dir.iterdir()) == []
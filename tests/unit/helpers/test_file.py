@@ -1,5 +1,7 @@
 import contextlib
 from enum import Enum
+from pathlib import Path
+import tracemalloc
 import types
 from typing import Optional
 from unittest import mock
@@ -9,6 +11,10 @@ from pydantic import BaseModel, ConfigDict, ValidationError as PydanticValidatio
 import pytest
 
 from dbterd.helpers import file
+from dbterd.helpers.artifact_cache import ArtifactCache
+
+
+SAMPLE_DIR = str(Path(__file__).parent.parent.parent.parent / "samples" / "jaffle-shop")
 
 
 @contextlib.contextmanager
@@ -82,6 +88,34 @@ class TestFile:
     def test_extract_artifact_version_from_file(self, schema_version, expected):
         assert file.extract_artifact_version_from_file(schema_version) == expected
 
+    def test_sniff_artifact_version_from_head(self, tmp_path):
+        artifact = tmp_path / "manifest.json"
+        artifact.write_text(
+            '{"metadata": {"dbt_schema_version": "https://schemas.getdbt.com/dbt/manifest/v12.json"}, "nodes": {}}'
+        )
+        assert file.sniff_artifact_version(artifact) == "12"
+
+    def test_sniff_artifact_version_incremental_scan(self, tmp_path):
+        artifact = tmp_path / "manifest.json"
+        artifact.write_text(
+            '{"nodes": {"a": {"description": "' + "x" * 5000 + '"}}, '
+            '"metadata": {"dbt_schema_version": "https://schemas.getdbt.com/dbt/manifest/v11.json"}}'
+        )
+        assert file.sniff_artifact_version(artifact, head_size=64, chunk_size=100) == "11"
+
+    def test_sniff_artifact_version_ignores_escaped_key(self, tmp_path):
+        artifact = tmp_path / "manifest.json"
+        artifact.write_text(
+            '{"doc": "\\"dbt_schema_version\\": \\"v99\\"", '
+            '"metadata": {"dbt_schema_version": "https://schemas.getdbt.com/dbt/manifest/v10.json"}}'
+        )
+        assert file.sniff_artifact_version(artifact) == "10"
+
+    def test_sniff_artifact_version_not_found(self, tmp_path):
+        artifact = tmp_path / "manifest.json"
+        artifact.write_text('{"metadata": {}}')
+        assert file.sniff_artifact_version(artifact, head_size=4, chunk_size=4) is None
+
     def test_load_file_contents(self):
         with mock.patch(
             "builtins.open",
@@ -98,11 +132,80 @@ class TestFile:
             assert file.load_file_contents(path="path/to/open", strip=False) == "data with trailing space "
             mock_file.assert_called_with("path/to/open", "rb")
 
-    @mock.patch("dbterd.helpers.file.load_file_contents")
-    def test_open_json(self, mock_load_file_contents):
-        json_data = '{"data": "dummy"}'
-        mock_load_file_contents.return_value = json_data
-        assert file.open_json(file.load_file_contents(path="path/to/open")) == {"data": "dummy"}
+    def test_load_file_bytes(self):
+        with mock.patch(
+            "builtins.open",
+            mock.mock_open(read_data=str.encode(" data ", encoding="utf-8")),
+        ) as mock_file:
+            assert file.load_file_bytes(path="path/to/open") == b" data "
+        mock_file.assert_called_with("path/to/open", "rb")
+
+    @pytest.mark.parametrize("use_mmap", [True, False])
+    def test_load_json_with_report(self, tmp_path, use_mmap):
+        artifact = tmp_path / "manifest.json"
+        artifact.write_bytes(b' {"data": "dummy"}\n')
+        data, report = file.load_json_with_report(str(artifact), use_mmap=use_mmap)
+        assert data == {"data": "dummy"}
+        assert report.mapped is use_mmap
+        assert report.size == 19
+        assert report.peak_bytes == 19
+        assert not report.traced
+
+    def test_load_json_with_report_mmap_follows_codec(self, tmp_path):
+        artifact = tmp_path / "manifest.json"
+        artifact.write_bytes(b"{}")
+        with mock.patch.dict("os.environ", {"DBTERD_JSON_BACKEND": "json"}):
+            assert not file.load_json_with_report(str(artifact))[1].mapped
+
+    def test_load_json_with_report_empty_file_raises(self, tmp_path):
+        artifact = tmp_path / "manifest.json"
+        artifact.write_bytes(b"")
+        with pytest.raises(ValueError):
+            file.load_json_with_report(str(artifact), use_mmap=True)
+
+    def test_load_json_with_report_traced(self, tmp_path):
+        artifact = tmp_path / "manifest.json"
+        artifact.write_bytes(b'{"data": ["' + b"x" * 10000 + b'"]}')
+        tracemalloc.start()
+        try:
+            data, report = file.load_json_with_report(str(artifact), use_mmap=False)
+        finally:
+            tracemalloc.stop()
+        assert report.traced
+        assert report.peak_bytes >= 10000
+        assert "peak" in str(report)
+        assert len(data["data"][0]) == 10000
+
+    @pytest.mark.parametrize(
+        "mapped, traced, expected",
+        [
+            (True, False, "Read target/manifest.json (3.0 MiB, memory-mapped): raw document 3.0 MiB mapped"),
+            (False, False, "Read target/manifest.json (3.0 MiB, buffered): raw document 3.0 MiB held"),
+            (True, True, "Read target/manifest.json (3.0 MiB, memory-mapped): peak 1.0 KiB held + 3.0 MiB mapped"),
+            (False, True, "Read target/manifest.json (3.0 MiB, buffered): peak 1.0 KiB held"),
+        ],
+    )
+    def test_read_report_str(self, mapped, traced, expected):
+        size = 3 * 1024 * 1024
+        report = file.ReadReport(
+            path="target/manifest.json", size=size, mapped=mapped, peak_bytes=1024 if traced else size, traced=traced
+        )
+        assert str(report) == expected
+
+    @pytest.mark.parametrize(
+        "num, expected",
+        [(0, "0 B"), (1023, "1023 B"), (1536, "1.5 KiB"), (5 * 1024**3, "5.0 GiB"), (2 * 1024**4, "2.0 TiB")],
+    )
+    def test_format_bytes(self, num, expected):
+        assert file.format_bytes(num) == expected
+
+    def test_open_json(self, tmp_path):
+        artifact = tmp_path / "manifest.json"
+        artifact.write_bytes(b' {"data": "dummy"}\n')
+        with mock.patch("dbterd.helpers.file.logger") as mock_logger:
+            assert file.open_json(str(artifact)) == {"data": "dummy"}
+        mock_logger.debug.assert_called_once()
+        mock_logger.info.assert_not_called()
 
     def test_convert_path_length_249(self):
         path_249 = 249 * "x"
@@ -165,6 +268,63 @@ class TestFile:
             file.read_catalog(path="path/to/catalog", version=1, policies=["relax_extra_fields"])
         mock_patch.assert_called_once_with(artifact="catalog", artifact_version=1, policies=["relax_extra_fields"])
 
+    def test_project_manifest(self):
+        manifest = {
+            "metadata": {"dbt_schema_version": "v12"},
+            "nodes": {"model.p.a": {}, "test.p.t": {}, "seed.p.s": {}},
+            "sources": {"source.p.x": {}},
+            "macros": {"macro.p.m": {}},
+            "selectors": [],
+            "disabled": None,
+        }
+        result = file.project_manifest(manifest, sections=["nodes"], node_types=["model", "seed"])
+        assert result == {
+            "metadata": {"dbt_schema_version": "v12"},
+            "nodes": {"model.p.a": {}, "seed.p.s": {}},
+            "sources": {},
+            "macros": {},
+            "selectors": [],
+            "disabled": None,
+        }
+
+    @mock.patch("dbterd.helpers.file.project_manifest")
+    @mock.patch("dbterd.helpers.file.open_json")
+    def test_read_manifest_projection_is_opt_in(self, mock_open_json, mock_project_manifest):
+        mock_open_json.return_value = {"data": "dummy"}
+        with pytest.raises(ArtifactParserError):
+            file.read_manifest(path="path/to/manifest")
+        mock_project_manifest.assert_not_called()
+
+        mock_project_manifest.return_value = {"data": "dummy"}
+        with pytest.raises(ArtifactParserError):
+            file.read_manifest(path="path/to/manifest", sections=["nodes"])
+        mock_project_manifest.assert_called_once_with({"data": "dummy"}, sections=["nodes"], node_types=None)
+
+    @pytest.mark.parametrize(
+        "read_func, artifact, read_kwargs",
+        [
+            (file.read_manifest, "manifest", {"version": 12, "sections": ["nodes"], "node_types": ["model"]}),
+            (file.read_catalog, "catalog", {"version": 1}),
+        ],
+    )
+    def test_read_artifact_with_cache(self, tmp_path, read_func, artifact, read_kwargs):
+        cache = ArtifactCache(cache_dir=str(tmp_path))
+        parsed = read_func(path=SAMPLE_DIR, cache=cache, **read_kwargs)
+        assert len(list(tmp_path.iterdir())) == 1
+
+        with mock.patch("dbterd.helpers.file.open_json") as mock_open_json:
+            cached = read_func(path=SAMPLE_DIR, cache=cache, **read_kwargs)
+        mock_open_json.assert_not_called()
+        assert cached == parsed
+        assert type(cached) is type(parsed)
+
+        with (
+            mock.patch("dbterd.helpers.file.open_json", side_effect=ValueError("read")) as mock_open_json,
+            pytest.raises(ValueError),
+        ):
+            read_func(path=SAMPLE_DIR, cache=cache, **{**read_kwargs, "policies": []})
+        mock_open_json.assert_called_once_with(f"{SAMPLE_DIR}/{artifact}.json")
+
     @mock.patch("builtins.open")
     def test_write_json(self, mock_open):
         file.write_json(data={}, path="path/to/catalog/catalog.json")
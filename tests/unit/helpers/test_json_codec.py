@@ -0,0 +1,100 @@
+import json
+from unittest import mock
+
+import pytest
+
+from dbterd.core.models import Column, Ref, Table
+from dbterd.core.registry.plugin_registry import PluginRegistry
+from dbterd.helpers import json_codec
+
+
+class TestJsonCodec:
+    @pytest.mark.parametrize("backend", json_codec.available_json_backends())
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b'{"nodes": {"model.p.a": {"columns": ["id", "name"]}}, "n": 1.5, "ok": true, "no": null}',
+            '{"nodes": {"model.p.a": {"columns": ["id", "name"]}}, "n": 1.5, "ok": true, "no": null}',
+            memoryview(b'{"unicode": "caf\\u00e9 \xc3\xa9"}'),
+        ],
+    )
+    def test_loads(self, backend, data):
+        expected = json.loads(bytes(data) if isinstance(data, memoryview) else data)
+        assert json_codec.get_json_codec(backend).loads(data) == expected
+
+    @pytest.mark.parametrize("backend", json_codec.available_json_backends())
+    def test_loads_invalid_raises_value_error(self, backend):
+        with pytest.raises(ValueError):
+            json_codec.get_json_codec(backend).loads(b"not json")
+
+    @pytest.mark.parametrize("backend", json_codec.available_json_backends())
+    def test_dumps(self, backend):
+        obj = {"nodes": [{"name": "café", "n": 1.5, "ok": True, "no": None}], "edges": []}
+        assert json.loads(json_codec.get_json_codec(backend).dumps(obj)) == obj
+
+    def test_dumps_stdlib_unless_fast_encode(self):
+        obj = {"name": "café", "columns": ["id"]}
+        with mock.patch.dict("os.environ", {"DBTERD_JSON_BACKEND": json_codec.available_json_backends()[0]}):
+            with mock.patch.dict("os.environ", {json_codec.FAST_ENCODE_ENV: "false"}):
+                assert not json_codec.fast_encode_enabled()
+                assert json_codec.dumps(obj) == json.dumps(obj)
+            with mock.patch.dict("os.environ", {json_codec.FAST_ENCODE_ENV: "1"}):
+                assert json_codec.fast_encode_enabled()
+                assert json_codec.dumps(obj) == json_codec.get_json_codec().dumps(obj)
+                assert json.loads(json_codec.dumps(obj)) == obj
+
+    @pytest.mark.parametrize("target", ["json", "drawdb"])
+    def test_target_output_is_the_same_for_every_backend(self, target):
+        tables = [
+            Table(
+                name="model.p.café",
+                node_name="model.p.café",
+                database="db",
+                schema="s",
+                columns=[Column(name="id", data_type="int", description="clé", is_primary_key=True)],
+            ),
+            Table(name="model.p.b", node_name="model.p.b", database="db", schema="s", columns=[Column(name="a_id")]),
+        ]
+        relationships = [Ref(name="r1", table_map=("model.p.café", "model.p.b"), column_map=(["id"], ["a_id"]))]
+        adapter = PluginRegistry.get_target(target)()
+
+        outputs = set()
+        for backend in json_codec.available_json_backends():
+            with mock.patch.dict("os.environ", {"DBTERD_JSON_BACKEND": backend, json_codec.FAST_ENCODE_ENV: ""}):
+                outputs.add(adapter.build_erd(tables, relationships))
+        assert len(outputs) == 1
+        output = outputs.pop()
+        assert output == json.dumps(json.loads(output)) + "\n"  # stdlib separators and ASCII escaping
+        assert "caf\\u00e9" in output
+
+    @pytest.mark.parametrize("target", ["json", "drawdb"])
+    def test_target_output_fast_encode(self, target):
+        tables = [Table(name="model.p.café", node_name="model.p.café", database="db", schema="s", columns=[])]
+        adapter = PluginRegistry.get_target(target)()
+        with mock.patch.dict("os.environ", {json_codec.FAST_ENCODE_ENV: ""}):
+            expected = adapter.build_erd(tables, [])
+        for backend in json_codec.available_json_backends():
+            with mock.patch.dict("os.environ", {"DBTERD_JSON_BACKEND": backend, json_codec.FAST_ENCODE_ENV: "1"}):
+                assert json.loads(adapter.build_erd(tables, [])) == json.loads(expected)
+
+    def test_auto_picks_first_available(self):
+        with mock.patch.dict("os.environ", {}, clear=True):
+            codec = json_codec.get_json_codec()
+        assert codec.name == json_codec.available_json_backends()[0]
+        assert json_codec.available_json_backends()[-1] == "json"
+
+    def test_env_backend(self):
+        with mock.patch.dict("os.environ", {"DBTERD_JSON_BACKEND": "JSON"}):
+            assert isinstance(json_codec.get_json_codec(), json_codec.StdlibJsonCodec)
+            assert json_codec.loads(b'{"a": 1}') == {"a": 1}
+
+    def test_unknown_backend(self):
+        with pytest.raises(LookupError, match="Unknown JSON backend 'simdjson'"):
+            json_codec.get_json_codec("simdjson")
+
+    def test_backend_not_installed(self):
+        with (
+            mock.patch.object(json_codec.OrjsonCodec, "is_available", return_value=False),
+            pytest.raises(LookupError, match="pip install orjson"),
+        ):
+            json_codec.get_json_codec("orjson")